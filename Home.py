@@ -1,9 +1,6 @@
 import streamlit as st
-import json
 import sys
 from pathlib import Path
-import tempfile
-import os
 import traceback
 import importlib
 
@@ -11,10 +8,13 @@ import importlib
 sys.path.append(str(Path(__file__).parent))
 
 # Import our modules
-from utils.pdf_processor import extract_text_from_pdf_bytes
+from utils.pdf_processor import PDFRejectedError
 from utils.course_data_loader import load_comprehensive_course_data
 from utils.pdf_extractor import PDFExtractor
-from validator import CourseRegistrationValidator
+from utils.extraction_cache import extraction_cache
+from utils.validation_cache import validation_cache
+from utils.curriculum_fit import validate_against_curricula
+from validator import CourseRegistrationValidator, VALIDATOR_VERSION
 
 # Import refactored components
 from components.course_analyzer import CourseAnalyzer
@@ -97,7 +97,7 @@ def main():
         
         # Display results if processing is complete
         if session_manager.is_processing_complete():
-            _display_results(session_manager, selected_course_data)
+            _display_results(session_manager, selected_course_data, available_course_data)
     else:
         # Display welcome screen
         UIComponents.display_welcome_screen()
@@ -110,24 +110,31 @@ def _process_pdf_file(pdf_file, selected_course_data, session_manager):
     """Process uploaded PDF file."""
     with st.spinner("🔄 Processing PDF and creating advanced course analysis..."):
         try:
-            # Extract text from PDF
             pdf_bytes = pdf_file.getvalue()
-            extracted_text = extract_text_from_pdf_bytes(pdf_bytes)
+            cache_key = extraction_cache.key_for(pdf_bytes)
+            cached = extraction_cache.get(cache_key)
             
-            if not extracted_text:
-                st.error("❌ No text extracted from PDF. Please ensure the PDF contains readable text.")
-                st.stop()
-            
-            # Process the extracted text
-            extractor = PDFExtractor()
-            student_info, semesters, _ = extractor.process_pdf(None, extracted_text)
+            if cached is not None:
+                # Same PDF processed before - skip extraction and parsing
+                student_info, semesters = cached
+            else:
+                # Decode pages and parse semesters in one streaming pass
+                extractor = PDFExtractor()
+                student_info, semesters = extractor.process_pdf_bytes(pdf_bytes)
+                
+                if not student_info:
+                    st.error("❌ No text extracted from PDF. Please ensure the PDF contains readable text.")
+                    st.stop()
+                
+                if student_info and semesters:
+                    extraction_cache.put(cache_key, student_info, semesters)
             
             if not student_info or not semesters:
                 st.error("❌ Failed to process transcript data. Please check if the PDF format is supported.")
                 st.stop()
             
             # Validate courses
-            validation_results = _validate_courses(semesters, selected_course_data)
+            validation_results = _validate_courses(semesters, selected_course_data, student_info.get('id', ''))
             
             # Track which curriculum was used for validation
             st.session_state.last_validation_curriculum = selected_course_data.get('curriculum_folder', selected_course_data.get('filename', ''))
@@ -140,6 +147,9 @@ def _process_pdf_file(pdf_file, selected_course_data, session_manager):
             # Trigger rerun to refresh curriculum selection based on student ID
             st.rerun()
             
+        except PDFRejectedError as e:
+            st.error(f"❌ PDF rejected: {e}. Please upload the transcript PDF exported from the registration system.")
+            st.stop()
         except Exception as e:
             st.error(f"❌ Error during processing: {e}")
             with st.expander("Debug Information"):
@@ -147,62 +157,61 @@ def _process_pdf_file(pdf_file, selected_course_data, session_manager):
             st.stop()
 
 
-def _validate_courses(semesters, selected_course_data):
-    """Validate courses using the validator."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as tmp_file:
-        json.dump(selected_course_data['data'], tmp_file)
-        tmp_path = tmp_file.name
+def _validate_courses(semesters, selected_course_data, student_id=""):
+    """
+    Validate courses using the validator.
     
-    try:
-        validator = CourseRegistrationValidator(tmp_path)
-        passed_courses_history = validator.build_passed_courses_history(semesters)
-        
-        all_results = []
-        
-        # Validate each semester
-        for i, semester in enumerate(semesters):
-            # Check credit limit
-            credit_valid, credit_reason = validator.validate_credit_limit(semester)
-            if not credit_valid:
-                all_results.append({
-                    "semester": semester.get("semester", ""),
-                    "semester_index": i,
-                    "course_code": "CREDIT_LIMIT", 
-                    "course_name": "Credit Limit Check",
-                    "grade": "N/A",
-                    "is_valid": True,  # Credit limits are warnings, not errors
-                    "reason": credit_reason,
-                    "type": "credit_limit"
-                })
-            
-            # Validate each course
-            for course in semester.get("courses", []):
-                is_valid, reason = validator.validate_course(
-                    course, i, semesters, passed_courses_history, all_results
-                )
-                
-                all_results.append({
-                    "semester": semester.get("semester", ""),
-                    "semester_index": i,
-                    "course_code": course.get("code", ""),
-                    "course_name": course.get("name", ""),
-                    "grade": course.get("grade", ""),
-                    "is_valid": is_valid,
-                    "reason": reason,
-                    "type": "prerequisite"
-                })
-        
-        # Propagate invalidation
-        validator.propagate_invalidation(semesters, all_results)
-        return all_results
+    Results for a transcript and curriculum validated before are served from
+    the validation cache. If this student's transcript was validated earlier
+    in the session against the same curriculum and has only gained semesters
+    since, only the new semesters are validated.
+    """
+    validator = CourseRegistrationValidator.from_course_data(selected_course_data['data'])
+    cache_key = validation_cache.key_for(semesters, validator.compiled.fingerprint, VALIDATOR_VERSION)
+    cached_results = validation_cache.get(cache_key)
+    if cached_results is not None:
+        return cached_results
     
-    finally:
-        # Clean up temp file
-        if os.path.exists(tmp_path):
-            os.unlink(tmp_path)
+    previous_state = SessionManager.get_validation_state(student_id) if student_id else None
+    
+    if previous_state is not None and validator.can_resume(previous_state, semesters):
+        state = validator.resume_validation(previous_state, semesters)
+    else:
+        state = validator.validate_transcript_state(semesters)
+    
+    if student_id:
+        SessionManager.store_validation_state(student_id, state)
+    validation_cache.put(cache_key, state.results)
+    return state.results
 
 
-def _display_results(session_manager, selected_course_data):
+def _compare_curricula(semesters, available_course_data, course_analyzer):
+    """
+    Validate the transcript against every available curriculum in one pass.
+    
+    The per-curriculum results are also stored in the validation cache, so
+    switching to another curriculum afterwards does not validate again.
+    """
+    validators = {
+        name: CourseRegistrationValidator.from_course_data(course_data['data'])
+        for name, course_data in available_course_data.items()
+    }
+    fits = validate_against_curricula(
+        semesters,
+        {name: course_data['data'] for name, course_data in available_course_data.items()},
+        course_analyzer.get_course_categories(),
+        course_analyzer.get_technical_elective_prefixes(),
+        validators=validators
+    )
+    
+    for fit in fits:
+        cache_key = validation_cache.key_for(semesters, validators[fit.curriculum].compiled.fingerprint, VALIDATOR_VERSION)
+        validation_cache.put(cache_key, fit.validation_results)
+    
+    return fits
+
+
+def _display_results(session_manager, selected_course_data, available_course_data=None):
     """Display processing results."""
     student_info = session_manager.get_student_info()
     semesters = session_manager.get_semesters()
@@ -214,7 +223,7 @@ def _display_results(session_manager, selected_course_data):
     if cached_curriculum != current_curriculum:
         # Re-validate with new curriculum
         st.info(f"🔄 Re-validating courses with {current_curriculum}...")
-        validation_results = _validate_courses(semesters, selected_course_data)
+        validation_results = _validate_courses(semesters, selected_course_data, student_info.get('id', ''))
         
         # Update session state with new validation results
         st.session_state.validation_results = validation_results
@@ -242,6 +251,14 @@ def _display_results(session_manager, selected_course_data):
         student_info, semesters, validation_results, selected_course_data, unidentified_courses
     )
     
+    # Compare every curriculum on request (e.g. for IDs near a curriculum boundary)
+    if available_course_data and len(available_course_data) > 1:
+        with st.expander("🔀 Compare Curricula", expanded=False):
+            if st.button("Validate against all curricula", help="Validate this transcript against every curriculum and rank the fit"):
+                with st.spinner("Validating against all curricula..."):
+                    fits = _compare_curricula(semesters, available_course_data, course_analyzer)
+                UIComponents.display_curriculum_comparison(fits, current_curriculum)
+    
     # Analyze courses and display summary with template context
     course_analyzer.analyze_and_display_courses(semesters, template)
     
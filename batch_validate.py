@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Batch transcript validation.
+
+Runs PDF extraction, prerequisite validation and course analysis over a
+directory (or glob) of transcript PDFs in a process pool and writes one JSON
+line per transcript.
+
+Usage:
+    python batch_validate.py transcripts/ -o results.jsonl
+    python batch_validate.py "exports/2567/*.pdf" --workers 8 --curriculum B-IE-2565
+    python batch_validate.py transcripts/ --ids-only -o routing.jsonl
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+
+from utils.pdf_extractor import PDFExtractor
+from utils.curriculum_selector import get_curriculum_for_student_id
+from validator import CourseRegistrationValidator
+
+COURSE_DATA_DIR = Path(__file__).parent / "course_data"
+
+# Per-process caches, filled lazily by each pool worker
+_validators = {}
+_templates = {}
+_course_analyzer = None
+
+
+def find_transcripts(inputs):
+    """
+    Expand directories and glob patterns into a sorted list of PDF paths.
+
+    Args:
+        inputs: Directories, glob patterns or PDF file paths
+
+    Returns:
+        Sorted list of unique PDF paths
+    """
+    paths = set()
+    for item in inputs:
+        if os.path.isdir(item):
+            paths.update(str(p) for p in Path(item).glob("*.pdf"))
+        else:
+            paths.update(p for p in glob.glob(item) if p.lower().endswith(".pdf"))
+    return sorted(paths)
+
+
+def _get_validator(curriculum):
+    if curriculum not in _validators:
+        courses_file = COURSE_DATA_DIR / curriculum / "courses.json"
+        _validators[curriculum] = CourseRegistrationValidator(str(courses_file))
+    return _validators[curriculum]
+
+
+def _get_template(curriculum):
+    if curriculum not in _templates:
+        from components.flow_chart_data_analyzer import FlowChartDataAnalyzer
+        _templates[curriculum] = FlowChartDataAnalyzer().load_curriculum_template(curriculum)
+    return _templates[curriculum]
+
+
+def _get_course_analyzer():
+    global _course_analyzer
+    if _course_analyzer is None:
+        from components.course_analyzer import CourseAnalyzer
+        _course_analyzer = CourseAnalyzer()
+    return _course_analyzer
+
+
+def process_transcript(pdf_path, curriculum=None):
+    """
+    Extract, validate and analyze one transcript.
+
+    Args:
+        pdf_path: Path to the transcript PDF
+        curriculum: Curriculum folder to validate against (auto-selected
+            from the student ID when None)
+
+    Returns:
+        JSON-serializable record for the transcript
+    """
+    record = {"file": pdf_path, "error": None}
+    timing = {}
+    start = time.perf_counter()
+
+    try:
+        stage_start = time.perf_counter()
+        with open(pdf_path, 'rb') as f:
+            pdf_bytes = f.read()
+        # Already running inside a pool worker - extract pages serially
+        student_info, semesters = PDFExtractor().process_pdf_bytes(pdf_bytes, workers=1)
+        timing["extract"] = time.perf_counter() - stage_start
+
+        record["student_info"] = student_info
+        if not student_info or not semesters:
+            raise ValueError("No transcript data found in PDF")
+
+        selected_curriculum = curriculum or get_curriculum_for_student_id(student_info.get("id", ""))
+        record["curriculum"] = selected_curriculum
+        record["semester_count"] = len(semesters)
+        record["course_count"] = sum(len(s.get("courses", [])) for s in semesters)
+
+        stage_start = time.perf_counter()
+        validation_results = _get_validator(selected_curriculum).validate_transcript(semesters)
+        timing["validate"] = time.perf_counter() - stage_start
+
+        record["invalid_count"] = len([r for r in validation_results
+                                       if not r.get("is_valid", True) and r.get("course_code") != "CREDIT_LIMIT"])
+        record["validation_results"] = validation_results
+
+        stage_start = time.perf_counter()
+        course_analyzer = _get_course_analyzer()
+        record["credit_summary"] = course_analyzer.calculate_credit_summary(semesters)
+        record["unidentified_courses"] = course_analyzer.analyze_unidentified_courses(
+            semesters, _get_template(selected_curriculum)
+        )
+        timing["analyze"] = time.perf_counter() - stage_start
+
+    except Exception as e:
+        record["error"] = {
+            "type": type(e).__name__,
+            "message": str(e),
+            "traceback": traceback.format_exc()
+        }
+
+    timing["total"] = time.perf_counter() - start
+    record["timing"] = {stage: round(seconds, 4) for stage, seconds in timing.items()}
+    return record
+
+
+def identify_transcript(pdf_path, curriculum=None):
+    """
+    Read only the transcript header and pick the curriculum.
+
+    Args:
+        pdf_path: Path to the transcript PDF
+        curriculum: Curriculum folder to report instead of auto-selecting
+
+    Returns:
+        JSON-serializable record with student info and curriculum
+    """
+    record = {"file": pdf_path, "error": None}
+    start = time.perf_counter()
+
+    try:
+        with open(pdf_path, 'rb') as f:
+            pdf_bytes = f.read()
+        student_info = PDFExtractor().extract_student_info_from_pdf_bytes(pdf_bytes)
+        record["student_info"] = student_info
+        record["curriculum"] = curriculum or get_curriculum_for_student_id(student_info.get("id", ""))
+    except Exception as e:
+        record["error"] = {
+            "type": type(e).__name__,
+            "message": str(e),
+            "traceback": traceback.format_exc()
+        }
+
+    record["timing"] = {"total": round(time.perf_counter() - start, 4)}
+    return record
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Validate a batch of transcript PDFs and write one JSON line per student."
+    )
+    parser.add_argument("inputs", nargs="+",
+                        help="Directories, glob patterns or PDF files to process")
+    parser.add_argument("-o", "--output",
+                        help="JSONL output file (default: stdout)")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1,
+                        help="Number of worker processes (default: CPU count)")
+    parser.add_argument("-c", "--curriculum",
+                        help="Validate every transcript against this curriculum instead of auto-selecting")
+    parser.add_argument("--ids-only", action="store_true",
+                        help="Only read student info from the transcript header and report the curriculum")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    pdf_paths = find_transcripts(args.inputs)
+    if not pdf_paths:
+        print("No PDF files found", file=sys.stderr)
+        return 1
+
+    output = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    error_count = 0
+    start = time.perf_counter()
+
+    try:
+        task = identify_transcript if args.ids_only else process_transcript
+        worker = partial(task, curriculum=args.curriculum)
+        with ProcessPoolExecutor(max_workers=max(1, args.workers)) as executor:
+            chunksize = max(1, len(pdf_paths) // (max(1, args.workers) * 8))
+            for record in executor.map(worker, pdf_paths, chunksize=chunksize):
+                if record["error"]:
+                    error_count += 1
+                output.write(json.dumps(record, ensure_ascii=False) + "\n")
+                output.flush()
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    elapsed = time.perf_counter() - start
+    print(f"Processed {len(pdf_paths)} transcripts ({error_count} errors) in {elapsed:.1f}s",
+          file=sys.stderr)
+    return 0 if error_count == 0 else 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
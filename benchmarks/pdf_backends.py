@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Speed/accuracy benchmark for the PDF text backends.
+
+Runs every available backend over a corpus of PDFs through the production
+extraction path (extract_text_from_pdf_bytes with the default extraction
+limits), reports pages/sec and whether extract_semesters on the backend's
+text matches the default backend's output. --no-limits times the decoders
+alone, without the limits' worker process.
+
+Usage:
+    python -m benchmarks.pdf_backends
+    python -m benchmarks.pdf_backends transcripts/ --repeat 5 --json results.json
+    python -m benchmarks.pdf_backends --no-limits
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+from batch_validate import find_transcripts
+from utils.pdf_backends import DEFAULT_BACKEND, available_backends, get_backend
+from utils.pdf_extractor import PDFExtractor
+from utils.pdf_processor import DEFAULT_LIMITS, UNLIMITED, extract_text_from_pdf_bytes
+
+DEFAULT_CORPUS = [str(Path(__file__).parent.parent / "example_files" / "PDF_Format.pdf")]
+
+
+def count_pages(backend_name, pdf_bytes):
+    """Return the number of pages of one PDF (not timed)."""
+    backend = get_backend(backend_name)
+    return backend.page_count(backend.open(pdf_bytes))
+
+
+def extract_pages(backend_name, pdf_bytes, limits=None):
+    """Return the joined text of one PDF, extracted serially with one backend."""
+    return extract_text_from_pdf_bytes(pdf_bytes, workers=1, backend=backend_name, limits=limits)
+
+
+def run_benchmark(pdf_paths, backends, repeat=3, limits=None):
+    """
+    Time each backend over the corpus and compare parsed semesters.
+
+    Args:
+        pdf_paths: PDF files to extract
+        backends: Backend names to run
+        repeat: Number of timed runs per file (best run is kept)
+        limits: ExtractionLimits to extract with (defaults to DEFAULT_LIMITS)
+
+    Returns:
+        List of per-backend result dictionaries
+    """
+    limits = limits or DEFAULT_LIMITS
+    extractor = PDFExtractor()
+    corpus = [(path, Path(path).read_bytes()) for path in pdf_paths]
+
+    # Reference semesters come from the default backend
+    reference = {}
+    for path, pdf_bytes in corpus:
+        text = extract_pages(DEFAULT_BACKEND, pdf_bytes, limits)
+        reference[path] = extractor.extract_semesters(text)
+
+    results = []
+    for backend_name in backends:
+        total_pages = 0
+        total_seconds = 0.0
+        mismatches = []
+
+        for path, pdf_bytes in corpus:
+            best = None
+            for _ in range(repeat):
+                start = time.perf_counter()
+                text = extract_pages(backend_name, pdf_bytes, limits)
+                elapsed = time.perf_counter() - start
+                best = elapsed if best is None else min(best, elapsed)
+
+            total_pages += count_pages(backend_name, pdf_bytes)
+            total_seconds += best
+            if extractor.extract_semesters(text) != reference[path]:
+                mismatches.append(path)
+
+        results.append({
+            "backend": backend_name,
+            "files": len(corpus),
+            "pages": total_pages,
+            "seconds": round(total_seconds, 4),
+            "pages_per_sec": round(total_pages / total_seconds, 1) if total_seconds else None,
+            "semesters_match": not mismatches,
+            "mismatched_files": mismatches
+        })
+
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark PDF text backends.")
+    parser.add_argument("inputs", nargs="*", default=DEFAULT_CORPUS,
+                        help="Directories, glob patterns or PDF files (default: example transcript)")
+    parser.add_argument("-b", "--backends", nargs="+", default=None,
+                        help="Backends to run (default: every installed backend)")
+    parser.add_argument("-r", "--repeat", type=int, default=3,
+                        help="Timed runs per file; the best run is kept")
+    parser.add_argument("--no-limits", action="store_true",
+                        help="Extract without the upload limits (no worker process)")
+    parser.add_argument("--json", dest="json_path",
+                        help="Also write the results as JSON to this file")
+    args = parser.parse_args(argv)
+
+    pdf_paths = find_transcripts(args.inputs)
+    if not pdf_paths:
+        print("No PDF files found", file=sys.stderr)
+        return 1
+
+    backends = args.backends or available_backends()
+    limits = UNLIMITED if args.no_limits else DEFAULT_LIMITS
+    results = run_benchmark(pdf_paths, backends, max(1, args.repeat), limits)
+
+    print(f"{'Backend':<12} {'Pages':>7} {'Seconds':>9} {'Pages/sec':>10}  Semesters match")
+    print("-" * 60)
+    for result in results:
+        print(f"{result['backend']:<12} {result['pages']:>7} {result['seconds']:>9.3f} "
+              f"{result['pages_per_sec'] or 0:>10.1f}  {'yes' if result['semesters_match'] else 'NO'}")
+
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
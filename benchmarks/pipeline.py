@@ -0,0 +1,386 @@
+#!/usr/bin/env python3
+"""
+End-to-end benchmark of the path behind each transcript upload.
+
+Times every stage separately (PDF decode, semester parsing, prerequisite
+validation, credit summary, flow chart HTML, comprehensive report and Excel
+export) over synthetic transcripts of several sizes and over each curriculum,
+optionally with the course catalog inflated to simulate larger curricula.
+Results are written as JSON so two runs can be compared.
+
+Usage:
+    python -m benchmarks.pipeline --json before.json
+    python -m benchmarks.pipeline --sizes 8x48 16x120 --catalog-scale 1 4 --json after.json
+    python -m benchmarks.pipeline --compare before.json after.json
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from benchmarks.synthetic_transcripts import generate_transcript, load_course_pool, render_pdf
+from utils.course_data_loader import load_comprehensive_course_data
+from utils.pdf_extractor import PDFExtractor
+from utils.pdf_processor import extract_text_from_pdf_bytes
+from validator import CourseRegistrationValidator
+
+# Transcript sizes as (semesters, course registrations)
+DEFAULT_SIZES = [(4, 24), (8, 48), (12, 80)]
+
+STAGES = [
+    "decode",
+    "extract_semesters",
+    "validate",
+    "credit_summary",
+    "flow_chart_html",
+    "comprehensive_report",
+    "excel"
+]
+
+# Default slowdown ratio reported as a regression by --compare
+REGRESSION_THRESHOLD = 1.10
+
+
+def parse_size(value: str) -> Tuple[int, int]:
+    """Parse a 'SEMESTERSxCOURSES' size argument such as '8x48'."""
+    try:
+        semesters, courses = value.lower().split("x")
+        return int(semesters), int(courses)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid size '{value}', expected SEMESTERSxCOURSES")
+
+
+def inflate_catalog(course_data: Dict, scale: int) -> Dict:
+    """
+    Return a copy of a courses.json dictionary with extra synthetic courses.
+
+    Each copy renumbers every catalog course into an unused code range and
+    remaps its prerequisites to the copies, so the prerequisite graph keeps
+    its shape while the catalog grows by a factor of scale.
+
+    Args:
+        course_data: Parsed courses.json content
+        scale: Catalog size multiplier (1 returns the data unchanged)
+
+    Returns:
+        Course data dictionary
+
+    Raises:
+        ValueError: If there are not enough unused 2-digit code prefixes
+            for scale copies
+    """
+    if scale <= 1:
+        return course_data
+
+    catalog_lists = {key: courses for key, courses in course_data.items() if isinstance(courses, list)}
+
+    # Every copy maps each 2-digit prefix in use to its own unused prefix, so
+    # copies never collide with each other or with the real courses
+    used_prefixes = set()
+    for courses in catalog_lists.values():
+        for course in courses:
+            codes = [course.get("code", "")] + list(course.get("prerequisites", []))
+            for group in course.get("prerequisite_groups", []):
+                codes.extend(group.get("courses", []))
+            used_prefixes.update(code[:2] for code in codes if len(code) == 8)
+
+    free_prefixes = [f"{n:02d}" for n in list(range(90, 100)) + list(range(10, 90))
+                     if f"{n:02d}" not in used_prefixes]
+    needed = (scale - 1) * len(used_prefixes)
+    if needed > len(free_prefixes):
+        raise ValueError(f"Catalog scale {scale} needs {needed} unused code prefixes; "
+                         f"only {len(free_prefixes)} are available")
+
+    prefix_maps = []
+    free = iter(free_prefixes)
+    for _ in range(1, scale):
+        prefix_maps.append({prefix: next(free) for prefix in sorted(used_prefixes)})
+
+    inflated = {}
+    for key, courses in course_data.items():
+        if key not in catalog_lists:
+            inflated[key] = courses
+            continue
+
+        inflated[key] = list(courses)
+        for prefix_map in prefix_maps:
+
+            def renumber(code):
+                return prefix_map[code[:2]] + code[2:] if len(code) == 8 else code
+
+            for course in courses:
+                clone = dict(course)
+                clone["code"] = renumber(course.get("code", ""))
+                clone["prerequisites"] = [renumber(p) for p in course.get("prerequisites", [])]
+                if "prerequisite_groups" in course:
+                    clone["prerequisite_groups"] = [
+                        dict(group, courses=[renumber(p) for p in group.get("courses", [])])
+                        for group in course["prerequisite_groups"]
+                    ]
+                inflated[key].append(clone)
+
+    return inflated
+
+
+def _time_call(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def run_pipeline(pdf_bytes, validator, course_analyzer, flow_generator, report_generator,
+                 selected_course_data, workers=1) -> Dict[str, float]:
+    """
+    Run one transcript through every stage.
+
+    Returns:
+        Dictionary of stage name to elapsed seconds
+    """
+    from utils.excel_generator import create_smart_registration_excel
+
+    timings = {}
+    extractor = PDFExtractor()
+
+    text, timings["decode"] = _time_call(extract_text_from_pdf_bytes, pdf_bytes, workers)
+    semesters, timings["extract_semesters"] = _time_call(extractor.extract_semesters, text)
+    student_info = extractor.extract_student_info(text)
+
+    validation_results, timings["validate"] = _time_call(validator.validate_transcript, semesters)
+    _, timings["credit_summary"] = _time_call(course_analyzer.calculate_credit_summary, semesters)
+    _, timings["flow_chart_html"] = _time_call(
+        flow_generator.create_enhanced_template_flow_html,
+        student_info, semesters, validation_results, selected_course_data
+    )
+    _, timings["comprehensive_report"] = _time_call(
+        report_generator.generate_comprehensive_report,
+        student_info, semesters, validation_results, selected_course_data
+    )
+    _, timings["excel"] = _time_call(
+        create_smart_registration_excel, student_info, semesters, validation_results
+    )
+
+    return timings
+
+
+def run_benchmark(curricula: List[str], sizes: List[Tuple[int, int]], catalog_scales: List[int],
+                  samples: int = 3, repeat: int = 3, workers: int = 1, seed: int = 0) -> List[Dict]:
+    """
+    Benchmark every (curriculum, catalog scale, transcript size) combination.
+
+    Args:
+        curricula: Curriculum folders to run
+        sizes: Transcript sizes as (semesters, courses)
+        catalog_scales: Catalog size multipliers for the validation stage
+        samples: Distinct synthetic transcripts per combination
+        repeat: Timed runs per transcript (the best run is kept)
+        workers: Worker processes for PDF decode
+        seed: Base random seed for the synthetic transcripts
+
+    Returns:
+        List of result dictionaries, one per combination and stage
+    """
+    from components.comprehensive_report_generator import ComprehensiveReportGenerator
+    from components.course_analyzer import CourseAnalyzer
+    from components.flow_chart_generator import FlowChartGenerator
+
+    available_course_data = load_comprehensive_course_data()
+    course_analyzer = CourseAnalyzer()
+    flow_generator = FlowChartGenerator()
+    report_generator = ComprehensiveReportGenerator()
+    results = []
+
+    for curriculum in curricula:
+        selected_course_data = available_course_data.get(curriculum)
+        if selected_course_data is None:
+            print(f"Skipping unknown curriculum {curriculum}", file=sys.stderr)
+            continue
+        course_pool = load_course_pool(curriculum)
+
+        for scale in catalog_scales:
+            catalog = inflate_catalog(selected_course_data["data"], scale)
+            catalog_size = sum(len(c) for c in catalog.values() if isinstance(c, list))
+
+            validator = CourseRegistrationValidator.from_course_data(catalog)
+
+            for semester_count, course_count in sizes:
+                stage_timings = {stage: [] for stage in STAGES}
+
+                for sample in range(samples):
+                    transcript = generate_transcript(
+                        semester_count=semester_count, course_count=course_count,
+                        curriculum=curriculum, header_format=1 + sample % 2,
+                        seed=seed + sample, course_pool=course_pool
+                    )
+                    pdf_bytes = render_pdf(transcript["text"])
+
+                    best = {}
+                    for _ in range(repeat):
+                        timings = run_pipeline(pdf_bytes, validator, course_analyzer, flow_generator,
+                                               report_generator, selected_course_data, workers)
+                        for stage, seconds in timings.items():
+                            best[stage] = min(best.get(stage, seconds), seconds)
+
+                    for stage, seconds in best.items():
+                        stage_timings[stage].append(seconds)
+
+                for stage in STAGES:
+                    values = stage_timings[stage]
+                    results.append({
+                        "stage": stage,
+                        "curriculum": curriculum,
+                        "catalog_scale": scale,
+                        "catalog_courses": catalog_size,
+                        "semesters": semester_count,
+                        "courses": course_count,
+                        "samples": len(values),
+                        "min_ms": round(min(values) * 1000, 3),
+                        "median_ms": round(statistics.median(values) * 1000, 3),
+                        "mean_ms": round(statistics.mean(values) * 1000, 3)
+                    })
+
+    return results
+
+
+def result_key(result: Dict) -> Tuple:
+    """Key that identifies the same measurement across runs."""
+    return (result["stage"], result["curriculum"], result["catalog_scale"],
+            result["semesters"], result["courses"])
+
+
+def compare_results(baseline: Dict, current: Dict, threshold: float = REGRESSION_THRESHOLD) -> List[Dict]:
+    """
+    Compare median stage times of two benchmark runs.
+
+    Args:
+        baseline: Earlier run as written by --json
+        current: Later run as written by --json
+        threshold: Ratio above which a stage counts as a regression
+
+    Returns:
+        List of comparison rows for measurements present in both runs
+    """
+    baseline_by_key = {result_key(r): r for r in baseline.get("results", [])}
+    rows = []
+
+    for result in current.get("results", []):
+        before = baseline_by_key.get(result_key(result))
+        if before is None:
+            continue
+        ratio = result["median_ms"] / before["median_ms"] if before["median_ms"] else None
+        rows.append({
+            "key": result_key(result),
+            "before_ms": before["median_ms"],
+            "after_ms": result["median_ms"],
+            "ratio": round(ratio, 3) if ratio is not None else None,
+            "regression": ratio is not None and ratio > threshold
+        })
+
+    return rows
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=Path(__file__).parent.parent,
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except Exception:
+        return ""
+
+
+def _print_results(results: List[Dict]):
+    print(f"{'Stage':<22} {'Curriculum':<10} {'Scale':>5} {'Sem':>4} {'Courses':>7} "
+          f"{'Min ms':>9} {'Median ms':>10} {'Mean ms':>9}")
+    print("-" * 84)
+    for r in results:
+        print(f"{r['stage']:<22} {r['curriculum']:<10} {r['catalog_scale']:>5} {r['semesters']:>4} "
+              f"{r['courses']:>7} {r['min_ms']:>9.2f} {r['median_ms']:>10.2f} {r['mean_ms']:>9.2f}")
+
+
+def _print_comparison(rows: List[Dict]):
+    print(f"{'Stage':<22} {'Curriculum':<10} {'Scale':>5} {'Sem':>4} {'Courses':>7} "
+          f"{'Before ms':>10} {'After ms':>9} {'Ratio':>7}")
+    print("-" * 84)
+    for row in rows:
+        stage, curriculum, scale, semesters, courses = row["key"]
+        flag = "  REGRESSION" if row["regression"] else ""
+        print(f"{stage:<22} {curriculum:<10} {scale:>5} {semesters:>4} {courses:>7} "
+              f"{row['before_ms']:>10.2f} {row['after_ms']:>9.2f} {row['ratio'] or 0:>7.2f}{flag}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the transcript processing pipeline.")
+    parser.add_argument("--curricula", nargs="+", default=None,
+                        help="Curriculum folders to run (default: every curriculum)")
+    parser.add_argument("--sizes", nargs="+", type=parse_size, default=DEFAULT_SIZES,
+                        help="Transcript sizes as SEMESTERSxCOURSES (default: 4x24 8x48 12x80)")
+    parser.add_argument("--catalog-scale", nargs="+", type=int, default=[1],
+                        help="Catalog size multipliers for the validation stage (default: 1)")
+    parser.add_argument("-s", "--samples", type=int, default=3,
+                        help="Synthetic transcripts per combination")
+    parser.add_argument("-r", "--repeat", type=int, default=3,
+                        help="Timed runs per transcript; the best run is kept")
+    parser.add_argument("-w", "--workers", type=int, default=1,
+                        help="Worker processes for PDF decode (default: 1)")
+    parser.add_argument("--seed", type=int, default=0, help="Base random seed")
+    parser.add_argument("--json", dest="json_path",
+                        help="Write the results as JSON to this file")
+    parser.add_argument("--compare", nargs=2, metavar=("BASELINE", "CURRENT"),
+                        help="Compare two JSON result files instead of running the benchmark")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD,
+                        help="Median slowdown ratio reported as a regression (default: 1.10)")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        with open(args.compare[0], 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        with open(args.compare[1], 'r', encoding='utf-8') as f:
+            current = json.load(f)
+        rows = compare_results(baseline, current, args.threshold)
+        _print_comparison(rows)
+        return 1 if any(row["regression"] for row in rows) else 0
+
+    available_course_data = load_comprehensive_course_data()
+    curricula = args.curricula or sorted(available_course_data.keys())
+
+    # Fail before running anything if a catalog cannot be inflated that far
+    for curriculum in curricula:
+        if curriculum in available_course_data:
+            try:
+                inflate_catalog(available_course_data[curriculum]["data"], max(args.catalog_scale))
+            except ValueError as e:
+                parser.error(str(e))
+
+    results = run_benchmark(curricula, args.sizes, args.catalog_scale, max(1, args.samples),
+                            max(1, args.repeat), max(1, args.workers), args.seed)
+    _print_results(results)
+
+    if args.json_path:
+        output = {
+            "metadata": {
+                "timestamp": datetime.now().isoformat(timespec="seconds"),
+                "git_commit": _git_commit(),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "cpu_count": os.cpu_count(),
+                "samples": args.samples,
+                "repeat": args.repeat,
+                "workers": args.workers
+            },
+            "results": results
+        }
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump(output, f, indent=2)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+"""
+Synthetic transcript generator for load and scaling tests.
+
+Emits transcript text in both header formats PDFExtractor.extract_student_info
+handles, with course codes drawn from course_data/*/courses.json, split course
+codes (e.g. "012081 11"), F/W/N/P grades and GPA lines. Each transcript comes
+with the student info and semesters the parser is expected to return, and can
+optionally be rendered to a minimal text-only PDF.
+
+Usage:
+    python -m benchmarks.synthetic_transcripts -n 100 -o /tmp/transcripts --pdf
+    python -m benchmarks.synthetic_transcripts -n 1 --semesters 12 --courses 80
+"""
+import argparse
+import json
+import random
+import re
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+COURSE_DATA_DIR = Path(__file__).parent.parent / "course_data"
+
+GRADE_POINTS = {"A": 4.0, "B+": 3.5, "B": 3.0, "C+": 2.5, "C": 2.0, "D+": 1.5, "D": 1.0, "F": 0.0}
+PASSING_GRADES = ["A", "B+", "B", "C+", "C", "D+", "D"]
+
+FIRST_NAMES = ["Napat", "Somchai", "Pimchanok", "Thanawat", "Kanokwan", "Anan", "Siriporn", "Wichai"]
+SURNAMES = ["JAIDEE", "SRISUK", "WONGSA", "BOONMA", "CHAIYO", "SUKSAN", "THONGDEE", "RAKSA"]
+
+# Semester types in transcript order within one academic year
+SEMESTER_CYCLE = ["First", "Second", "Summer"]
+
+
+def _parse_credits(raw) -> int:
+    """Turn catalog credits such as '3(3-0-6)' or '1-3' into what the parser accepts."""
+    match = re.match(r'\s*(\d+)', str(raw))
+    credits = int(match.group(1)) if match else 3
+    return min(max(credits, 1), 6)
+
+
+def _clean_name(name: str) -> str:
+    """Make a catalog name survive the parser's course-name pattern unchanged."""
+    name = name.split("***")[0]
+    name = re.sub(r"[^A-Za-z&,.:'\- ]", ' ', name)
+    name = re.sub(r'(?:Course Code|Grade|Credit)', ' ', name, flags=re.IGNORECASE)
+    name = re.sub(r'\s+', ' ', name).strip()[:80].strip()
+    return name if len(name) >= 6 and name[0].isalpha() else f"Course {name}".strip()
+
+
+def load_course_pool(curriculum: Optional[str] = None) -> List[Dict]:
+    """
+    Load catalog courses ordered so that prerequisites come first.
+
+    Args:
+        curriculum: Curriculum folder to draw from (all curricula when None)
+
+    Returns:
+        List of dicts with code, name, credits, prerequisites, gen_ed flag
+        and prerequisite depth
+    """
+    courses = {}
+    pattern = f"{curriculum}/courses.json" if curriculum else "*/courses.json"
+    for courses_file in sorted(COURSE_DATA_DIR.glob(pattern)):
+        with open(courses_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        for course_list in data.values():
+            for course in course_list:
+                courses.setdefault(course["code"], {
+                    "code": course["code"],
+                    "name": _clean_name(course.get("name", "")),
+                    "credits": _parse_credits(course.get("credits", 3)),
+                    "prerequisites": list(course.get("prerequisites", [])),
+                    "gen_ed": False
+                })
+
+    gen_ed_file = COURSE_DATA_DIR / "gen_ed_courses.json"
+    if gen_ed_file.exists():
+        with open(gen_ed_file, 'r', encoding='utf-8') as f:
+            gen_ed = json.load(f).get("gen_ed_courses", {})
+        for course_list in gen_ed.values():
+            for course in course_list:
+                courses.setdefault(course["code"], {
+                    "code": course["code"],
+                    "name": _clean_name(course.get("name", "")),
+                    "credits": _parse_credits(course.get("credits", 3)),
+                    "prerequisites": [],
+                    "gen_ed": True
+                })
+
+    # Order by prerequisite depth so early semesters hold foundation courses
+    depth = {}
+
+    def course_depth(code, visiting=()):
+        if code in depth:
+            return depth[code]
+        if code in visiting or code not in courses:
+            return 0
+        prereqs = courses[code]["prerequisites"]
+        depth[code] = 1 + max((course_depth(p, visiting + (code,)) for p in prereqs), default=-1)
+        return depth[code]
+
+    for course in courses.values():
+        course["depth"] = course_depth(course["code"])
+    return sorted(courses.values(), key=lambda c: (c["depth"], c["code"]))
+
+
+def _format_code(code: str, rng: random.Random, split_code_rate: float) -> str:
+    """Render a course code, sometimes split by a space like PDF extraction does."""
+    if rng.random() >= split_code_rate:
+        return code
+    split_at = rng.choice([4, 6])
+    return f"{code[:split_at]} {code[split_at:]}"
+
+
+def _format_course(course: Dict, rng: random.Random, split_code_rate: float) -> str:
+    credits = f"({course['credits']})" if course["grade"] == "F" else str(course["credits"])
+    return f"{_format_code(course['code'], rng, split_code_rate)} {course['name']} {course['grade']} {credits}"
+
+
+def _gpa(courses: List[Dict]) -> float:
+    points = sum(GRADE_POINTS[c["grade"]] * c["credits"] for c in courses if c["grade"] in GRADE_POINTS)
+    credits = sum(c["credits"] for c in courses if c["grade"] in GRADE_POINTS)
+    return points / credits if credits else 0.0
+
+
+def generate_transcript(semester_count: int = 8, course_count: int = 48,
+                        curriculum: Optional[str] = "B-IE-2565", header_format: int = 1,
+                        split_code_rate: float = 0.2, fail_rate: float = 0.08,
+                        withdraw_rate: float = 0.04, summer_rate: float = 0.3,
+                        seed: Optional[int] = None, course_pool: Optional[List[Dict]] = None,
+                        gen_ed_count: int = 12) -> Dict:
+    """
+    Generate one synthetic transcript.
+
+    Args:
+        semester_count: Number of semesters on the transcript
+        course_count: Total number of course registrations (retakes included)
+        curriculum: Curriculum folder to draw course codes from
+        header_format: 1 = Name/Field of Study/Date of Admission on separate
+            lines, one course per line; 2 = Name and Field Of Study on one
+            line, two courses per line
+        split_code_rate: Probability that a course code is split by a space
+        fail_rate: Probability of an F grade
+        withdraw_rate: Probability of a W grade
+        summer_rate: Probability that a year includes a summer session
+        seed: Random seed for reproducible output
+        course_pool: Preloaded result of load_course_pool()
+        gen_ed_count: Number of gen-ed courses mixed into the curriculum courses
+
+    Returns:
+        Dictionary with "text", "student_info" and "semesters" (the values
+        PDFExtractor is expected to return for "text")
+    """
+    rng = random.Random(seed)
+    pool = course_pool if course_pool is not None else load_course_pool(curriculum)
+
+    # Curriculum courses plus a sample of gen-ed courses, foundation courses
+    # first and shuffled within each prerequisite depth
+    gen_ed = [c for c in pool if c["gen_ed"]]
+    chosen = [c for c in pool if not c["gen_ed"]] + rng.sample(gen_ed, min(gen_ed_count, len(gen_ed)))
+    pool = sorted(chosen, key=lambda c: (c["depth"], rng.random()))
+
+    admission_year = rng.randint(2017, 2024)
+    cohort = (admission_year + 543) % 100
+    student_id = f"{cohort:02d}{rng.randint(10000000, 99999999)}"
+    name = f"{rng.choice(['Mr.', 'Ms.'])} {rng.choice(FIRST_NAMES)} {rng.choice(SURNAMES)}"
+
+    # Semester sequence: First, Second and sometimes Summer for each year
+    semester_slots = []
+    year = admission_year
+    while len(semester_slots) < semester_count:
+        for semester_type in SEMESTER_CYCLE:
+            if semester_type == "Summer" and rng.random() >= summer_rate:
+                continue
+            if len(semester_slots) < semester_count:
+                semester_slots.append((semester_type, year))
+        year += 1
+
+    # Spread registrations over the semesters (summers get fewer)
+    weights = [1 if semester_type == "Summer" else 3 for semester_type, _ in semester_slots]
+    per_semester = [course_count * w // sum(weights) for w in weights]
+    for i in range(course_count - sum(per_semester)):
+        per_semester[i % len(per_semester)] += 1
+
+    next_course = 0
+    retakes = []
+    semesters = []
+    for index, ((semester_type, sem_year), count) in enumerate(zip(semester_slots, per_semester)):
+        is_last = index == len(semester_slots) - 1
+        courses = []
+        codes = set()
+
+        while len(courses) < count:
+            if retakes:
+                course = retakes.pop(0)
+            elif next_course < len(pool):
+                course = pool[next_course]
+                next_course += 1
+            else:
+                break
+            if course["code"] in codes:
+                continue
+
+            if is_last:
+                grade = "N"
+            elif course["code"].startswith("01175"):
+                grade = "P"
+            else:
+                roll = rng.random()
+                if roll < fail_rate:
+                    grade = "F"
+                elif roll < fail_rate + withdraw_rate:
+                    grade = "W"
+                else:
+                    grade = rng.choice(PASSING_GRADES)
+
+            if grade in ("F", "W"):
+                retakes.append(course)
+
+            codes.add(course["code"])
+            courses.append({
+                "code": course["code"],
+                "name": course["name"],
+                "grade": grade,
+                "credits": course["credits"]
+            })
+
+        semesters.append({
+            "semester": f"{semester_type} Semester {sem_year}" if semester_type != "Summer" else f"Summer Session {sem_year}",
+            "semester_type": semester_type,
+            "year": str(sem_year),
+            "year_int": sem_year,
+            "courses": courses,
+            "sem_gpa": None,
+            "cum_gpa": None,
+            "total_credits": sum(c["credits"] for c in courses if c["grade"] not in ("W", "N", "P", "S", "U")),
+            "semester_order": 0 if semester_type == "Summer" else (1 if semester_type == "First" else 2)
+        })
+
+    # Render the text
+    lines = ["KASETSART UNIVERSITY", "Student Transcript"]
+    field_of_study = "Industrial Engineering"
+    date_admission = f"1 June {admission_year}"
+    if header_format == 1:
+        lines.append(f"Student No {student_id}")
+        lines.append(f"Name {name}")
+        lines.append(f"Field of Study {field_of_study}")
+        lines.append(f"Date of Admission {date_admission}")
+    else:
+        lines.append(f"Student No  {' '.join(student_id)}")
+        lines.append(f"Name       {name} Field Of Study  {field_of_study}")
+        lines.append(f"Date Of Birth 01/01/{admission_year - 18} Date Of Admission {date_admission}")
+    lines.append("Course Code Course Title Grade Credit")
+
+    cumulative_courses = []
+    for semester in semesters:
+        if semester["semester_type"] == "Summer":
+            lines.append(f"Summer Session {semester['year']}")
+        else:
+            lines.append(f"{semester['semester_type']} Semester {semester['year']}")
+
+        rows = [_format_course(c, rng, split_code_rate) for c in semester["courses"]]
+        if header_format == 1:
+            lines.extend(rows)
+        else:
+            lines.extend("   ".join(rows[i:i + 2]) for i in range(0, len(rows), 2))
+
+        graded = [c for c in semester["courses"] if c["grade"] in GRADE_POINTS]
+        if graded:
+            cumulative_courses.extend(graded)
+            semester["sem_gpa"] = round(_gpa(graded), 2)
+            semester["cum_gpa"] = round(_gpa(cumulative_courses), 2)
+            lines.append(f"sem. G.P.A. = {semester['sem_gpa']:.2f} cum. G.P.A. = {semester['cum_gpa']:.2f}")
+
+    # The parser drops semesters without courses
+    semesters = [s for s in semesters if s["courses"]]
+
+    return {
+        "text": "\n".join(lines),
+        "student_info": {
+            "id": student_id,
+            "name": name,
+            "field_of_study": field_of_study,
+            "date_admission": date_admission
+        },
+        "semesters": semesters
+    }
+
+
+def _pdf_escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def render_pdf(text: str, lines_per_page: int = 60) -> bytes:
+    """
+    Render transcript text to a minimal text-only PDF.
+
+    Args:
+        text: Transcript text, one PDF line per text line
+        lines_per_page: Lines placed on each page
+
+    Returns:
+        PDF file content
+    """
+    lines = text.split("\n")
+    pages = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)] or [[]]
+
+    objects = []
+    font_id = 3
+    objects.append(b"<< /Type /Catalog /Pages 2 0 R >>")
+    page_ids = [4 + 2 * i for i in range(len(pages))]
+    kids = " ".join(f"{pid} 0 R" for pid in page_ids)
+    objects.append(f"<< /Type /Pages /Kids [{kids}] /Count {len(pages)} >>".encode())
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    for page_id, page_lines in zip(page_ids, pages):
+        content = ["BT", "/F1 9 Tf", "12 TL", "36 806 Td"]
+        for line in page_lines:
+            content.append(f"({_pdf_escape(line)}) Tj T*")
+        content.append("ET")
+        stream = "\n".join(content).encode("latin-1", "replace")
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            f"/Resources << /Font << /F1 {font_id} 0 R >> >> /Contents {page_id + 1} 0 R >>".encode()
+        )
+        objects.append(b"<< /Length " + str(len(stream)).encode() + b" >>\nstream\n" + stream + b"\nendstream")
+
+    output = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(output))
+        output += f"{number} 0 obj\n".encode() + body + b"\nendobj\n"
+
+    xref_offset = len(output)
+    output += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    for offset in offsets:
+        output += f"{offset:010d} 00000 n \n".encode()
+    output += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref_offset}\n%%EOF\n".encode()
+    return bytes(output)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate synthetic transcripts.")
+    parser.add_argument("-n", "--count", type=int, default=1, help="Number of transcripts")
+    parser.add_argument("-o", "--output-dir", help="Write files here (default: print text to stdout)")
+    parser.add_argument("--semesters", type=int, default=8, help="Semesters per transcript")
+    parser.add_argument("--courses", type=int, default=48, help="Course registrations per transcript")
+    parser.add_argument("--curriculum", default="B-IE-2565", help="Curriculum to draw course codes from")
+    parser.add_argument("--format", type=int, choices=[1, 2], default=None,
+                        help="Header format (default: alternate between 1 and 2)")
+    parser.add_argument("--pdf", action="store_true", help="Also render each transcript to PDF")
+    parser.add_argument("--seed", type=int, default=0, help="Base random seed")
+    args = parser.parse_args(argv)
+
+    pool = load_course_pool(args.curriculum)
+    output_dir = Path(args.output_dir) if args.output_dir else None
+    if output_dir:
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+    for i in range(args.count):
+        transcript = generate_transcript(
+            semester_count=args.semesters, course_count=args.courses,
+            header_format=args.format or (1 + i % 2), seed=args.seed + i, course_pool=pool
+        )
+        if output_dir is None:
+            print(transcript["text"])
+            continue
+
+        stem = f"transcript_{i:05d}"
+        (output_dir / f"{stem}.txt").write_text(transcript["text"], encoding="utf-8")
+        with open(output_dir / f"{stem}.expected.json", 'w', encoding='utf-8') as f:
+            json.dump({"student_info": transcript["student_info"], "semesters": transcript["semesters"]}, f)
+        if args.pdf:
+            (output_dir / f"{stem}.pdf").write_bytes(render_pdf(transcript["text"]))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,27 +3,17 @@ Management module for viewing and deleting curriculums
 """
 import streamlit as st
 import pandas as pd
-import json
 import os
 import shutil
+from utils.curriculum_registry import curriculum_registry
 
 def get_existing_curriculums():
     """Get list of existing curriculums"""
-    course_data_path = "course_data"
-    if not os.path.exists(course_data_path):
-        return []
-    
-    curriculums = []
-    for item in os.listdir(course_data_path):
-        item_path = os.path.join(course_data_path, item)
-        if os.path.isdir(item_path) and item.startswith("B-IE-"):
-            curriculums.append(item)
-    
-    return sorted(curriculums)
+    return curriculum_registry.curricula()
 
 def delete_curriculum(curriculum_name):
     """Delete curriculum"""
-    folder_path = os.path.join("course_data", curriculum_name)
+    folder_path = curriculum_registry.course_data_dir / curriculum_name
     if os.path.exists(folder_path):
         shutil.rmtree(folder_path)
         return True
@@ -44,30 +34,26 @@ def render_manage_page():
         # Display curriculum list
         for curriculum in curriculums:
             with st.expander(f"📚 {curriculum}", expanded=False):
-                folder_path = os.path.join("course_data", curriculum)
-                
                 # Read courses.json
-                courses_file = os.path.join(folder_path, "courses.json")
-                template_file = os.path.join(folder_path, "template.json")
+                courses_file = curriculum_registry.courses_path(curriculum)
+                template_file = curriculum_registry.template_path(curriculum)
                 
                 if os.path.exists(courses_file):
-                    with open(courses_file, 'r', encoding='utf-8') as f:
-                        courses_data = json.load(f)
+                    courses_data = curriculum_registry.load_json(courses_file)
                     
                     # Read template.json for elective requirements and core curriculum
                     elective_reqs = {}
                     core_course_codes = set()
                     
                     if os.path.exists(template_file):
-                        with open(template_file, 'r', encoding='utf-8') as f:
-                            template_data = json.load(f)
-                            elective_reqs = template_data.get('elective_requirements', {})
-                            
-                            # Extract all course codes from core_curriculum
-                            core_curriculum = template_data.get('core_curriculum', {})
-                            for year_key, year_data in core_curriculum.items():
-                                for semester_key, course_list in year_data.items():
-                                    core_course_codes.update(course_list)
+                        template_data = curriculum_registry.load_json(template_file)
+                        elective_reqs = template_data.get('elective_requirements', {})
+                        
+                        # Extract all course codes from core_curriculum
+                        core_curriculum = template_data.get('core_curriculum', {})
+                        for year_key, year_data in core_curriculum.items():
+                            for semester_key, course_list in year_data.items():
+                                core_course_codes.update(course_list)
                     
                     # Display total courses (all courses in courses.json)
                     total_courses = len(courses_data.get('industrial_engineering_courses', []))
@@ -115,9 +101,7 @@ def render_manage_page():
                     with col2:
                         if os.path.exists(template_file):
                             if st.button(f"📄 View template.json", key=f"view_template_{curriculum}"):
-                                with open(template_file, 'r', encoding='utf-8') as f:
-                                    template_data = json.load(f)
-                                st.json(template_data)
+                                st.json(curriculum_registry.load_json(template_file))
                     
                     with col3:
                         if st.button(f"🗑️ Delete", key=f"delete_{curriculum}", type="secondary"):
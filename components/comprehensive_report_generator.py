@@ -3,6 +3,7 @@ from pathlib import Path
 from typing import Dict, List, Optional
 import json
 from datetime import datetime
+from utils.gpa_ledger import GRADE_POINTS, GPALedger
 
 class ComprehensiveReportGenerator:
     """Generates comprehensive academic progress reports in HTML format."""
@@ -23,33 +24,19 @@ class ComprehensiveReportGenerator:
     
     def _calculate_gpa(self, analysis: Dict, semesters: List[Dict] = None) -> float:
         """Calculate GPA from all completed courses (same method as flow chart)."""
-        grade_points = {
-            "A": 4.0, "B+": 3.5, "B": 3.0, "C+": 2.5, "C": 2.0, 
-            "D+": 1.5, "D": 1.0, "F": 0.0
-        }
+        # Use semesters data if available (same as flow chart)
+        if semesters:
+            return GPALedger(semesters).cumulative_gpa() or 0.0
         
+        # Fallback to analysis data if semesters not available
         total_points = 0.0
         total_credits = 0
-        
-        # Use semesters data if available (same as flow chart)
-        if semesters:
-            for semester in semesters:
-                for course in semester.get("courses", []):
-                    grade = course.get("grade", "").strip()
-                    credits = course.get("credits", 0)
-                    
-                    # Skip grades that don't contribute to GPA (W, P, N, etc.)
-                    if grade in grade_points and credits > 0:
-                        total_points += grade_points[grade] * credits
-                        total_credits += credits
-        else:
-            # Fallback to analysis data if semesters not available
-            for course_data in analysis['completed_courses'].values():
-                grade = course_data.get('grade', 'F')
-                credits = course_data.get('credits', 3)
-                if grade in grade_points:
-                    total_points += grade_points[grade] * credits
-                    total_credits += credits
+        for course_data in analysis['completed_courses'].values():
+            grade = course_data.get('grade', 'F')
+            credits = course_data.get('credits', 3)
+            if grade in GRADE_POINTS:
+                total_points += GRADE_POINTS[grade] * credits
+                total_credits += credits
         
         return round(total_points / total_credits, 2) if total_credits > 0 else 0.0
     
@@ -4,10 +4,11 @@ Uses JavaScript-based interactive flowchart with SVG prerequisite lines.
 """
 
 import streamlit as st
-from typing import Dict, List
+from typing import Dict, List, Optional
 import streamlit.components.v1 as components
 from components.flow_chart_data_analyzer import FlowChartDataAnalyzer
 from components.flow_chart_html_generator import FlowChartHTMLGenerator
+from utils.compiled_curriculum import CompiledCurriculum, compile_curriculum
 
 
 class FlowChartGenerator:
@@ -242,6 +243,15 @@ class FlowChartGenerator:
         # Analyze delayed courses
         delayed_courses = self._analyze_delayed_courses(semesters, template, course_categories)
         
+        # Downstream closure of every course, restricted to the courses on the chart
+        compiled = compile_curriculum(course_categories["all_courses"], source=course_categories["all_courses"])
+        chart_mask = compiled.mask_of(
+            course_code
+            for year_data in template.get('core_curriculum', {}).values()
+            for course_codes in year_data.values()
+            for course_code in course_codes
+        )
+        
         # Generate curriculum grid HTML
         curriculum_grid_html = ""
         
@@ -257,7 +267,7 @@ class FlowChartGenerator:
             sorted_first_semester = self._sort_courses_by_prerequisites(first_semester_courses, course_categories)
             for course_code in sorted_first_semester:
                 course_html = self._generate_course_box_html(
-                    course_code, course_categories, analysis, year_num, 1
+                    course_code, course_categories, analysis, year_num, 1, compiled, chart_mask
                 )
                 first_semester_html += course_html
             
@@ -266,7 +276,7 @@ class FlowChartGenerator:
             sorted_second_semester = self._sort_courses_by_prerequisites(second_semester_courses, course_categories)
             for course_code in sorted_second_semester:
                 course_html = self._generate_course_box_html(
-                    course_code, course_categories, analysis, year_num, 2
+                    course_code, course_categories, analysis, year_num, 2, compiled, chart_mask
                 )
                 second_semester_html += course_html
             
@@ -285,7 +295,8 @@ class FlowChartGenerator:
         return complete_html, 0
     
     def _generate_course_box_html(self, course_code: str, course_categories: Dict, 
-                                  analysis: Dict, year: int, term: int) -> str:
+                                  analysis: Dict, year: int, term: int,
+                                  compiled: Optional[CompiledCurriculum] = None, chart_mask: int = 0) -> str:
         """Generate HTML for a single course box."""
         # Get course details
         course_name = "Unknown Course"
@@ -340,8 +351,14 @@ class FlowChartGenerator:
         prereq_str = " ".join(prerequisites) if prerequisites else ""
         coreq_str = " ".join(corequisites) if corequisites else ""
         
+        # Courses on the chart that depend on this one, for hover highlighting
+        downstream_str = None
+        if compiled is not None:
+            downstream_str = " ".join(compiled.codes_of(compiled.descendants_mask(course_code) & chart_mask))
+        
         return self.html_generator.generate_course_box(
-            course_code, course_name, credits, status_class, grade, year, term, prereq_str, actual_semester, coreq_str
+            course_code, course_name, credits, status_class, grade, year, term, prereq_str, actual_semester, coreq_str,
+            downstream_str
         )
 
     def generate_and_display_flow_chart(self, student_info: Dict, semesters: List[Dict], 
@@ -4,7 +4,9 @@ Uses JavaScript-based interactive flowchart with SVG prerequisite lines.
 """
 
 import json
-from typing import Dict, List
+from typing import Dict, List, Optional
+
+from utils.gpa_ledger import GPALedger
 
 
 class FlowChartHTMLGenerator:
@@ -753,6 +755,36 @@ class FlowChartHTMLGenerator:
             return 'not-enrolled';
         }
 
+        let courseBoxOrder = null;
+        
+        function getCourseBoxOrder() {
+            // Course code -> boxes with their page position, built once
+            if (courseBoxOrder === null) {
+                courseBoxOrder = new Map();
+                document.querySelectorAll('.course-box').forEach((box, index) => {
+                    if (!courseBoxOrder.has(box.dataset.code)) courseBoxOrder.set(box.dataset.code, []);
+                    courseBoxOrder.get(box.dataset.code).push({ box, index });
+                });
+            }
+            return courseBoxOrder;
+        }
+        
+        function dependentCandidates(courseCode) {
+            // Only courses downstream of this one can depend on it; the
+            // downstream closure is precomputed per box (in page order, like
+            // a full scan). Boxes without it fall back to scanning every box.
+            const courseBox = document.querySelector(`.course-box[data-code="${courseCode}"]`);
+            const downstream = courseBox ? courseBox.dataset.downstream : undefined;
+            if (downstream === undefined) return document.querySelectorAll('.course-box');
+            
+            const order = getCourseBoxOrder();
+            const candidates = [];
+            downstream.split(/\\s+/).forEach(code => {
+                if (code !== '' && order.has(code)) candidates.push(...order.get(code));
+            });
+            return candidates.sort((a, b) => a.index - b.index).map(entry => entry.box);
+        }
+        
         function highlightPrerequisitePath(element, event) {
             showTooltip(event, element);
             const code = element.dataset.code;
@@ -807,7 +839,7 @@ class FlowChartHTMLGenerator:
             }
             
             // Also check if this course is a corequisite of other courses
-            const allCourses = document.querySelectorAll('.course-box');
+            const allCourses = dependentCandidates(courseCode);
             allCourses.forEach(box => {
                 const boxCode = box.dataset.code;
                 const boxCorequisite = box.dataset.corequisite;
@@ -875,7 +907,7 @@ class FlowChartHTMLGenerator:
         }
         
         function highlightDependents(courseCode, highlightedCourses, highlightedLines, lockedColor) {
-            const allCourses = document.querySelectorAll('.course-box');
+            const allCourses = dependentCandidates(courseCode);
             
             allCourses.forEach(box => {
                 const boxCode = box.dataset.code;
@@ -1196,28 +1228,7 @@ class FlowChartHTMLGenerator:
     
     def _calculate_cumulative_gpa(self, semesters: List[Dict]) -> float:
         """Calculate cumulative GPA from all completed courses."""
-        grade_points = {
-            "A": 4.0, "B+": 3.5, "B": 3.0, "C+": 2.5, "C": 2.0, 
-            "D+": 1.5, "D": 1.0, "F": 0.0
-        }
-        
-        total_points = 0.0
-        total_credits = 0
-        
-        for semester in semesters:
-            for course in semester.get("courses", []):
-                grade = course.get("grade", "").strip()
-                credits = course.get("credits", 0)
-                
-                # Skip grades that don't contribute to GPA (W, P, N, etc.)
-                if grade in grade_points and credits > 0:
-                    total_points += grade_points[grade] * credits
-                    total_credits += credits
-        
-        # Calculate GPA
-        if total_credits > 0:
-            return round(total_points / total_credits, 2)
-        return 0.0
+        return GPALedger(semesters).cumulative_gpa() or 0.0
     
     def generate_legend_section(self) -> str:
         """Generate the legend section."""
@@ -1254,10 +1265,19 @@ class FlowChartHTMLGenerator:
     
     def generate_course_box(self, course_code: str, course_name: str, credits: int,
                            status_class: str, grade: str, year: int, term: int,
-                           prerequisite: str = "", actual_semester: str = "", corequisite: str = "") -> str:
-        """Generate HTML for a single course box."""
+                           prerequisite: str = "", actual_semester: str = "", corequisite: str = "",
+                           downstream: Optional[str] = None) -> str:
+        """
+        Generate HTML for a single course box.
+
+        Args:
+            downstream: Space-separated codes of the courses on the chart that
+                depend on this one, directly or transitively; hover
+                highlighting scans every box when it is not given
+        """
         # Don't show grade text for "Not Enrolled" courses
         grade_display = "" if grade == "Not Enrolled" else grade
+        downstream_attr = f'data-downstream="{downstream}"' if downstream is not None else ""
         
         return f"""
         <div class="course-box {status_class}" 
@@ -1270,6 +1290,7 @@ class FlowChartHTMLGenerator:
              data-year="{year}"
              data-term="{term}"
              data-actual-semester="{actual_semester}"
+             {downstream_attr}
              onmouseenter="highlightPrerequisitePath(this, event)"
              onmouseleave="clearHighlight()">
             <div class="course-box-indicator">{credits}</div>
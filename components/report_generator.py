@@ -2,7 +2,6 @@ import streamlit as st
 import json
 import tempfile
 import os
-from pathlib import Path
 from typing import Dict, List, Any, Optional
 from utils.excel_generator import create_smart_registration_excel
 from validator import CourseRegistrationValidator
@@ -23,10 +22,10 @@ class ReportGenerator:
             raise Exception(f"Error creating Excel report: {e}")
     
     def generate_text_report(self, student_info: Dict, semesters: List[Dict], 
-                           validation_results: List[Dict], course_data_path: str) -> str:
+                           validation_results: List[Dict], course_data: Dict) -> str:
         """Generate text-based validation report."""
         try:
-            validator = CourseRegistrationValidator(course_data_path)
+            validator = CourseRegistrationValidator.from_course_data(course_data)
             return validator.generate_summary_report(student_info, semesters, validation_results)
         except Exception as e:
             raise Exception(f"Error creating text report: {e}")
@@ -139,9 +138,8 @@ class ReportGenerator:
                                     validation_results: List[Dict], selected_course_data: Dict):
         """Handle text report download."""
         try:
-            course_data_path = str(Path(__file__).parent.parent / "course_data" / selected_course_data['filename'])
             report_text = self.generate_text_report(
-                student_info, semesters, validation_results, course_data_path
+                student_info, semesters, validation_results, selected_course_data['data']
             )
             
             st.download_button(
@@ -1,6 +1,10 @@
 import streamlit as st
 from typing import Dict, List, Optional
 
+# Validation states kept per session so a returning student's longer
+# transcript only needs its new semesters validated
+MAX_VALIDATION_STATES = 20
+
 
 class SessionManager:
     """Centralized manager for Streamlit session state."""
@@ -20,6 +24,7 @@ class SessionManager:
         st.session_state.setdefault("admin_mode", False)
         st.session_state.setdefault("admin_nav", "Manage Curriculums")
         st.session_state.setdefault("came_from_admin", False)
+        st.session_state.setdefault("validation_states", {})
 
 
     @staticmethod
@@ -67,6 +72,19 @@ class SessionManager:
         st.session_state.processing_complete = True
         st.session_state.last_pdf_name = pdf_name
 
+    @staticmethod
+    def get_validation_state(student_id: str):
+        return st.session_state.validation_states.get(student_id)
+
+    @staticmethod
+    def store_validation_state(student_id: str, state):
+        """Remember a student's validation state, keeping the most recent ones."""
+        states = st.session_state.validation_states
+        states.pop(student_id, None)
+        states[student_id] = state
+        while len(states) > MAX_VALIDATION_STATES:
+            states.pop(next(iter(states)))
+
     @staticmethod
     def should_reset_for_new_file(pdf_name: str) -> bool:
         return st.session_state.last_pdf_name != pdf_name
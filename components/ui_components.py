@@ -1,6 +1,7 @@
 import streamlit as st
 from typing import Dict, List, Optional, Any
 from pathlib import Path
+from utils.gpa_ledger import GPALedger, calculate_gpa
 
 
 class UIComponents:
@@ -13,12 +14,13 @@ class UIComponents:
         st.markdown("Course validation and curriculum analysis system")
     
     @staticmethod
-    def _calculate_cumulative_gpa(semesters: List[Dict]) -> Optional[float]:
+    def _calculate_cumulative_gpa(semesters: List[Dict], gpa_ledger: Optional[GPALedger] = None) -> Optional[float]:
         """
         Calculate cumulative GPA from all completed courses (same method as flow chart).
         
         Args:
             semesters: List of semester dictionaries containing course data
+            gpa_ledger: Ledger already built for these semesters, if any
             
         Returns:
             Calculated cumulative GPA, or None if no valid courses
@@ -26,28 +28,9 @@ class UIComponents:
         if not semesters:
             return None
         
-        grade_points = {
-            "A": 4.0, "B+": 3.5, "B": 3.0, "C+": 2.5, "C": 2.0, 
-            "D+": 1.5, "D": 1.0, "F": 0.0
-        }
-        
-        total_points = 0.0
-        total_credits = 0
-        
-        for semester in semesters:
-            for course in semester.get("courses", []):
-                grade = course.get("grade", "").strip()
-                credits = course.get("credits", 0)
-                
-                # Skip grades that don't contribute to GPA (W, P, N, etc.)
-                if grade in grade_points and credits > 0:
-                    total_points += grade_points[grade] * credits
-                    total_credits += credits
-        
-        # Calculate GPA
-        if total_credits > 0:
-            return round(total_points / total_credits, 2)
-        return None
+        if gpa_ledger is None:
+            gpa_ledger = GPALedger(semesters)
+        return gpa_ledger.cumulative_gpa()
     
     @staticmethod
     def _calculate_semester_gpa(courses: List[Dict]) -> Optional[float]:
@@ -63,27 +46,7 @@ class UIComponents:
         if not courses:
             return None
         
-        grade_points = {
-            "A": 4.0, "B+": 3.5, "B": 3.0, "C+": 2.5, "C": 2.0, 
-            "D+": 1.5, "D": 1.0, "F": 0.0
-        }
-        
-        total_points = 0.0
-        total_credits = 0
-        
-        for course in courses:
-            grade = course.get("grade", "").strip()
-            credits = course.get("credits", 0)
-            
-            # Skip grades that don't contribute to GPA (W, P, N, etc.)
-            if grade in grade_points and credits > 0:
-                total_points += grade_points[grade] * credits
-                total_credits += credits
-        
-        # Calculate semester GPA
-        if total_credits > 0:
-            return round(total_points / total_credits, 2)
-        return None
+        return calculate_gpa(courses)
     
     @staticmethod
     def handle_sidebar_configuration(available_course_data: Dict) -> Optional[Dict]:
@@ -196,6 +159,9 @@ class UIComponents:
                                           validation_results: List[Dict], selected_course_data: Dict = None,
                                           unidentified_courses: List[Dict] = None):
         """Display student information and validation results."""
+        # GPAs shown below all come from one ledger of this transcript
+        gpa_ledger = GPALedger(semesters)
+        
         col1, col2 = st.columns([1, 1])
         
         with col1:
@@ -205,7 +171,7 @@ class UIComponents:
             st.write(f"**Field of Study:** {student_info.get('field_of_study', 'Unknown')}")
             
             # Calculate and display cumulative GPA from semesters
-            cumulative_gpa = UIComponents._calculate_cumulative_gpa(semesters)
+            cumulative_gpa = UIComponents._calculate_cumulative_gpa(semesters, gpa_ledger)
             if cumulative_gpa is not None:
                 st.write(f"**Cumulative GPA:** {cumulative_gpa:.2f}")
             else:
@@ -291,7 +257,7 @@ class UIComponents:
 
                         
                         # Calculate and show semester GPA for all semesters
-                        semester_gpa = UIComponents._calculate_semester_gpa(courses)
+                        semester_gpa = gpa_ledger.semester_gpa(i)
                         if semester_gpa is not None and semester_gpa > 0:
                             st.info(f"📊 Semester GPA: **{semester_gpa:.2f}**")
                     else:
@@ -413,6 +379,29 @@ class UIComponents:
             st.metric("Technical Electives", f"{credit_summary.get('technical_electives', 0)}", help="Variable requirement")
             st.metric("Free Electives", f"{credit_summary.get('free_electives', 0)}", help="Variable requirement")
             
+    @staticmethod
+    def display_curriculum_comparison(fits: List, current_curriculum: str = ""):
+        """Display the fit of each curriculum, best fit first."""
+        if not fits:
+            return
+        
+        best_fit = fits[0]
+        if best_fit.curriculum == current_curriculum:
+            st.success(f"✅ {current_curriculum} is the best fit for this transcript")
+        else:
+            st.info(f"💡 Best fit: **{best_fit.curriculum}** (currently using {current_curriculum})")
+        
+        rows = []
+        for fit in fits:
+            rows.append({
+                "Curriculum": fit.curriculum + (" (current)" if fit.curriculum == current_curriculum else ""),
+                "Invalid Registrations": fit.invalid_count,
+                "Unidentified Courses": fit.unidentified_count,
+                "Credits Counted": fit.credits_counted
+            })
+        st.table(rows)
+        st.caption("Ranked by fewest invalid registrations, then fewest unidentified courses, then most credits counted.")
+    
     @staticmethod
     def display_unidentified_courses_info(unidentified_courses: List[Dict]):
         """Display information about unidentified courses grouped by semester."""
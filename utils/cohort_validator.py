@@ -0,0 +1,349 @@
+"""
+Vectorized prerequisite validation for a whole cohort.
+
+A cohort of transcripts is encoded as NumPy arrays over the curriculum's
+dense course IDs (see compiled_curriculum): the first semester each student
+passed each course, and one row per registration. Prerequisite checks for
+every registration of every student are then evaluated at once.
+
+Only outcomes that cannot depend on registration order are decided in bulk
+(withdrawn/ungraded/unknown courses, courses without prerequisites, and
+courses whose prerequisites were all passed earlier). Every other
+registration is handed to CourseRegistrationValidator.validate_course in
+transcript order, and invalidation is propagated per student only where
+something can propagate. Results are identical to
+CourseRegistrationValidator.validate_transcript.
+"""
+from typing import Dict, List
+
+import numpy as np
+
+from validator import NON_BLOCKING_PREREQUISITES, CourseRegistrationValidator
+
+PASSING_GRADES = {"A", "B+", "B", "C+", "C", "D+", "D", "P"}
+
+# Semester index used for "never passed"
+NEVER = np.iinfo(np.int32).max
+
+# Registration outcomes decided by the vectorized pass
+UNDECIDED = 0
+WITHDRAWN = 1
+NOT_GRADED = 2
+NOT_IN_CATALOG = 3
+NO_PREREQUISITES = 4
+ALL_PASSED = 5
+GROUP_PASSED = 6
+GROUP_EMPTY = 7
+
+
+class CohortMatrices:
+    """Array encoding of a cohort's registrations."""
+
+    def __init__(self, student, semester, course_id, is_withdrawn, is_ungraded, passed_first):
+        # One entry per registration, in transcript order
+        self.student = student
+        self.semester = semester
+        self.course_id = course_id
+        self.is_withdrawn = is_withdrawn
+        self.is_ungraded = is_ungraded
+        # (students x courses) first semester index with a passing grade
+        self.passed_first = passed_first
+
+
+class CohortValidator:
+    """Validates many transcripts against one curriculum."""
+
+    def __init__(self, validator: CourseRegistrationValidator):
+        """
+        Args:
+            validator: Validator for the curriculum; it is used for the
+                registrations that cannot be decided in bulk
+        """
+        self.validator = validator
+        self.compiled = validator.compiled
+        self.stats = {}
+        self._compile_rules()
+
+    def _compile_rules(self):
+        """Flatten the compiled prerequisite rules into CSR-style arrays."""
+        compiled = self.compiled
+        course_count = max(len(compiled.codes), 1)
+
+        self.in_catalog = np.zeros(course_count, dtype=bool)
+        self.has_groups = np.zeros(course_count, dtype=bool)
+        self.prereq_start = np.zeros(course_count, dtype=np.int64)
+        self.prereq_count = np.zeros(course_count, dtype=np.int64)
+        prereq_ids = []
+
+        # Groups get global IDs; each course owns a contiguous run of them
+        self.group_start = np.zeros(course_count, dtype=np.int64)
+        self.group_count = np.zeros(course_count, dtype=np.int64)
+        group_member_start = []
+        group_member_count = []
+        group_is_empty = []
+        group_concurrent_before = []
+        group_member_ids = []
+
+        for code, compiled_course in compiled.courses.items():
+            course_id = compiled.ids[code]
+            self.in_catalog[course_id] = True
+
+            if compiled_course.groups:
+                self.has_groups[course_id] = True
+                self.group_start[course_id] = len(group_is_empty)
+                self.group_count[course_id] = len(compiled_course.groups)
+                concurrent_before = False
+                for group in compiled_course.groups:
+                    group_member_start.append(len(group_member_ids))
+                    group_member_count.append(len(group.codes))
+                    group_member_ids.extend(compiled.ids[c] for c in group.codes)
+                    group_is_empty.append(not group.codes)
+                    group_concurrent_before.append(concurrent_before)
+                    concurrent_before = concurrent_before or group.concurrent_allowed
+            else:
+                self.prereq_start[course_id] = len(prereq_ids)
+                self.prereq_count[course_id] = len(compiled_course.prerequisites)
+                prereq_ids.extend(compiled.ids[c] for c in compiled_course.prerequisites)
+
+        self.prereq_ids = np.array(prereq_ids, dtype=np.int64)
+        self.group_member_start = np.array(group_member_start, dtype=np.int64)
+        self.group_member_count = np.array(group_member_count, dtype=np.int64)
+        self.group_member_ids = np.array(group_member_ids, dtype=np.int64)
+        self.group_is_empty = np.array(group_is_empty, dtype=bool)
+        self.group_concurrent_before = np.array(group_concurrent_before, dtype=bool)
+
+        # Prerequisite edges checked by rule 1 of propagate_invalidation
+        rule1_course, rule1_prereq = [], []
+        for code, compiled_course in compiled.courses.items():
+            non_blocking = NON_BLOCKING_PREREQUISITES.get(code, set())
+            for prereq_code in compiled_course.prerequisite_codes:
+                if prereq_code not in non_blocking:
+                    rule1_course.append(compiled.ids[code])
+                    rule1_prereq.append(compiled.ids[prereq_code])
+        self.rule1_start = np.zeros(course_count, dtype=np.int64)
+        self.rule1_count = np.bincount(np.array(rule1_course, dtype=np.int64),
+                                       minlength=course_count).astype(np.int64)
+        self.rule1_start[1:] = np.cumsum(self.rule1_count)[:-1]
+        order = np.argsort(np.array(rule1_course, dtype=np.int64), kind="stable")
+        self.rule1_prereq = np.array(rule1_prereq, dtype=np.int64)[order]
+
+    def encode(self, transcripts: List[List[Dict]]) -> CohortMatrices:
+        """
+        Encode a cohort as arrays.
+
+        Args:
+            transcripts: One semesters list per student
+
+        Returns:
+            CohortMatrices for the cohort
+        """
+        ids = self.compiled.ids
+        student, semester, course_id, is_withdrawn, is_ungraded = [], [], [], [], []
+        passed_student, passed_course, passed_semester = [], [], []
+
+        for student_index, semesters in enumerate(transcripts):
+            for semester_index, sem in enumerate(semesters):
+                for course in sem.get("courses", []):
+                    grade = course.get("grade")
+                    cid = ids.get(course.get("code"), -1)
+                    student.append(student_index)
+                    semester.append(semester_index)
+                    course_id.append(cid)
+                    is_withdrawn.append(grade == "W")
+                    is_ungraded.append(grade == "N")
+                    if cid >= 0 and grade in PASSING_GRADES:
+                        passed_student.append(student_index)
+                        passed_course.append(cid)
+                        passed_semester.append(semester_index)
+
+        passed_first = np.full((len(transcripts), max(len(ids), 1)), NEVER, dtype=np.int32)
+        np.minimum.at(passed_first, (np.array(passed_student, dtype=np.int64),
+                                     np.array(passed_course, dtype=np.int64)),
+                      np.array(passed_semester, dtype=np.int32))
+
+        return CohortMatrices(
+            np.array(student, dtype=np.int64),
+            np.array(semester, dtype=np.int32),
+            np.array(course_id, dtype=np.int64),
+            np.array(is_withdrawn, dtype=bool),
+            np.array(is_ungraded, dtype=bool),
+            passed_first
+        )
+
+    @staticmethod
+    def _expand(owner_start, owner_count, owners):
+        """
+        Expand CSR runs for the given owners.
+
+        Returns:
+            (owner_position, flat_index): for every element of every owner's
+            run, the position of its owner in owners and its index in the
+            flat array
+        """
+        counts = owner_count[owners]
+        owner_position = np.repeat(np.arange(len(owners)), counts)
+        run_offsets = np.cumsum(counts) - counts
+        flat_index = owner_start[owners][owner_position] + (np.arange(counts.sum()) - run_offsets[owner_position])
+        return owner_position, flat_index
+
+    def classify(self, matrices: CohortMatrices) -> np.ndarray:
+        """
+        Decide every registration whose outcome does not depend on order.
+
+        Returns:
+            Outcome code per registration (UNDECIDED for the rest)
+        """
+        m = matrices
+        outcome = np.full(len(m.course_id), UNDECIDED, dtype=np.int8)
+        catalog_id = np.where(m.course_id >= 0, m.course_id, 0)
+        known = (m.course_id >= 0) & self.in_catalog[catalog_id]
+
+        outcome[m.is_withdrawn] = WITHDRAWN
+        outcome[~m.is_withdrawn & m.is_ungraded] = NOT_GRADED
+        pending = outcome == UNDECIDED
+        outcome[pending & ~known] = NOT_IN_CATALOG
+        pending &= known
+
+        # Legacy prerequisite lists
+        legacy = np.flatnonzero(pending & ~self.has_groups[catalog_id])
+        legacy_courses = m.course_id[legacy]
+        has_prereqs = self.prereq_count[legacy_courses] > 0
+        outcome[legacy[~has_prereqs]] = NO_PREREQUISITES
+
+        checked = legacy[has_prereqs]
+        if len(checked):
+            position, flat = self._expand(self.prereq_start, self.prereq_count, m.course_id[checked])
+            edge_passed = (m.passed_first[m.student[checked][position], self.prereq_ids[flat]]
+                           < m.semester[checked][position])
+            missing = np.bincount(position, weights=~edge_passed, minlength=len(checked))
+            outcome[checked[missing == 0]] = ALL_PASSED
+
+        # Prerequisite groups: the first fully passed group decides, unless it
+        # is empty and an earlier concurrent group might have been satisfied
+        grouped = np.flatnonzero(pending & self.has_groups[catalog_id])
+        if len(grouped):
+            position, group_ids = self._expand(self.group_start, self.group_count, m.course_id[grouped])
+            member_position, member_flat = self._expand(self.group_member_start, self.group_member_count, group_ids)
+            member_passed = (m.passed_first[m.student[grouped][position][member_position],
+                                            self.group_member_ids[member_flat]]
+                             < m.semester[grouped][position][member_position])
+            missing = np.bincount(member_position, weights=~member_passed, minlength=len(group_ids))
+
+            pair_order = np.arange(len(group_ids))
+            first_passed = np.full(len(grouped), len(group_ids), dtype=np.int64)
+            np.minimum.at(first_passed, position[missing == 0], pair_order[missing == 0])
+
+            found = first_passed < len(group_ids)
+            first_group = group_ids[np.minimum(first_passed, len(group_ids) - 1)]
+            empty_first = self.group_is_empty[first_group]
+            ambiguous = empty_first & self.group_concurrent_before[first_group]
+
+            outcome[grouped[found & ~empty_first]] = GROUP_PASSED
+            outcome[grouped[found & empty_first & ~ambiguous]] = GROUP_EMPTY
+
+        return outcome
+
+    def needs_propagation(self, matrices: CohortMatrices, invalid_students: np.ndarray) -> np.ndarray:
+        """
+        Flag students for whom propagate_invalidation can change anything.
+
+        That is students with an invalid registration, or with a registration
+        whose prerequisite is withdrawn in the same semester (rule 1).
+        """
+        m = matrices
+        student_count = m.passed_first.shape[0]
+        flagged = np.zeros(student_count, dtype=bool)
+        flagged[invalid_students] = True
+
+        candidates = np.flatnonzero((m.course_id >= 0) & ~m.is_withdrawn & ~m.is_ungraded)
+        if len(candidates) and len(self.rule1_prereq):
+            position, flat = self._expand(self.rule1_start, self.rule1_count, m.course_id[candidates])
+            width = m.passed_first.shape[1]
+            semester_count = int(m.semester.max()) + 1
+            edge_keys = ((m.student[candidates][position] * semester_count
+                          + m.semester[candidates][position]) * width + self.rule1_prereq[flat])
+            withdrawn = np.flatnonzero(m.is_withdrawn & (m.course_id >= 0))
+            withdrawn_keys = (m.student[withdrawn] * semester_count + m.semester[withdrawn]) * width + m.course_id[withdrawn]
+            hits = np.isin(edge_keys, withdrawn_keys)
+            flagged[m.student[candidates][position][hits]] = True
+
+        return flagged
+
+    def validate_cohort(self, transcripts: List[List[Dict]]) -> List[List[Dict]]:
+        """
+        Validate every transcript of a cohort.
+
+        Args:
+            transcripts: One semesters list per student
+
+        Returns:
+            One list of validation results per student, identical to
+            CourseRegistrationValidator.validate_transcript
+        """
+        validator = self.validator
+        matrices = self.encode(transcripts)
+        outcome = self.classify(matrices)
+        codes = self.compiled.codes
+
+        fixed_reasons = {
+            WITHDRAWN: "Course was withdrawn",
+            NOT_GRADED: "Course not graded yet",
+            NO_PREREQUISITES: "No prerequisites required",
+            ALL_PASSED: "All prerequisites satisfied or eligible for concurrent registration",
+            GROUP_PASSED: "Prerequisite group satisfied: All prerequisites in group satisfied",
+            GROUP_EMPTY: "Prerequisite group satisfied: No prerequisites required"
+        }
+
+        cohort_results = []
+        invalid_students = []
+        scalar_count = 0
+        row = 0
+
+        for student_index, semesters in enumerate(transcripts):
+            all_results = []
+            passed_courses_history = None
+
+            for semester_index, semester in enumerate(semesters):
+                invalid_courses = set()
+
+                credit_valid, credit_reason = validator.validate_credit_limit(semester)
+                if not credit_valid:
+                    all_results.append(validator.credit_limit_result(semester, semester_index, credit_reason))
+
+                for course in semester.get("courses", []):
+                    decided = outcome[row]
+                    row += 1
+
+                    if decided == NOT_IN_CATALOG:
+                        is_valid, reason = True, f"Course {course['code']} not found in course data"
+                    elif decided != UNDECIDED:
+                        is_valid, reason = True, fixed_reasons[decided]
+                    else:
+                        scalar_count += 1
+                        if passed_courses_history is None:
+                            passed_courses_history = validator.build_passed_courses_history(semesters)
+                        is_valid, reason = validator.validate_course(
+                            course, semester_index, semesters, passed_courses_history, all_results, invalid_courses
+                        )
+
+                    all_results.append(validator.course_result(semester, semester_index, course, is_valid, reason))
+                    if not is_valid:
+                        invalid_courses.add(course.get("code", ""))
+
+                if invalid_courses:
+                    invalid_students.append(student_index)
+
+            cohort_results.append(all_results)
+
+        propagate = self.needs_propagation(matrices, np.array(invalid_students, dtype=np.int64))
+        for student_index in np.flatnonzero(propagate):
+            validator.propagate_invalidation(transcripts[student_index], cohort_results[student_index])
+
+        self.stats = {
+            "students": len(transcripts),
+            "registrations": int(len(outcome)),
+            "vectorized": int(len(outcome) - scalar_count),
+            "scalar": scalar_count,
+            "propagated_students": int(propagate.sum())
+        }
+        return cohort_results
@@ -0,0 +1,253 @@
+"""
+Compiled form of a course catalog for prerequisite checks.
+
+Every course code in a catalog (including codes that only appear as
+prerequisites) gets a dense integer ID, and each course's prerequisite list
+and prerequisite groups become integer bitmasks. Checking whether all
+prerequisites were passed is then a single AND against a bitmask of passed
+courses. The transitive closure of each course's dependencies
+(prerequisites, prerequisite groups and corequisites) is precomputed in both
+directions, so "everything upstream/downstream of a course" is a single
+lookup. Compiled curricula are immutable and cached by content
+fingerprint, so one object is shared by every validator, student and
+thread using the same courses.json.
+"""
+import hashlib
+import json
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class CompiledGroup:
+    """One prerequisite group: all courses are required, optionally concurrently."""
+
+    def __init__(self, codes: Tuple[str, ...], mask: int, concurrent_allowed: bool):
+        self.codes = codes
+        self.mask = mask
+        self.concurrent_allowed = concurrent_allowed
+
+
+class CompiledCourse:
+    """Prerequisite rules of one catalog course."""
+
+    def __init__(self, code: str, prerequisites: Tuple[str, ...], prerequisite_mask: int,
+                 groups: Tuple[CompiledGroup, ...], prerequisite_codes: Tuple[str, ...],
+                 corequisites: Tuple[str, ...] = ()):
+        self.code = code
+        # Legacy "prerequisites" list, in catalog order
+        self.prerequisites = prerequisites
+        self.prerequisite_mask = prerequisite_mask
+        # "prerequisite_groups", in catalog order (empty for legacy courses)
+        self.groups = groups
+        # Every prerequisite code from both formats, without duplicates
+        self.prerequisite_codes = prerequisite_codes
+        # "corequisites", in catalog order
+        self.corequisites = corequisites
+
+
+def _transitive_closure(direct: List[int]) -> List[int]:
+    """
+    Close a graph given as one bitmask of direct successors per ID.
+
+    Each pass ORs in the current closure of every successor, so the reach
+    doubles per pass; cycles simply stop changing anything.
+    """
+    closure = list(direct)
+    changed = True
+    while changed:
+        changed = False
+        for course_id, mask in enumerate(closure):
+            expanded = mask
+            remaining = mask
+            while remaining:
+                low_bit = remaining & -remaining
+                expanded |= closure[low_bit.bit_length() - 1]
+                remaining ^= low_bit
+            if expanded != mask:
+                closure[course_id] = expanded
+                changed = True
+    # A course on a cycle is not its own ancestor or descendant
+    return [mask & ~(1 << course_id) for course_id, mask in enumerate(closure)]
+
+
+class CompiledCurriculum:
+    """Dense course IDs, prerequisite bitmasks and dependency closures for one catalog."""
+
+    def __init__(self, all_courses: Dict[str, Dict], fingerprint: str = ""):
+        """
+        Compile a catalog.
+
+        Args:
+            all_courses: Course code to course dictionary, as built by
+                CourseRegistrationValidator
+            fingerprint: Content hash of all_courses
+        """
+        self.fingerprint = fingerprint
+        self.codes: List[str] = []
+        self.ids: Dict[str, int] = {}
+        self.courses: Dict[str, CompiledCourse] = {}
+        direct_dependencies: Dict[str, int] = {}
+
+        for code, course_info in all_courses.items():
+            self._id_for(code)
+            prerequisites = tuple(course_info.get("prerequisites") or [])
+            groups = tuple(
+                CompiledGroup(
+                    tuple(group.get("courses", [])),
+                    self._mask_for(group.get("courses", [])),
+                    bool(group.get("concurrent_allowed", False))
+                )
+                for group in course_info.get("prerequisite_groups") or []
+            )
+            prerequisite_codes = list(prerequisites)
+            for group in groups:
+                prerequisite_codes.extend(group.codes)
+            corequisites = tuple(course_info.get("corequisites") or [])
+            direct_dependencies[code] = self._mask_for(prerequisite_codes) | self._mask_for(corequisites)
+
+            self.courses[code] = CompiledCourse(
+                code,
+                prerequisites,
+                self._mask_for(prerequisites),
+                groups,
+                tuple(dict.fromkeys(prerequisite_codes)),
+                corequisites
+            )
+
+        # Direct dependencies per ID, and the reverse edges (direct dependents)
+        self.requires_masks: List[int] = [0] * len(self.codes)
+        self.required_by_masks: List[int] = [0] * len(self.codes)
+        for code, mask in direct_dependencies.items():
+            course_id = self.ids[code]
+            self.requires_masks[course_id] = mask
+            while mask:
+                low_bit = mask & -mask
+                self.required_by_masks[low_bit.bit_length() - 1] |= 1 << course_id
+                mask ^= low_bit
+
+        # Transitive closures: everything a course depends on (ancestors) and
+        # everything that depends on it (descendants)
+        self.ancestor_masks = _transitive_closure(self.requires_masks)
+        self.descendant_masks = _transitive_closure(self.required_by_masks)
+
+    def _id_for(self, code: str) -> int:
+        course_id = self.ids.get(code)
+        if course_id is None:
+            course_id = len(self.codes)
+            self.ids[code] = course_id
+            self.codes.append(code)
+        return course_id
+
+    def _mask_for(self, codes: Iterable[str]) -> int:
+        mask = 0
+        for code in codes:
+            mask |= 1 << self._id_for(code)
+        return mask
+
+    def mask_of(self, codes: Iterable[str]) -> int:
+        """
+        Build the bitmask of a set of course codes.
+
+        Codes that are not part of this curriculum are ignored, since they
+        can never satisfy a prerequisite.
+        """
+        ids = self.ids
+        mask = 0
+        for code in codes:
+            course_id = ids.get(code)
+            if course_id is not None:
+                mask |= 1 << course_id
+        return mask
+
+    def codes_of(self, mask: int) -> List[str]:
+        """Return the course codes whose bits are set in mask, in ID order."""
+        codes = []
+        while mask:
+            low_bit = mask & -mask
+            codes.append(self.codes[low_bit.bit_length() - 1])
+            mask ^= low_bit
+        return codes
+
+    def get(self, code: str) -> Optional[CompiledCourse]:
+        return self.courses.get(code)
+
+    def ancestors_mask(self, code: str) -> int:
+        """
+        Bitmask of every course a course depends on, directly or transitively.
+
+        Prerequisites, prerequisite groups and corequisites all count as
+        dependencies. Unknown codes have no ancestors.
+        """
+        course_id = self.ids.get(code)
+        return self.ancestor_masks[course_id] if course_id is not None else 0
+
+    def descendants_mask(self, code: str) -> int:
+        """Bitmask of every course depending on a course, directly or transitively."""
+        course_id = self.ids.get(code)
+        return self.descendant_masks[course_id] if course_id is not None else 0
+
+    def ancestors(self, code: str) -> List[str]:
+        """Codes of every course upstream of a course, in ID order."""
+        return self.codes_of(self.ancestors_mask(code))
+
+    def descendants(self, code: str) -> List[str]:
+        """Codes of every course downstream of a course, in ID order."""
+        return self.codes_of(self.descendants_mask(code))
+
+
+def fingerprint_courses(all_courses: Dict[str, Dict]) -> str:
+    """Content hash of a flattened course dictionary."""
+    payload = json.dumps(all_courses, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+_compiled: Dict[str, CompiledCurriculum] = {}
+_compiled_lock = threading.Lock()
+
+# Compiled curricula kept for catalogs no longer in use (edited or uploaded)
+MAX_COMPILED = 16
+
+# id(source) -> (source, fingerprint), see compile_curriculum
+_fingerprints: Dict[int, Tuple[object, str]] = {}
+
+
+def _fingerprint_for(all_courses: Dict[str, Dict], source: Optional[object]) -> str:
+    if source is None:
+        return fingerprint_courses(all_courses)
+
+    entry = _fingerprints.get(id(source))
+    if entry is not None and entry[0] is source:
+        return entry[1]
+
+    fingerprint = fingerprint_courses(all_courses)
+    with _compiled_lock:
+        if len(_fingerprints) >= MAX_COMPILED:
+            _fingerprints.clear()
+        _fingerprints[id(source)] = (source, fingerprint)
+    return fingerprint
+
+
+def compile_curriculum(all_courses: Dict[str, Dict], source: Optional[object] = None) -> CompiledCurriculum:
+    """
+    Get the compiled form of a catalog, compiling it on first use.
+
+    Args:
+        all_courses: Course code to course dictionary
+        source: Object all_courses was built from that is never modified,
+            such as a courses.json from the curriculum registry; the catalog
+            is only serialized for its fingerprint the first time it is seen
+
+    Returns:
+        Shared CompiledCurriculum for catalogs with the same content
+    """
+    fingerprint = _fingerprint_for(all_courses, source)
+    compiled = _compiled.get(fingerprint)
+    if compiled is None:
+        with _compiled_lock:
+            compiled = _compiled.get(fingerprint)
+            if compiled is None:
+                compiled = CompiledCurriculum(all_courses, fingerprint)
+                if len(_compiled) >= MAX_COMPILED:
+                    _compiled.clear()
+                _compiled[fingerprint] = compiled
+    return compiled
@@ -0,0 +1,186 @@
+"""
+Shared course classification index.
+
+Classification priority is Gen-Ed → Technical Electives → IE Core →
+technical elective prefix → Free Electives. Instead of scanning every
+category dictionary per course, the categories are flattened once into a
+code → (category, subcategory, is_identified) index, and the configurable
+technical elective prefixes go into a prefix trie. CourseAnalyzer,
+FlowChartDataAnalyzer and the Excel generator all classify through it, and
+the app and the curriculum comparison find unidentified courses with the
+same find_unidentified_courses rule.
+"""
+import threading
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from utils.curriculum_registry import curriculum_registry
+
+PREFIX_TECHNICAL = ("technical_electives", "technical", False)  # Not in database, classified by prefix
+FREE_ELECTIVE = ("free_electives", "free", False)  # Not identified in database
+
+
+class PrefixTrie:
+    """Character trie answering "does this code start with any of the prefixes"."""
+
+    def __init__(self, prefixes: Iterable[str] = ()):
+        self.root: Dict = {}
+        self.empty = False
+        for prefix in prefixes:
+            self.add(prefix)
+
+    def add(self, prefix: str) -> None:
+        prefix = prefix.upper()
+        if not prefix:
+            # Every code starts with the empty prefix
+            self.empty = True
+            return
+        node = self.root
+        for char in prefix:
+            node = node.setdefault(char, {})
+        node[None] = True
+
+    def matches(self, code: str) -> bool:
+        if self.empty:
+            return True
+        node = self.root
+        for char in code:
+            node = node.get(char)
+            if node is None:
+                return False
+            if None in node:
+                return True
+        return False
+
+
+class CourseClassifier:
+    """Constant-time course classification for one set of course categories."""
+
+    def __init__(self, course_categories: Dict, technical_prefixes: Iterable[str] = ()):
+        """
+        Build the index.
+
+        Args:
+            course_categories: Categories from CurriculumRegistry.course_categories()
+            technical_prefixes: Technical elective code prefixes
+        """
+        self.course_categories = course_categories
+        self.technical_prefixes = tuple(technical_prefixes)
+        self.prefix_trie = PrefixTrie(self.technical_prefixes)
+
+        # Fill from lowest to highest priority so higher priorities overwrite
+        self.index: Dict[str, Tuple[str, str, bool]] = {}
+        for code in course_categories.get("ie_core", {}):
+            self.index[code] = ("ie_core", "core", True)
+        for code in course_categories.get("technical_electives", {}):
+            self.index[code] = ("technical_electives", "technical", True)
+        for subcategory, courses in reversed(list(course_categories.get("gen_ed", {}).items())):
+            for code in courses:
+                self.index[code] = ("gen_ed", subcategory, True)
+
+    def classify(self, course_code: str) -> Tuple[str, str, bool]:
+        """
+        Classify a course.
+
+        Returns:
+            Tuple of (category, subcategory, is_identified)
+        """
+        code = course_code.upper()
+        classification = self.index.get(code)
+        if classification is not None:
+            return classification
+        if self.prefix_trie.matches(code):
+            return PREFIX_TECHNICAL
+        return FREE_ELECTIVE
+
+    def has_technical_prefix(self, course_code: str) -> bool:
+        return self.prefix_trie.matches(course_code.upper())
+
+
+_classifiers: Dict[int, CourseClassifier] = {}
+_classifiers_lock = threading.Lock()
+
+# Classifiers kept for category dictionaries no longer in use
+MAX_CLASSIFIERS = 16
+
+
+def get_course_classifier(course_categories: Optional[Dict] = None,
+                          technical_prefixes: Optional[Iterable[str]] = None) -> CourseClassifier:
+    """
+    Get the classifier for a set of course categories, building it on first use.
+
+    Categories from the curriculum registry are shared objects, so each one
+    is indexed once and reused until the underlying files change.
+
+    Args:
+        course_categories: Course categories (default: every curriculum)
+        technical_prefixes: Technical elective prefixes (default: from
+            technical_elective_config.json)
+
+    Returns:
+        Shared CourseClassifier
+    """
+    if course_categories is None:
+        course_categories = curriculum_registry.course_categories()
+    prefixes = tuple(technical_prefixes if technical_prefixes is not None
+                     else curriculum_registry.technical_elective_prefixes())
+
+    classifier = _classifiers.get(id(course_categories))
+    if (classifier is not None and classifier.course_categories is course_categories
+            and classifier.technical_prefixes == prefixes):
+        return classifier
+
+    classifier = CourseClassifier(course_categories, prefixes)
+    with _classifiers_lock:
+        if len(_classifiers) >= MAX_CLASSIFIERS:
+            _classifiers.clear()
+        _classifiers[id(course_categories)] = classifier
+    return classifier
+
+
+def template_course_codes(template: Optional[Dict]) -> Set[str]:
+    """Course codes of a curriculum template's core curriculum (the mandatory courses)."""
+    template_courses = set()
+    if template:
+        for year_data in template.get('core_curriculum', {}).values():
+            for course_codes in year_data.values():
+                template_courses.update(course_codes)
+    return template_courses
+
+
+def find_unidentified_courses(semesters: List[Dict], classifier: CourseClassifier,
+                              template: Optional[Dict] = None) -> List[Dict]:
+    """
+    Find the registrations of truly unidentified courses.
+
+    Courses in the template are mandatory courses, courses with a technical
+    elective prefix are technical electives, and courses in the database are
+    classified; only the remaining courses are unidentified.
+
+    Args:
+        semesters: List of all semesters
+        classifier: Classifier from get_course_classifier()
+        template: Curriculum template (template.json content)
+
+    Returns:
+        One dictionary (code, name, semester, credits, grade) per registration
+    """
+    template_courses = template_course_codes(template)
+
+    unidentified_courses = []
+    for semester in semesters:
+        for course in semester.get("courses", []):
+            course_code = course.get("code", "")
+            if not course_code or course_code in template_courses:
+                continue
+            if classifier.has_technical_prefix(course_code):
+                continue
+            _, _, is_identified = classifier.classify(course_code)
+            if not is_identified:
+                unidentified_courses.append({
+                    "code": course_code,
+                    "name": course.get("name", ""),
+                    "semester": semester.get("semester", ""),
+                    "credits": course.get("credits", 0),
+                    "grade": course.get("grade", "")
+                })
+    return unidentified_courses
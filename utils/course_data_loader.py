@@ -1,6 +1,6 @@
-import json
 from pathlib import Path
 from .curriculum_selector import get_curriculum_for_student_id, get_available_curricula
+from .curriculum_registry import curriculum_registry
 
 def load_comprehensive_course_data():
     """
@@ -21,8 +21,7 @@ def load_comprehensive_course_data():
             
             if courses_file.exists():
                 try:
-                    with open(courses_file, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
+                    data = curriculum_registry.load_json(courses_file)
                     
                     # Validate that the file contains course data
                     has_courses = (
@@ -79,8 +78,7 @@ def load_curriculum_data(curriculum_name: str = None, student_id: str = None):
     # Load courses
     if courses_file.exists():
         try:
-            with open(courses_file, 'r', encoding='utf-8') as f:
-                result['courses'] = json.load(f)
+            result['courses'] = curriculum_registry.load_json(courses_file)
         except Exception as e:
             result['error'] = f"Error loading courses: {e}"
     else:
@@ -89,8 +87,7 @@ def load_curriculum_data(curriculum_name: str = None, student_id: str = None):
     # Load template
     if template_file.exists():
         try:
-            with open(template_file, 'r', encoding='utf-8') as f:
-                result['template'] = json.load(f)
+            result['template'] = curriculum_registry.load_json(template_file)
         except Exception as e:
             result['error'] = f"Error loading template: {e}"
     else:
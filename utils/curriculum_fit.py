@@ -0,0 +1,137 @@
+"""
+Validate one transcript against several curricula and rank how well each fits.
+
+The transcript index and passed-course history do not depend on the
+curriculum, so they are built once and shared by every curriculum's
+validator. Students near a curriculum boundary (e.g. IDs 64/65) can then be
+compared across curricula in one pass instead of one full run per curriculum.
+"""
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from utils.course_classifier import CourseClassifier, find_unidentified_courses, get_course_classifier
+from utils.curriculum_registry import curriculum_registry
+from validator import CourseRegistrationValidator, TranscriptIndex
+
+# Grades whose credits count toward graduation (same as the credit summary)
+COUNTED_GRADES = {"A", "B+", "B", "C+", "C", "D+", "D"}
+
+
+class CurriculumFit:
+    """Validation results of a transcript against one curriculum, with its fit score."""
+
+    def __init__(self, curriculum: str, validation_results: List[Dict], invalid_count: int,
+                 unidentified_count: int, credits_counted: int):
+        self.curriculum = curriculum
+        self.validation_results = validation_results
+        # Invalid registrations (credit limit warnings excluded)
+        self.invalid_count = invalid_count
+        # Registrations of courses this curriculum cannot identify
+        self.unidentified_count = unidentified_count
+        # Credits of valid, passed and identified courses
+        self.credits_counted = credits_counted
+
+    @property
+    def score(self) -> Tuple[int, int, int]:
+        """Sort key: fewer invalid, then fewer unidentified, then more credits counted."""
+        return (self.invalid_count, self.unidentified_count, -self.credits_counted)
+
+    def to_dict(self) -> Dict:
+        return {
+            "curriculum": self.curriculum,
+            "invalid_count": self.invalid_count,
+            "unidentified_count": self.unidentified_count,
+            "credits_counted": self.credits_counted
+        }
+
+
+def score_curriculum(curriculum: str, semesters: List[Dict], validation_results: List[Dict],
+                     classifier: CourseClassifier, template: Optional[Dict] = None) -> CurriculumFit:
+    """
+    Compute the fit score of a curriculum from its validation results.
+
+    Unidentified courses are found with find_unidentified_courses, the rule
+    the app shows for the selected curriculum, so the comparison and the main
+    view report the same numbers.
+
+    Args:
+        curriculum: Curriculum name (e.g. "B-IE-2565")
+        semesters: List of all semesters
+        validation_results: Results of validating semesters against the curriculum
+        classifier: Course classifier (see get_course_classifier)
+        template: The curriculum's template.json content
+
+    Returns:
+        CurriculumFit for the curriculum
+    """
+    invalid_count = 0
+    invalid_registrations = set()
+    for result in validation_results:
+        if result.get("course_code") != "CREDIT_LIMIT" and not result.get("is_valid", True):
+            invalid_count += 1
+            invalid_registrations.add((result.get("semester_index"), result.get("course_code")))
+
+    unidentified_courses = find_unidentified_courses(semesters, classifier, template)
+    unidentified_codes = {course["code"] for course in unidentified_courses}
+
+    counted = set()
+    credits_counted = 0
+    for semester_index, semester in enumerate(semesters):
+        for course in semester.get("courses", []):
+            code = course.get("code", "")
+            if not code or code in unidentified_codes:
+                continue
+            if (course.get("grade") in COUNTED_GRADES
+                    and (semester_index, code) not in invalid_registrations
+                    and code not in counted):
+                counted.add(code)
+                credits_counted += course.get("credits", 0) or 0
+
+    return CurriculumFit(curriculum, validation_results, invalid_count, len(unidentified_courses), credits_counted)
+
+
+def validate_against_curricula(semesters: List[Dict], curricula: Dict[str, Dict],
+                               course_categories: Optional[Dict] = None,
+                               technical_prefixes: Optional[Iterable[str]] = None,
+                               templates: Optional[Dict[str, Dict]] = None,
+                               validators: Optional[Dict[str, CourseRegistrationValidator]] = None) -> List[CurriculumFit]:
+    """
+    Validate a transcript against every given curriculum in one pass.
+
+    Args:
+        semesters: List of all semesters
+        curricula: Curriculum name to courses.json content
+        course_categories: Course categories to classify with (default: every
+            curriculum, as in CourseAnalyzer)
+        technical_prefixes: Technical elective code prefixes (default: from
+            technical_elective_config.json)
+        templates: Curriculum name to template.json content (default: each
+            curriculum's template from the curriculum registry)
+        validators: Already built validators by curriculum name, reused
+            instead of building new ones
+
+    Returns:
+        One CurriculumFit per curriculum, best fit first
+    """
+    classifier = get_course_classifier(course_categories, technical_prefixes)
+    templates = templates or {}
+    validators = validators or {}
+
+    # Curriculum independent, so shared by every validator below
+    transcript_index = TranscriptIndex(semesters)
+    passed_courses_history = None
+
+    fits = []
+    for curriculum, course_data in curricula.items():
+        validator = validators.get(curriculum) or CourseRegistrationValidator.from_course_data(course_data)
+        if passed_courses_history is None:
+            passed_courses_history = validator.build_passed_courses_history(semesters)
+
+        template = templates.get(curriculum)
+        if template is None:
+            template = curriculum_registry.load_optional(curriculum_registry.template_path(curriculum))
+
+        validation_results = validator.validate_indexed_transcript(transcript_index, passed_courses_history)
+        fits.append(score_curriculum(curriculum, semesters, validation_results, classifier, template))
+
+    fits.sort(key=lambda fit: fit.score)
+    return fits
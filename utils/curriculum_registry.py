@@ -0,0 +1,237 @@
+"""
+Process-wide registry of the course_data JSON files.
+
+Every courses.json, template.json, gen_ed_courses.json and configuration file
+is parsed once and shared by all callers, threads and Streamlit reruns. A
+file is only read again when its mtime (or size) changes, and only parsed
+again when its content hash changes too, so saving an unchanged file keeps
+the existing objects. The parsed data is shared: callers must treat it as
+read-only, and copy it (copy.deepcopy) before changing anything. Writers
+such as the admin upload page write the JSON file instead, which the
+registry picks up on the next access.
+"""
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+logger = logging.getLogger("curriculum_registry")
+
+COURSE_DATA_DIR = Path(__file__).parent.parent / "course_data"
+
+# Gen-Ed subcategories used for course classification
+GEN_ED_SUBCATEGORIES = (
+    "wellness",
+    "wellness_PE",
+    "entrepreneurship",
+    "language_communication_thai",
+    "language_communication_foreigner",
+    "language_communication_computer",
+    "thai_citizen_global",
+    "aesthetics"
+)
+
+
+def build_course_categories(curriculum_data: List[Dict], gen_ed_data: Optional[Dict]) -> Dict:
+    """
+    Build the course classification dictionary.
+
+    Args:
+        curriculum_data: courses.json contents, highest priority first (a code
+            keeps the category of the first curriculum that lists it)
+        gen_ed_data: gen_ed_courses.json contents
+
+    Returns:
+        Dictionary with "ie_core", "technical_electives", "gen_ed" (by
+        subcategory) and "all_courses", each mapping course codes to courses
+    """
+    categories = {
+        "ie_core": {},
+        "technical_electives": {},
+        "gen_ed": {subcategory: {} for subcategory in GEN_ED_SUBCATEGORIES},
+        "all_courses": {}
+    }
+
+    for ie_data in curriculum_data:
+        for course in ie_data.get("industrial_engineering_courses", []):
+            if course["code"] not in categories["all_courses"]:
+                if course.get("technical_electives", False):
+                    categories["technical_electives"][course["code"]] = course
+                else:
+                    categories["ie_core"][course["code"]] = course
+                categories["all_courses"][course["code"]] = course
+
+        for course in ie_data.get("other_related_courses", []):
+            if course["code"] not in categories["all_courses"]:
+                categories["ie_core"][course["code"]] = course
+                categories["all_courses"][course["code"]] = course
+
+    if gen_ed_data:
+        # Handle all gen_ed subcategories dynamically
+        for subcategory, courses_list in gen_ed_data.get("gen_ed_courses", {}).items():
+            if subcategory in categories["gen_ed"]:
+                for course in courses_list:
+                    categories["gen_ed"][subcategory][course["code"]] = course
+                    categories["all_courses"][course["code"]] = course
+
+    return categories
+
+
+class CurriculumRegistry:
+    """Thread-safe cache of parsed course data files."""
+
+    def __init__(self, course_data_dir: Optional[Union[str, Path]] = None):
+        """
+        Initialize the registry.
+
+        Args:
+            course_data_dir: Directory with the curriculum folders (default: course_data/)
+        """
+        self.course_data_dir = Path(course_data_dir) if course_data_dir else COURSE_DATA_DIR
+        self._lock = threading.RLock()
+        # Path -> (mtime_ns, size, sha256, parsed data)
+        self._files: Dict[str, Tuple[int, int, str, object]] = {}
+        # Curriculum (None for all) -> (source objects, categories)
+        self._categories: Dict[Optional[str], Tuple[Tuple[object, ...], Dict]] = {}
+
+    def load_json(self, path: Union[str, Path]):
+        """
+        Get the parsed content of a JSON file, parsing it only when it changed.
+
+        Args:
+            path: Path of the JSON file
+
+        Returns:
+            Parsed JSON (shared, do not modify)
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+            json.JSONDecodeError: If the file is not valid JSON
+        """
+        key = os.path.abspath(str(path))
+        with self._lock:
+            try:
+                stat = Path(path).stat()
+            except FileNotFoundError:
+                self._files.pop(key, None)
+                raise
+
+            entry = self._files.get(key)
+            if entry is not None and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+                return entry[3]
+
+            with open(path, 'rb') as f:
+                raw = f.read()
+            digest = hashlib.sha256(raw).hexdigest()
+
+            if entry is not None and entry[2] == digest:
+                # Touched but unchanged: keep the parsed objects
+                data = entry[3]
+            else:
+                data = json.loads(raw.decode('utf-8'))
+                logger.debug(f"Parsed {key}")
+
+            self._files[key] = (stat.st_mtime_ns, stat.st_size, digest, data)
+            return data
+
+    def load_optional(self, path: Path):
+        """Parsed content of a JSON file, or None if it is missing or invalid."""
+        if not path.exists():
+            return None
+        try:
+            return self.load_json(path)
+        except Exception as e:
+            logger.error(f"Error loading {path}: {e}")
+            return None
+
+    def curricula(self) -> List[str]:
+        """Names of the curriculum folders (B-IE-*), sorted."""
+        if not self.course_data_dir.exists():
+            return []
+        return sorted(
+            item.name for item in self.course_data_dir.iterdir()
+            if item.is_dir() and item.name.startswith("B-IE-")
+        )
+
+    def courses_path(self, curriculum: str) -> Path:
+        return self.course_data_dir / curriculum / "courses.json"
+
+    def template_path(self, curriculum: str) -> Path:
+        return self.course_data_dir / curriculum / "template.json"
+
+    def courses(self, curriculum: str) -> Dict:
+        """
+        Get a curriculum's courses.json content.
+
+        Raises:
+            FileNotFoundError: If the curriculum has no courses.json
+            json.JSONDecodeError: If courses.json is not valid JSON
+        """
+        return self.load_json(self.courses_path(curriculum))
+
+    def template(self, curriculum: str) -> Dict:
+        """
+        Get a curriculum's template.json content.
+
+        Raises:
+            FileNotFoundError: If the curriculum has no template.json
+            json.JSONDecodeError: If template.json is not valid JSON
+        """
+        return self.load_json(self.template_path(curriculum))
+
+    def gen_ed(self) -> Optional[Dict]:
+        """gen_ed_courses.json content, or None if it is missing or invalid."""
+        return self.load_optional(self.course_data_dir / "gen_ed_courses.json")
+
+    def technical_elective_prefixes(self) -> List[str]:
+        """Technical elective prefixes from technical_elective_config.json (default ["01206"])."""
+        config = self.load_optional(self.course_data_dir / "technical_elective_config.json")
+        if config:
+            return config.get("technical_elective_prefixes", ["01206"])
+        return ["01206"]
+
+    def course_categories(self, curriculum: Optional[str] = None) -> Dict:
+        """
+        Get the course classification dictionary (see build_course_categories).
+
+        Args:
+            curriculum: Only classify with this curriculum's courses; by
+                default every curriculum is used, newest first
+
+        Returns:
+            Course categories (shared, do not modify), rebuilt only when one
+            of the underlying files changed
+        """
+        if curriculum is not None:
+            names = [curriculum]
+        else:
+            years = []
+            for name in self.curricula():
+                year_match = re.search(r'B-IE-(\d{4})', name)
+                if year_match:
+                    years.append((int(year_match.group(1)), name))
+            years.sort(key=lambda x: x[0], reverse=True)
+            names = [name for _, name in years]
+
+        sources = [data for data in (self.load_optional(self.courses_path(name)) for name in names) if data]
+        gen_ed_data = self.gen_ed()
+        # Compared by identity: files are only parsed again when they change
+        source_objects = tuple(sources) + (gen_ed_data,)
+
+        with self._lock:
+            cached = self._categories.get(curriculum)
+            if (cached is not None and len(cached[0]) == len(source_objects)
+                    and all(a is b for a, b in zip(cached[0], source_objects))):
+                return cached[1]
+
+            categories = build_course_categories(sources, gen_ed_data)
+            self._categories[curriculum] = (source_objects, categories)
+            return categories
+
+
+# Shared by every module of the app
+curriculum_registry = CurriculumRegistry()
@@ -1,8 +1,117 @@
 """
 Utility for automatic curriculum selection based on student ID
 """
+from bisect import bisect_left
 from pathlib import Path
-import os
+from typing import Dict, Iterable, List, Optional
+import threading
+
+COURSE_DATA_DIR = Path(__file__).parent.parent / "course_data"
+
+
+class CurriculumIndex:
+    """
+    Sorted cohort intervals of the available curricula.
+
+    Each curriculum B-IE-25XX covers student IDs starting with XX to XX+4.
+    Intervals are kept sorted by start year, so a lookup is a binary search.
+    """
+
+    def __init__(self, curricula: List[str]):
+        """
+        Build the index.
+
+        Args:
+            curricula: Curriculum folder names, sorted
+        """
+        self.curricula = curricula
+
+        # Extract curriculum start years (e.g., B-IE-2565 -> 65)
+        curriculum_years = []
+        for name in curricula:
+            try:
+                be_year = int(name.split("-")[-1])   # 2565
+                start_year = be_year - 2500          # 65
+                curriculum_years.append((start_year, name))
+            except ValueError:
+                continue
+        curriculum_years.sort()
+
+        self.start_years = [start_year for start_year, _ in curriculum_years]
+        self.names = [name for _, name in curriculum_years]
+
+    @property
+    def newest(self) -> str:
+        """Newest curriculum (highest version number)"""
+        return self.curricula[-1] if self.curricula else "B-IE-2565"
+
+    @property
+    def oldest(self) -> str:
+        """Oldest curriculum (lowest version number)"""
+        return self.curricula[0] if self.curricula else "B-IE-2560"
+
+    def lookup(self, student_id: str) -> str:
+        """Curriculum for a student ID (see get_curriculum_for_student_id)."""
+        # fallback: newest curriculum
+        if not student_id or len(student_id) < 2:
+            return self.newest
+
+        try:
+            student_year = int(student_id[:2])
+        except (ValueError, IndexError):
+            return self.newest
+
+        if not self.start_years:
+            return self.newest
+
+        # Match 5-year window: the earliest curriculum starting at most 4
+        # years before the student's year
+        position = bisect_left(self.start_years, student_year - 4)
+        if position < len(self.start_years) and self.start_years[position] <= student_year:
+            return self.names[position]
+
+        # Older than oldest curriculum
+        if student_year < self.start_years[0]:
+            return self.oldest
+
+        # Newer than newest curriculum
+        return self.newest
+
+
+_index: Optional[CurriculumIndex] = None
+_index_key = None
+_index_lock = threading.Lock()
+
+
+def get_curriculum_index() -> CurriculumIndex:
+    """
+    Get the curriculum index, rebuilding it only when the curriculum set changes.
+
+    Adding or removing a curriculum folder changes the course_data
+    directory's mtime, so the folder is only listed again after that.
+    """
+    global _index, _index_key
+    try:
+        stat = COURSE_DATA_DIR.stat()
+        key = (stat.st_mtime_ns, stat.st_ino)
+    except FileNotFoundError:
+        key = None
+
+    index = _index
+    if index is not None and _index_key == key:
+        return index
+
+    with _index_lock:
+        if _index is None or _index_key != key:
+            curricula = []
+            if key is not None:
+                for item in COURSE_DATA_DIR.iterdir():
+                    if item.is_dir() and item.name.startswith("B-IE-"):
+                        curricula.append(item.name)
+            _index = CurriculumIndex(sorted(curricula))
+            _index_key = key
+        return _index
+
 
 def get_curriculum_for_student_id(student_id: str) -> str:
     """
@@ -13,68 +122,44 @@ def get_curriculum_for_student_id(student_id: str) -> str:
         - 65–69 -> B-IE-2565
         - ...
     """
-    # fallback: newest curriculum
-    if not student_id or len(student_id) < 2:
-        return get_newest_curriculum()
+    return get_curriculum_index().lookup(student_id)
 
-    try:
-        student_year = int(student_id[:2])
-    except (ValueError, IndexError):
-        return get_newest_curriculum()
 
-    curricula = get_available_curricula()
-    if not curricula:
-        return get_newest_curriculum()
-
-    # Extract curriculum start years (e.g., B-IE-2565 -> 65)
-    curriculum_years = []
-    for name in curricula:
-        try:
-            be_year = int(name.split("-")[-1])   # 2565
-            start_year = be_year - 2500          # 65
-            curriculum_years.append((start_year, name))
-        except ValueError:
-            continue
-
-    if not curriculum_years:
-        return get_newest_curriculum()
-
-    # Match 5-year window
-    for start_year, name in sorted(curriculum_years):
-        if start_year <= student_year <= start_year + 4:
-            return name
+def resolve_curricula(student_ids: Iterable[str]) -> Dict[str, str]:
+    """
+    Auto-select curricula for many student IDs at once (e.g. batch routing).
 
-    # Older than oldest curriculum
-    if student_year < min(y for y, _ in curriculum_years):
-        return get_oldest_curriculum()
+    Args:
+        student_ids: Student IDs
 
-    # Newer than newest curriculum
-    return get_newest_curriculum()
+    Returns:
+        Dictionary of student ID to curriculum name
+    """
+    index = get_curriculum_index()
+    by_prefix = {}
+    resolved = {}
+    for student_id in student_ids:
+        # Only the first 2 digits decide the curriculum
+        key = student_id[:2] if student_id and len(student_id) >= 2 else student_id
+        if key not in by_prefix:
+            by_prefix[key] = index.lookup(student_id)
+        resolved[student_id] = by_prefix[key]
+    return resolved
 
 
 def get_available_curricula() -> list:
     """Get list of available curriculum folders"""
-    course_data_dir = Path(__file__).parent.parent / "course_data"
-    curricula = []
-    
-    for item in course_data_dir.iterdir():
-        if item.is_dir() and item.name.startswith("B-IE-"):
-            curricula.append(item.name)
-    
-    return sorted(curricula)
+    return list(get_curriculum_index().curricula)
 
 def get_newest_curriculum() -> str:
     """Get the newest curriculum (highest version number)"""
-    curricula = get_available_curricula()
-    return curricula[-1] if curricula else "B-IE-2565"
+    return get_curriculum_index().newest
 
 def get_oldest_curriculum() -> str:
     """Get the oldest curriculum (lowest version number)"""
-    curricula = get_available_curricula()
-    return curricula[0] if curricula else "B-IE-2560"
+    return get_curriculum_index().oldest
 
 def curriculum_exists(curriculum_name: str) -> bool:
     """Check if a curriculum folder exists"""
-    course_data_dir = Path(__file__).parent.parent / "course_data"
-    curriculum_path = course_data_dir / curriculum_name
-    return curriculum_path.exists() and curriculum_path.is_dir()
\ No newline at end of file
+    curriculum_path = COURSE_DATA_DIR / curriculum_name
+    return curriculum_path.exists() and curriculum_path.is_dir()
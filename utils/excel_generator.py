@@ -1,110 +1,22 @@
 import tempfile
 import os
-import json
-from pathlib import Path
-import re
+from utils.course_classifier import get_course_classifier
+from utils.curriculum_registry import curriculum_registry
 
 def load_course_categories():
-    """FUTURE-PROOF VERSION: Load course categories from separate JSON files."""
-    course_data_dir = Path(__file__).parent.parent / "course_data"
-    
-    categories = {
-        "ie_core": {},
-        "technical_electives": {},
-        "gen_ed": {
-            "wellness": {},
-            "wellness_PE": {},
-            "entrepreneurship": {},
-            "language_communication_thai": {},
-            "language_communication_foreigner": {},
-            "language_communication_computer": {},
-            "thai_citizen_global": {},
-            "aesthetics": {}
-        },
-        "all_courses": {}
-    }
-    
-    # FUTURE-PROOF: Find all B-IE files dynamically
-    ie_files = []
-    if course_data_dir.exists():
-        for json_file in course_data_dir.glob("B-IE-*.json"):
-            year_match = re.search(r'B-IE-(\d{4})\.json', json_file.name)
-            if year_match:
-                year = int(year_match.group(1))
-                ie_files.append((year, json_file))
-    
-    # Sort by year (newest first) and process
-    ie_files.sort(key=lambda x: x[0], reverse=True)
-    
-    # Load IE Core courses from available B-IE files
-    for year, ie_file in ie_files:
-        try:
-            with open(ie_file, 'r', encoding='utf-8') as f:
-                ie_data = json.load(f)
-                
-                # Process industrial_engineering_courses
-                for course in ie_data.get("industrial_engineering_courses", []):
-                    if course["code"] not in categories["all_courses"]:
-                        if course.get("technical_electives", False):
-                            categories["technical_electives"][course["code"]] = course
-                        else:
-                            categories["ie_core"][course["code"]] = course
-                        categories["all_courses"][course["code"]] = course
-                
-                # Process other_related_courses
-                for course in ie_data.get("other_related_courses", []):
-                    if course["code"] not in categories["all_courses"]:
-                        categories["ie_core"][course["code"]] = course  
-                        categories["all_courses"][course["code"]] = course
-                        
-        except Exception as e:
-            print(f"Error loading {ie_file}: {e}")
-            continue
-    
-    # Load Gen-Ed courses (unchanged)
-    gen_ed_file = course_data_dir / "gen_ed_courses.json"
-    if gen_ed_file.exists():
-        try:
-            with open(gen_ed_file, 'r', encoding='utf-8') as f:
-                gen_ed_data = json.load(f)
-                gen_ed_courses = gen_ed_data.get("gen_ed_courses", {})
-                # Handle all gen_ed subcategories dynamically
-                for subcategory, courses_list in gen_ed_courses.items():
-                    if subcategory in categories["gen_ed"]:
-                        for course in courses_list:
-                            categories["gen_ed"][subcategory][course["code"]] = course
-                            categories["all_courses"][course["code"]] = course
-        except Exception as e:
-            print(f"Error loading gen_ed_courses.json: {e}")
-    
-    return categories
+    """Load course categories of every curriculum from the shared registry."""
+    return curriculum_registry.course_categories()
 
 def classify_course(course_code, course_name="", course_categories=None):
     """
     Classify course into appropriate category using loaded JSON files.
-    PRIORITY ORDER: Gen-Ed → Technical Electives → IE Core → Free Electives
+    PRIORITY ORDER: Gen-Ed → Technical Electives → IE Core → Technical Elective Prefix → Free Electives
     Returns: (category, subcategory, is_identified)
     """
     if course_categories is None:
         course_categories = load_course_categories()
     
-    code = course_code.upper()
-    
-    # PRIORITY 1: Check Gen-Ed courses FIRST (highest priority)
-    for subcategory, courses in course_categories["gen_ed"].items():
-        if code in courses:
-            return ("gen_ed", subcategory, True)
-    
-    # PRIORITY 2: Check Technical Electives
-    if code in course_categories["technical_electives"]:
-        return ("technical_electives", "technical", True)
-    
-    # PRIORITY 3: Check IE Core courses
-    if code in course_categories["ie_core"]:
-        return ("ie_core", "core", True)
-    
-    # PRIORITY 4: Everything else is free elective (not in our database)
-    return ("free_electives", "free", False)  # False = not identified in database
+    return get_course_classifier(course_categories).classify(course_code)
 
 def create_smart_registration_excel(student_info, semesters, validation_results):
     """
@@ -0,0 +1,151 @@
+"""
+On-disk cache of transcript extraction results.
+
+Entries are keyed by the SHA-256 of the uploaded PDF bytes, the PDF text
+backend and the parser version, so re-uploading the same file skips PDF
+decoding and parsing. Extraction limits only reject documents and never
+change the extracted text, so they are not part of the key.
+"""
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .pdf_backends import DEFAULT_BACKEND
+from .pdf_extractor import PARSER_VERSION
+
+logger = logging.getLogger("extraction_cache")
+
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent / "cache" / "pdf_extraction"
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024
+
+
+class ExtractionCache:
+    """Size-capped LRU cache of (student_info, semesters)."""
+
+    def __init__(self, cache_dir=None, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding cache entries (created on first write)
+            max_bytes: Total size of entries kept before the least recently
+                used ones are evicted
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    def key_for(self, pdf_bytes: bytes, backend: Optional[str] = None) -> str:
+        """
+        Build the cache key for the given PDF bytes.
+
+        Args:
+            pdf_bytes: Raw PDF file content
+            backend: Name of the PDF text backend used for extraction
+                (defaults to DEFAULT_BACKEND)
+        """
+        digest = hashlib.sha256(pdf_bytes).hexdigest()
+        return f"{digest}-{backend or DEFAULT_BACKEND}-p{PARSER_VERSION}"
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Tuple[Dict, List[Dict]]]:
+        """
+        Look up a cached extraction result.
+
+        Args:
+            key: Key from key_for()
+
+        Returns:
+            Tuple of (student_info, semesters), or None on a miss
+        """
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            # Mark as recently used for LRU eviction
+            os.utime(entry_path)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Discarding unreadable cache entry {entry_path}: {e}")
+            self._remove(entry_path)
+            return None
+
+        return entry["student_info"], entry["semesters"]
+
+    def put(self, key: str, student_info: Dict, semesters: List[Dict]) -> None:
+        """
+        Store an extraction result and evict old entries if over the size cap.
+
+        Args:
+            key: Key from key_for()
+            student_info: Parsed student information
+            semesters: Parsed semesters
+        """
+        entry = {
+            "parser_version": PARSER_VERSION,
+            "student_info": student_info,
+            "semesters": semesters
+        }
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write to a temp file first so readers never see a partial entry
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        except OSError as e:
+            logger.warning(f"Could not write extraction cache entry: {e}")
+            return
+
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp_path, self._entry_path(key))
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Could not write extraction cache entry: {e}")
+            self._remove(Path(tmp_path))
+            return
+        except BaseException:
+            self._remove(Path(tmp_path))
+            raise
+
+        self._evict()
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until the cache fits max_bytes."""
+        with self._lock:
+            entries = []
+            total_size = 0
+            for entry_path in self.cache_dir.glob("*.json"):
+                try:
+                    stat = entry_path.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry_path))
+                total_size += stat.st_size
+
+            if total_size <= self.max_bytes:
+                return
+
+            entries.sort()
+            for _, size, entry_path in entries:
+                if total_size <= self.max_bytes:
+                    break
+                self._remove(entry_path)
+                total_size -= size
+
+    def _remove(self, entry_path: Path) -> None:
+        try:
+            entry_path.unlink()
+        except OSError:
+            pass
+
+
+# Shared by every session of the app process (see validation_cache)
+extraction_cache = ExtractionCache()
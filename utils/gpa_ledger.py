@@ -0,0 +1,151 @@
+"""
+Per-semester grade point ledger of a transcript.
+
+Grade points and GPA credits are summed once per semester, for all courses
+and for valid courses only, together with their running (prefix) totals.
+Any semester or cumulative GPA is then a constant-time lookup, so reports
+that show the cumulative GPA after every semester no longer re-sum all
+earlier semesters each time.
+
+A ledger is built once per render (or report) from the transcript at hand
+and passed to whatever needs GPAs from it; it is not cached between calls.
+"""
+from typing import Dict, List, Optional, Tuple
+
+GRADE_POINTS = {
+    "A": 4.0, "B+": 3.5, "B": 3.0, "C+": 2.5, "C": 2.0,
+    "D+": 1.5, "D": 1.0, "F": 0.0
+}
+
+
+def sum_grade_points(courses: List[Dict], total_points: float = 0.0,
+                     total_credits: int = 0) -> Tuple[float, int]:
+    """
+    Sum grade points and GPA credits of courses.
+
+    Grades that don't contribute to GPA (W, P, N, etc.) and courses without
+    credits are skipped.
+
+    Args:
+        courses: List of course dictionaries
+        total_points: Grade points to add to (for running totals)
+        total_credits: GPA credits to add to (for running totals)
+
+    Returns:
+        Tuple of (total_points, total_credits)
+    """
+    for course in courses:
+        grade = course.get("grade", "").strip()
+        credits = course.get("credits", 0)
+        if grade in GRADE_POINTS and credits > 0:
+            total_points += GRADE_POINTS[grade] * credits
+            total_credits += credits
+    return total_points, total_credits
+
+
+def gpa_from_totals(total_points: float, total_credits: int) -> Optional[float]:
+    """GPA rounded to 2 decimals, or None if no credits count toward GPA."""
+    if total_credits > 0:
+        return round(total_points / total_credits, 2)
+    return None
+
+
+def calculate_gpa(courses: List[Dict]) -> Optional[float]:
+    """GPA of a list of courses, or None if no credits count toward GPA."""
+    return gpa_from_totals(*sum_grade_points(courses))
+
+
+class GPALedger:
+    """Semester and cumulative grade point totals of one transcript."""
+
+    def __init__(self, semesters: List[Dict], validation_results: Optional[List[Dict]] = None):
+        """
+        Build the ledger.
+
+        Args:
+            semesters: List of all semesters
+            validation_results: Validation results; when given, totals of
+                valid courses only are kept as well
+        """
+        self.semesters = semesters
+        self.validation_results = validation_results
+        self.semester_totals: List[Tuple[float, int]] = []
+        self.cumulative_totals: List[Tuple[float, int]] = []
+        self.valid_semester_totals: List[Tuple[float, int]] = []
+        self.valid_cumulative_totals: List[Tuple[float, int]] = []
+
+        valid_codes = self._valid_codes_by_semester(validation_results) if validation_results is not None else None
+
+        # Running totals add course by course, so cumulative values are
+        # identical to summing all earlier courses at once
+        points, credits = 0.0, 0
+        valid_points, valid_credits = 0.0, 0
+        for semester_index, semester in enumerate(semesters):
+            courses = semester.get("courses", [])
+            self.semester_totals.append(sum_grade_points(courses))
+            points, credits = sum_grade_points(courses, points, credits)
+            self.cumulative_totals.append((points, credits))
+
+            if valid_codes is not None:
+                semester_valid_codes = valid_codes.get(semester_index, set())
+                valid_courses = [c for c in courses if c.get("code") in semester_valid_codes]
+                self.valid_semester_totals.append(sum_grade_points(valid_courses))
+                valid_points, valid_credits = sum_grade_points(valid_courses, valid_points, valid_credits)
+                self.valid_cumulative_totals.append((valid_points, valid_credits))
+
+    @staticmethod
+    def _valid_codes_by_semester(validation_results: List[Dict]) -> Dict[int, set]:
+        valid_codes = {}
+        for result in validation_results:
+            if result.get("course_code") != "CREDIT_LIMIT" and result.get("is_valid", True):
+                valid_codes.setdefault(result.get("semester_index"), set()).add(result.get("course_code"))
+        return valid_codes
+
+    def _totals(self, valid_only: bool) -> Tuple[List[Tuple[float, int]], List[Tuple[float, int]]]:
+        if valid_only:
+            if self.validation_results is None:
+                raise ValueError("GPALedger was built without validation results")
+            return self.valid_semester_totals, self.valid_cumulative_totals
+        return self.semester_totals, self.cumulative_totals
+
+    def semester_gpa(self, semester_index: int, valid_only: bool = False) -> Optional[float]:
+        """
+        GPA of one semester.
+
+        Args:
+            semester_index: Index of the semester
+            valid_only: Only count courses whose registration is valid
+
+        Returns:
+            GPA rounded to 2 decimals, or None if no credits count toward GPA
+        """
+        semester_totals, _ = self._totals(valid_only)
+        return gpa_from_totals(*semester_totals[semester_index])
+
+    def cumulative_gpa(self, up_to_index: Optional[int] = None, valid_only: bool = False) -> Optional[float]:
+        """
+        Cumulative GPA up to and including a semester.
+
+        Args:
+            up_to_index: Index of the last semester to include (default: last semester)
+            valid_only: Only count courses whose registration is valid
+
+        Returns:
+            GPA rounded to 2 decimals, or None if no credits count toward GPA
+        """
+        _, cumulative_totals = self._totals(valid_only)
+        if not cumulative_totals:
+            return None
+        if up_to_index is None:
+            up_to_index = len(cumulative_totals) - 1
+        return gpa_from_totals(*cumulative_totals[up_to_index])
+
+    def cumulative_credits(self, up_to_index: Optional[int] = None, valid_only: bool = False) -> int:
+        """GPA credits up to and including a semester (default: last semester)."""
+        _, cumulative_totals = self._totals(valid_only)
+        if not cumulative_totals:
+            return 0
+        if up_to_index is None:
+            up_to_index = len(cumulative_totals) - 1
+        return cumulative_totals[up_to_index][1]
+
@@ -0,0 +1,137 @@
+"""
+Pluggable PDF text extraction backends.
+
+PyPDF2 is the default backend. Other decoders are used only when their
+package is installed locally, and are selected by name (argument or the
+PDF_TEXT_BACKEND environment variable).
+"""
+import io
+import os
+from typing import Any, Dict, List
+
+DEFAULT_BACKEND = os.environ.get("PDF_TEXT_BACKEND", "pypdf2")
+
+
+class PDFTextBackend:
+    """Interface every PDF text backend implements."""
+
+    name = ""
+
+    def is_available(self) -> bool:
+        """Return True if the backend's package can be imported."""
+        return True
+
+    def open(self, pdf_bytes: bytes) -> Any:
+        """Parse PDF bytes and return a document handle."""
+        raise NotImplementedError
+
+    def page_count(self, document: Any) -> int:
+        """Return the number of pages in an opened document."""
+        raise NotImplementedError
+
+    def page_text(self, document: Any, page_index: int) -> str:
+        """Return the text of one page of an opened document."""
+        raise NotImplementedError
+
+
+class PyPDF2Backend(PDFTextBackend):
+    """Default backend using PyPDF2."""
+
+    name = "pypdf2"
+
+    def open(self, pdf_bytes):
+        import PyPDF2
+        # Pass a BytesIO object to PdfReader (NOT the raw bytes)
+        return PyPDF2.PdfReader(io.BytesIO(pdf_bytes))
+
+    def page_count(self, document):
+        return len(document.pages)
+
+    def page_text(self, document, page_index):
+        return document.pages[page_index].extract_text()
+
+
+class PypdfBackend(PDFTextBackend):
+    """Backend using pypdf, the maintained successor of PyPDF2."""
+
+    name = "pypdf"
+
+    def is_available(self):
+        try:
+            import pypdf  # noqa: F401
+            return True
+        except ImportError:
+            return False
+
+    def open(self, pdf_bytes):
+        import pypdf
+        return pypdf.PdfReader(io.BytesIO(pdf_bytes))
+
+    def page_count(self, document):
+        return len(document.pages)
+
+    def page_text(self, document, page_index):
+        return document.pages[page_index].extract_text()
+
+
+class PyMuPDFBackend(PDFTextBackend):
+    """Backend using PyMuPDF (fitz)."""
+
+    name = "pymupdf"
+
+    def is_available(self):
+        try:
+            import fitz  # noqa: F401
+            return True
+        except ImportError:
+            return False
+
+    def open(self, pdf_bytes):
+        import fitz
+        return fitz.open(stream=pdf_bytes, filetype="pdf")
+
+    def page_count(self, document):
+        return document.page_count
+
+    def page_text(self, document, page_index):
+        return document.load_page(page_index).get_text()
+
+
+_BACKENDS: Dict[str, PDFTextBackend] = {}
+
+
+def register_backend(backend: PDFTextBackend) -> None:
+    """Register a backend so it can be selected by name."""
+    _BACKENDS[backend.name] = backend
+
+
+def get_backend(name: str = None) -> PDFTextBackend:
+    """
+    Look up a registered backend.
+
+    Args:
+        name: Backend name (defaults to DEFAULT_BACKEND)
+
+    Returns:
+        The backend instance
+
+    Raises:
+        ValueError: If the backend is unknown or its package is not installed
+    """
+    name = name or DEFAULT_BACKEND
+    backend = _BACKENDS.get(name)
+    if backend is None:
+        raise ValueError(f"Unknown PDF text backend: {name}")
+    if not backend.is_available():
+        raise ValueError(f"PDF text backend '{name}' is not installed")
+    return backend
+
+
+def available_backends() -> List[str]:
+    """Return the names of registered backends that can be used here."""
+    return [name for name, backend in _BACKENDS.items() if backend.is_available()]
+
+
+register_backend(PyPDF2Backend())
+register_backend(PypdfBackend())
+register_backend(PyMuPDFBackend())
@@ -4,11 +4,65 @@ PDF extraction functionality for reading transcript PDFs.
 """
 import re
 import logging
-import PyPDF2
 from datetime import datetime
+from .pdf_processor import extract_text_from_pdf_bytes, iter_page_texts
 
 logger = logging.getLogger("pdf_extractor")
 
+# Bump whenever a change to the parsing code can change the extracted
+# student info or semesters, so cached extraction results are not reused.
+PARSER_VERSION = "2"
+
+# Semester header alternatives, tried in this order on each line.
+# Each alternative is anchored with a lazy ".*?" so that re.match keeps the
+# priority of the alternatives instead of returning the leftmost header.
+SEMESTER_HEADER_RE = re.compile(
+    r'.*?(First|Second)\s+Semester\s+(\d{4})'
+    r'|.*?Summer\s+Session\s+(\d{4})'
+    r'|.*?(First|Second)Semester(\d{4})'
+    r'|.*?SummerSession(\d{4})',
+    re.IGNORECASE
+)
+
+# KEY FIX: Course code pattern handles spaces in course codes
+# Matches: 01208111 OR 012081 11 OR 0120 8111, etc.
+# Followed by course name, grade, and credits
+# Updated to handle F (3) format where credits are in parentheses
+COURSE_ROW_RE = re.compile(
+    r'(\d{2,8}(?:\s*\d{1,6})?)\s+([A-Za-z][^\d\n]{5,100}?)\s+([A-Z][\+\-]?|W|N|F|P)\s+(?:\()?(\d+)(?:\))?'
+)
+
+GPA_LINE_RE = re.compile(
+    r'sem\.\s*G\.P\.A\.\s*=\s*(\d+\.\d+).*?cum\.\s*G\.P\.A\.\s*=\s*(\d+\.\d+)',
+    re.IGNORECASE | re.DOTALL
+)
+SEM_GPA_RE = re.compile(r'sem\.\s*G\.P\.A\.\s*=\s*(\d+\.\d+)', re.IGNORECASE)
+CUM_GPA_RE = re.compile(r'cum\.\s*G\.P\.A\.\s*=\s*(\d+\.\d+)', re.IGNORECASE)
+
+WHITESPACE_RE = re.compile(r'\s+')
+COURSE_NAME_ARTIFACT_RE = re.compile(r'(?:Course Code|Grade|Credit).*$', re.IGNORECASE)
+
+VALID_GRADES = frozenset(['A', 'B+', 'B', 'C+', 'C', 'D+', 'D', 'F', 'W', 'N', 'P', 'I', 'S', 'U'])
+NON_CREDIT_GRADES = frozenset(['W', 'N', 'P', 'S', 'U', ''])
+
+# Course rows are never this long; longer lines are extraction garbage and
+# are not worth running the course pattern over.
+MAX_COURSE_LINE_LENGTH = 2000
+
+
+# Labels that must all be seen before the student header is complete
+STUDENT_HEADER_LABEL_RES = (
+    re.compile(r'Student No\s', re.IGNORECASE),
+    re.compile(r'Name\s', re.IGNORECASE),
+    re.compile(r'Date of Admission\s', re.IGNORECASE),
+)
+
+
+def _could_be_header(line):
+    """Cheap substring check before running the semester header pattern."""
+    line_lower = line.lower()
+    return "semester" in line_lower or "session" in line_lower
+
 class PDFExtractor:
     """Class for extracting and processing text from PDF transcripts."""
     
@@ -27,23 +81,12 @@ class PDFExtractor:
             Extracted text as a string
         """
         try:
-            all_text = []
-            
             with open(pdf_path, 'rb') as file:
-                reader = PyPDF2.PdfReader(file)
-                
-                for page in reader.pages:
-                    # Extract text from the page
-                    page_text = page.extract_text()
-                    
-                    # Skip pages with no text content
-                    if not page_text or page_text.strip() == "":
-                        continue
-                    
-                    all_text.append(page_text)
+                pdf_bytes = file.read()
             
-            # Join all text
-            return "\n".join(all_text)
+            # Pages are extracted (in parallel for large documents) and
+            # joined, skipping pages with no text content
+            return extract_text_from_pdf_bytes(pdf_bytes)
         
         except Exception as e:
             logger.error(f"Error extracting text from {pdf_path}: {e}")
@@ -184,171 +227,269 @@ class PDFExtractor:
             "date_admission": date_admission
         }
     
+    def extract_student_info_from_pdf_bytes(self, pdf_bytes, max_pages=2):
+        """
+        Fast path that reads only the transcript header.
+
+        Pages are decoded one at a time and decoding stops as soon as the
+        Student No, Name and Date of Admission labels have all been seen,
+        which is normally after the first page.
+
+        Args:
+            pdf_bytes: Raw PDF file content
+            max_pages: Maximum number of pages to decode
+
+        Returns:
+            Dictionary containing student information
+        """
+        header_pages = []
+        for page_number, page_text in enumerate(iter_page_texts(pdf_bytes, workers=1), start=1):
+            header_pages.append(page_text)
+            header_text = "\n".join(header_pages)
+            if all(label.search(header_text) for label in STUDENT_HEADER_LABEL_RES):
+                break
+            if page_number >= max_pages:
+                break
+
+        return self.extract_student_info("\n".join(header_pages))
+
     def extract_semesters(self, text):
         """
         ULTRA-ROBUST VERSION: Extract semester data with maximum flexibility.
         Handles course codes that may be split with spaces during PDF extraction.
         """
-        # Semester detection patterns
-        semester_patterns = [
-            r'(First|Second)\s+Semester\s+(\d{4})',
-            r'Summer\s+Session\s+(\d{4})',
-            r'(First|Second)Semester(\d{4})',
-            r'SummerSession(\d{4})'
-        ]
-        
-        # KEY FIX: Course code pattern handles spaces in course codes
-        # Matches: 01208111 OR 012081 11 OR 0120 8111, etc.
-        # Followed by course name, grade, and credits
-        # Updated to handle F (3) format where credits are in parentheses
-        course_pattern = r'(\d{2,8}(?:\s*\d{1,6})?)\s+([A-Za-z][^\d\n]{5,100}?)\s+([A-Z][\+\-]?|W|N|F|P)\s+(?:\()?(\d+)(?:\))?'
-        
-        gpa_pattern = r'sem\.\s*G\.P\.A\.\s*=\s*(\d+\.\d+).*?cum\.\s*G\.P\.A\.\s*=\s*(\d+\.\d+)'
-        
-        semesters = []
-        
-        lines = text.split('\n')
-        
-        # Find all semester headers with their line numbers
-        semester_markers = []
-        for line_num, line in enumerate(lines):
-            line_clean = line.strip()
-            if not line_clean:
+        return list(self.iter_semesters(text.split('\n')))
+
+    def iter_semesters(self, lines):
+        """
+        Parse semesters from a stream of transcript lines.
+
+        Single pass over the lines: a semester header closes the previous
+        semester, every other line is checked for GPA values and course rows
+        using the precompiled module-level patterns.
+
+        Args:
+            lines: Iterable of text lines (see iter_lines)
+
+        Yields:
+            Semester dictionaries, each as soon as the next semester header
+            (or the end of the input) closes it
+        """
+        current_semester = None
+        seen_codes = set()
+
+        for line in lines:
+            line = line.strip()
+            if not line:
                 continue
-                
-            for pattern in semester_patterns:
-                match = re.search(pattern, line_clean, re.IGNORECASE)
-                if match:
-                    semester_markers.append((line_num, line_clean, match))
-                    break
-        
-        # Process each semester
-        for idx, (sem_line_num, sem_line, sem_match) in enumerate(semester_markers):
-            # Determine end boundary
-            end_line = semester_markers[idx + 1][0] if idx + 1 < len(semester_markers) else len(lines)
-            
-            # Parse semester info
-            groups = sem_match.groups()
-            if "Summer" in sem_line:
-                semester_type = "Summer"
-                year = groups[0] if len(groups) == 1 else groups[1]
-            else:
-                semester_type = groups[0]
-                year = groups[1] if len(groups) > 1 else groups[0]
-            
-            current_semester = {
-                "semester": f"{semester_type} Semester {year}" if semester_type != "Summer" else f"Summer Session {year}",
-                "semester_type": semester_type,
-                "year": year,
-                "year_int": int(year) if year.isdigit() else 0,
-                "courses": [],
-                "sem_gpa": None,
-                "cum_gpa": None,
-                "total_credits": 0,
-                "semester_order": 0 if semester_type == "Summer" else (1 if semester_type == "First" else 2)
-            }
-            
-            # Track seen course codes to avoid duplicates
-            seen_codes = set()
-            
-            # Process each line in the semester
-            for line_num in range(sem_line_num + 1, end_line):
-                line = lines[line_num].strip()
-                
-                if not line or "http" in line.lower() or ".php" in line.lower():
-                    continue
-                
-                # Check for GPA line
-                gpa_match = re.search(gpa_pattern, line, re.IGNORECASE | re.DOTALL)
-                if gpa_match:
-                    try:
-                        current_semester["sem_gpa"] = float(gpa_match.group(1))
-                        current_semester["cum_gpa"] = float(gpa_match.group(2))
-                    except (ValueError, IndexError):
-                        pass
-                    continue
-                
-                # Also check for individual GPA lines
-                sem_gpa_match = re.search(r'sem\.\s*G\.P\.A\.\s*=\s*(\d+\.\d+)', line, re.IGNORECASE)
-                if sem_gpa_match and current_semester["sem_gpa"] is None:
-                    try:
-                        current_semester["sem_gpa"] = float(sem_gpa_match.group(1))
-                    except (ValueError, IndexError):
-                        pass
-                
-                cum_gpa_match = re.search(r'cum\.\s*G\.P\.A\.\s*=\s*(\d+\.\d+)', line, re.IGNORECASE)
-                if cum_gpa_match and current_semester["cum_gpa"] is None:
-                    try:
-                        current_semester["cum_gpa"] = float(cum_gpa_match.group(1))
-                    except (ValueError, IndexError):
-                        pass
-                
-                # Find all course matches in this line
-                course_matches = list(re.finditer(course_pattern, line))
-                
-                for course_match in course_matches:
-                    try:
-                        course_code_raw = course_match.group(1).strip()
-                        course_name = course_match.group(2).strip()
-                        grade = course_match.group(3).strip()
-                        credits_str = course_match.group(4).strip()
-                        
-                        # KEY FIX: Remove all spaces from course code
-                        course_code = course_code_raw.replace(' ', '')
-                        
-                        # Validate course code format (should be 8 digits after cleaning)
-                        if not course_code.isdigit() or len(course_code) != 8:
-                            continue
-                        
-                        # Skip if already seen
-                        if course_code in seen_codes:
-                            continue
-                        
-                        # Clean course name
-                        course_name = re.sub(r'\s+', ' ', course_name)
-                        # Remove common artifacts
-                        course_name = re.sub(r'Course Code.*$', '', course_name, flags=re.IGNORECASE)
-                        course_name = re.sub(r'Grade.*$', '', course_name, flags=re.IGNORECASE)
-                        course_name = re.sub(r'Credit.*$', '', course_name, flags=re.IGNORECASE)
-                        course_name = course_name.strip()
-                        
-                        # Skip if course name is too short (likely extraction error)
-                        if len(course_name) < 3:
-                            continue
-                        
-                        # Validate grade
-                        valid_grades = ['A', 'B+', 'B', 'C+', 'C', 'D+', 'D', 'F', 'W', 'N', 'P', 'I', 'S', 'U']
-                        if grade not in valid_grades:
-                            continue
-                        
-                        # Parse credits
-                        credits = int(credits_str) if credits_str.isdigit() else 0
-                        if credits <= 0 or credits > 6:  # Sanity check
-                            continue
-                        
-                        course_data = {
-                            "code": course_code,
-                            "name": course_name,
-                            "grade": grade,
-                            "credits": credits
-                        }
-                        
-                        current_semester["courses"].append(course_data)
-                        seen_codes.add(course_code)
-                        
-                        # Count credits
-                        if grade not in ['W', 'N', 'P', 'S', 'U', '']:
-                            current_semester["total_credits"] += credits
-                        
-                    except (IndexError, ValueError) as e:
-                        continue
-            
-            # Only add semester if it has courses
-            if current_semester["courses"]:
-                semesters.append(current_semester)
-        
-        return semesters
-    
+
+            # Semester header lines start a new semester
+            header_match = SEMESTER_HEADER_RE.match(line) if _could_be_header(line) else None
+            if header_match:
+                # Only yield semester if it has courses
+                if current_semester and current_semester["courses"]:
+                    yield current_semester
+                current_semester = self._new_semester(line, header_match)
+                seen_codes = set()
+                continue
+
+            # Lines before the first semester header are ignored
+            if current_semester is None:
+                continue
+
+            self._scan_semester_line(line, current_semester, seen_codes)
+
+        if current_semester and current_semester["courses"]:
+            yield current_semester
+
+    @staticmethod
+    def iter_lines(page_texts):
+        """
+        Split a stream of page texts into lines without joining the pages.
+
+        Args:
+            page_texts: Iterable of page text strings
+
+        Yields:
+            Lines in document order, the same lines as splitting the joined text
+        """
+        for page_text in page_texts:
+            yield from page_text.split('\n')
+
+    def stream_semesters(self, pdf_bytes, header_pages=None, workers=None):
+        """
+        Decode a PDF page by page and yield semesters as they are parsed.
+
+        Only the page being decoded and the semester being built are held in
+        memory, so callers can start on early semesters before later pages
+        have been decoded.
+
+        Args:
+            pdf_bytes: Raw PDF file content
+            header_pages: Optional list that receives the leading pages until
+                the student header labels have all been seen (or every page
+                if they never are), for extract_student_info
+            workers: Number of page ranges decoded in parallel (see
+                iter_page_texts)
+
+        Returns:
+            Generator of semester dictionaries in transcript order
+        """
+        page_texts = iter_page_texts(pdf_bytes, workers=workers)
+        if header_pages is not None:
+            page_texts = self._collect_header_pages(page_texts, header_pages)
+        return self.iter_semesters(self.iter_lines(page_texts))
+
+    @staticmethod
+    def _collect_header_pages(page_texts, header_pages):
+        """Pass pages through, keeping them in header_pages until the header is complete."""
+        header_complete = False
+        for page_text in page_texts:
+            if not header_complete:
+                header_pages.append(page_text)
+                header_text = "\n".join(header_pages)
+                header_complete = all(label.search(header_text) for label in STUDENT_HEADER_LABEL_RES)
+            yield page_text
+
+    def process_pdf_bytes(self, pdf_bytes, workers=None):
+        """
+        Decode and parse a PDF transcript in a single streaming pass.
+
+        Semesters are parsed while later pages are still being decoded, and
+        the joined text of the whole document is never built; only the header
+        pages are kept for the student information.
+
+        Args:
+            pdf_bytes: Raw PDF file content
+            workers: Number of page ranges decoded in parallel (see
+                iter_page_texts)
+
+        Returns:
+            Tuple of (student_info, semesters), or ({}, []) if the PDF has no text
+        """
+        header_pages = []
+        semesters = list(self.stream_semesters(pdf_bytes, header_pages, workers))
+
+        if not header_pages:
+            logger.error("No text extracted from PDF")
+            return {}, []
+
+        return self.extract_student_info("\n".join(header_pages)), semesters
+
+    def _new_semester(self, header_line, header_match):
+        """
+        Create an empty semester dictionary from a matched semester header.
+
+        Args:
+            header_line: Stripped header line
+            header_match: Match of SEMESTER_HEADER_RE on the header line
+
+        Returns:
+            Semester dictionary without courses
+        """
+        # Groups of the alternative that matched, in the same shape as the
+        # individual header patterns: (type, year) or (year,)
+        groups = tuple(g for g in header_match.groups() if g is not None)
+        if "Summer" in header_line:
+            semester_type = "Summer"
+            year = groups[0] if len(groups) == 1 else groups[1]
+        else:
+            semester_type = groups[0]
+            year = groups[1] if len(groups) > 1 else groups[0]
+
+        return {
+            "semester": f"{semester_type} Semester {year}" if semester_type != "Summer" else f"Summer Session {year}",
+            "semester_type": semester_type,
+            "year": year,
+            "year_int": int(year) if year.isdigit() else 0,
+            "courses": [],
+            "sem_gpa": None,
+            "cum_gpa": None,
+            "total_credits": 0,
+            "semester_order": 0 if semester_type == "Summer" else (1 if semester_type == "First" else 2)
+        }
+
+    def _scan_semester_line(self, line, current_semester, seen_codes):
+        """
+        Extract GPA values and course rows from one line inside a semester.
+
+        Args:
+            line: Stripped, non-empty line
+            current_semester: Semester dictionary to update
+            seen_codes: Course codes already added to this semester
+        """
+        line_lower = line.lower()
+        if "http" in line_lower or ".php" in line_lower:
+            return
+
+        if "g.p.a" in line_lower:
+            # Check for GPA line
+            gpa_match = GPA_LINE_RE.search(line)
+            if gpa_match:
+                current_semester["sem_gpa"] = float(gpa_match.group(1))
+                current_semester["cum_gpa"] = float(gpa_match.group(2))
+                return
+
+            # Also check for individual GPA lines
+            if current_semester["sem_gpa"] is None:
+                sem_gpa_match = SEM_GPA_RE.search(line)
+                if sem_gpa_match:
+                    current_semester["sem_gpa"] = float(sem_gpa_match.group(1))
+
+            if current_semester["cum_gpa"] is None:
+                cum_gpa_match = CUM_GPA_RE.search(line)
+                if cum_gpa_match:
+                    current_semester["cum_gpa"] = float(cum_gpa_match.group(1))
+
+        # Guard against pathological backtracking on long garbage lines
+        if len(line) > MAX_COURSE_LINE_LENGTH:
+            logger.debug(f"Skipping course scan on {len(line)}-character line")
+            return
+
+        # Find all course matches in this line
+        for course_match in COURSE_ROW_RE.finditer(line):
+            # KEY FIX: Remove all spaces from course code
+            course_code = course_match.group(1).strip().replace(' ', '')
+
+            # Validate course code format (should be 8 digits after cleaning)
+            if not course_code.isdigit() or len(course_code) != 8:
+                continue
+
+            # Skip if already seen
+            if course_code in seen_codes:
+                continue
+
+            # Clean course name and remove common artifacts
+            course_name = WHITESPACE_RE.sub(' ', course_match.group(2).strip())
+            course_name = COURSE_NAME_ARTIFACT_RE.sub('', course_name).strip()
+
+            # Skip if course name is too short (likely extraction error)
+            if len(course_name) < 3:
+                continue
+
+            # Validate grade
+            grade = course_match.group(3).strip()
+            if grade not in VALID_GRADES:
+                continue
+
+            # Parse credits
+            credits_str = course_match.group(4).strip()
+            credits = int(credits_str) if credits_str.isdigit() else 0
+            if credits <= 0 or credits > 6:  # Sanity check
+                continue
+
+            current_semester["courses"].append({
+                "code": course_code,
+                "name": course_name,
+                "grade": grade,
+                "credits": credits
+            })
+            seen_codes.add(course_code)
+
+            # Count credits
+            if grade not in NON_CREDIT_GRADES:
+                current_semester["total_credits"] += credits
+
     def process_pdf(self, pdf_path, text=None):
         """
         Process a PDF transcript and extract all data.
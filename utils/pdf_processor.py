@@ -1,25 +1,366 @@
-import io
-import PyPDF2
+import multiprocessing
+import multiprocessing.connection
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from .pdf_backends import get_backend
 
-def extract_text_from_pdf_bytes(pdf_bytes):
+# Worker processes used for per-page extraction. Set PDF_EXTRACT_WORKERS=1
+# to always extract in the calling thread.
+DEFAULT_WORKERS = int(os.environ.get("PDF_EXTRACT_WORKERS", "0")) or (os.cpu_count() or 1)
+
+# Documents with fewer pages than this are extracted serially; handing a
+# short transcript to the pool costs more than it saves.
+PARALLEL_MIN_PAGES = 8
+
+# Resource limits for untrusted uploads. Each can be overridden with the
+# environment variable of the same name; 0 disables that limit.
+PDF_MAX_BYTES = int(os.environ.get("PDF_MAX_BYTES", str(20 * 1024 * 1024)))
+PDF_MAX_PAGES = int(os.environ.get("PDF_MAX_PAGES", "50"))
+PDF_PAGE_TIMEOUT = float(os.environ.get("PDF_PAGE_TIMEOUT", "10"))
+PDF_TOTAL_TIMEOUT = float(os.environ.get("PDF_TOTAL_TIMEOUT", "30"))
+PDF_MAX_CHARS = int(os.environ.get("PDF_MAX_CHARS", "2000000"))
+
+
+class PDFRejectedError(Exception):
+    """Raised when a PDF exceeds one of the extraction limits."""
+
+
+class ExtractionLimits:
+    """
+    Limits enforced before and during text extraction.
+
+    When either time budget is set, pages are decoded in separate worker
+    processes that are terminated as soon as a budget runs out, so a slow or
+    crafted PDF cannot block the caller.
+    """
+
+    def __init__(self, max_bytes=None, max_pages=None, page_timeout=None,
+                 total_timeout=None, max_chars=None):
+        """
+        Args:
+            max_bytes: Maximum PDF file size
+            max_pages: Maximum number of pages
+            page_timeout: Seconds allowed for opening the document and for each page
+            total_timeout: Seconds allowed for the whole document
+            max_chars: Maximum number of extracted characters
+
+        Any argument left as None uses the module default; 0 disables the limit.
+        """
+        self.max_bytes = PDF_MAX_BYTES if max_bytes is None else max_bytes
+        self.max_pages = PDF_MAX_PAGES if max_pages is None else max_pages
+        self.page_timeout = PDF_PAGE_TIMEOUT if page_timeout is None else page_timeout
+        self.total_timeout = PDF_TOTAL_TIMEOUT if total_timeout is None else total_timeout
+        self.max_chars = PDF_MAX_CHARS if max_chars is None else max_chars
+
+    @property
+    def has_time_budget(self):
+        return bool(self.page_timeout or self.total_timeout)
+
+    def check_size(self, pdf_bytes):
+        if self.max_bytes and len(pdf_bytes) > self.max_bytes:
+            raise PDFRejectedError(
+                f"PDF is {len(pdf_bytes) / (1024 * 1024):.1f} MB; "
+                f"the limit is {self.max_bytes / (1024 * 1024):.1f} MB"
+            )
+
+    def check_pages(self, page_count):
+        if self.max_pages and page_count > self.max_pages:
+            raise PDFRejectedError(f"PDF has {page_count} pages; the limit is {self.max_pages}")
+
+    def check_chars(self, char_count):
+        if self.max_chars and char_count > self.max_chars:
+            raise PDFRejectedError(
+                f"PDF contains more than {self.max_chars:,} characters of text"
+            )
+
+
+DEFAULT_LIMITS = ExtractionLimits()
+
+# No limits at all, for trusted input such as benchmarks
+UNLIMITED = ExtractionLimits(max_bytes=0, max_pages=0, page_timeout=0, total_timeout=0, max_chars=0)
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor():
+    """
+    Return the shared process pool, creating it on first use.
+
+    The pool always has DEFAULT_WORKERS processes; callers asking for fewer
+    workers submit fewer page ranges instead of resizing it.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(max_workers=DEFAULT_WORKERS)
+        return _executor
+
+
+def _page_ranges(page_count, workers):
+    """Split [0, page_count) into one contiguous range per worker."""
+    if page_count == 0:
+        return [(0, 0)]
+    chunk_size = -(-page_count // workers)
+    return [(start, min(start + chunk_size, page_count))
+            for start in range(0, page_count, chunk_size)]
+
+
+def _extract_page_range(pdf_bytes, start, stop, backend_name):
+    """Extract the text of pages [start, stop) in a worker process."""
+    backend = get_backend(backend_name)
+    document = backend.open(pdf_bytes)
+    return [backend.page_text(document, i) for i in range(start, stop)]
+
+
+def _extract_pages_parallel(pdf_bytes, page_count, workers, backend_name):
+    """
+    Fan contiguous page ranges out to the process pool, one per worker.
+
+    Returns:
+        List of page texts in document order
+    """
+    executor = _get_executor()
+    futures = [executor.submit(_extract_page_range, pdf_bytes, start, stop, backend_name)
+               for start, stop in _page_ranges(page_count, workers)]
+
+    page_texts = []
+    for future in futures:
+        page_texts.extend(future.result())
+    return page_texts
+
+
+def _guarded_page_worker(conn, pdf_bytes, backend_name):
+    """
+    Decode a range of pages in a child process and stream them to the parent.
+
+    Sends ("count", n) once the document is open, then waits for the
+    (start, stop) page range to decode. Sends ("page", text) for each page of
+    the range and finally ("done",), or ("error", message) if decoding fails.
+    """
+    try:
+        backend = get_backend(backend_name)
+        document = backend.open(pdf_bytes)
+        conn.send(("count", backend.page_count(document)))
+        start, stop = conn.recv()
+        for page_index in range(start, stop):
+            conn.send(("page", backend.page_text(document, page_index)))
+        conn.send(("done",))
+    except Exception as e:
+        try:
+            conn.send(("error", str(e)))
+        except OSError:
+            pass  # Parent already stopped listening
+    finally:
+        conn.close()
+
+
+class _GuardedWorker:
+    """One killable page worker process and the pages it has sent so far."""
+
+    def __init__(self, context, pdf_bytes, backend_name):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_guarded_page_worker,
+                                       args=(child_conn, pdf_bytes, backend_name), daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.pages = deque()
+        self.done = False
+        self.last_message = time.monotonic()
+
+    def stop(self):
+        self.conn.close()
+        if self.process.is_alive():
+            self.process.terminate()
+        self.process.join(1)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+
+
+def _iter_pages_guarded(pdf_bytes, backend_name, limits, workers=1):
+    """
+    Yield page texts from killable worker processes while enforcing the
+    page count, time and text length budgets.
+
+    The first worker opens the document and reports the page count. Documents
+    of at least PARALLEL_MIN_PAGES pages are then split into one page range
+    per worker, each decoded by its own process; pages are still yielded in
+    page order. Every worker has page_timeout seconds to open the document
+    and for each page, and all of them together have total_timeout seconds.
+    All workers are terminated when a limit is hit, on errors and when the
+    caller stops iterating early.
     """
-    Extract text from PDF bytes using PyPDF2.
-    FIXED: Properly handles BytesIO object.
+    context = multiprocessing.get_context()
+    start = time.monotonic()
+    workers_by_range = [_GuardedWorker(context, pdf_bytes, backend_name)]
+    page_count = None
+    next_worker = 0
+    char_count = 0
+
+    try:
+        while True:
+            # Yield buffered pages in page order
+            while next_worker < len(workers_by_range):
+                worker = workers_by_range[next_worker]
+                while worker.pages:
+                    yield worker.pages.popleft()
+                if not worker.done:
+                    break
+                next_worker += 1
+            if page_count is not None and next_worker == len(workers_by_range):
+                return
+
+            pending = {worker.conn: worker for worker in workers_by_range if not worker.done}
+            now = time.monotonic()
+            deadlines = []
+            if limits.page_timeout:
+                deadlines.append(min(worker.last_message for worker in pending.values()) + limits.page_timeout)
+            if limits.total_timeout:
+                deadlines.append(start + limits.total_timeout)
+            wait = max(0, min(deadlines) - now) if deadlines else None
+
+            ready = multiprocessing.connection.wait(list(pending), wait)
+            if not ready:
+                if limits.total_timeout and time.monotonic() - start >= limits.total_timeout:
+                    raise PDFRejectedError(
+                        f"PDF took longer than {limits.total_timeout:g}s to extract"
+                    )
+                raise PDFRejectedError(
+                    f"A PDF page took longer than {limits.page_timeout:g}s to extract"
+                )
+
+            for conn in ready:
+                worker = pending[conn]
+                try:
+                    message = conn.recv()
+                except EOFError:
+                    raise Exception(f"PDF extraction worker exited with code {worker.process.exitcode}")
+                worker.last_message = time.monotonic()
+
+                kind = message[0]
+                if kind == "count":
+                    if worker is not workers_by_range[0] or page_count is not None:
+                        continue  # Only the first worker's count decides the split
+                    page_count = message[1]
+                    limits.check_pages(page_count)
+                    worker_count = min(workers, page_count) if page_count >= PARALLEL_MIN_PAGES else 1
+                    ranges = _page_ranges(page_count, max(1, worker_count))
+                    worker.conn.send(ranges[0])
+                    for page_range in ranges[1:]:
+                        extra_worker = _GuardedWorker(context, pdf_bytes, backend_name)
+                        extra_worker.conn.send(page_range)
+                        workers_by_range.append(extra_worker)
+                elif kind == "page":
+                    page_text = message[1]
+                    # Checked on arrival, so pages buffered behind a slower
+                    # range cannot grow past the limit either
+                    if page_text and page_text.strip():
+                        char_count += len(page_text)
+                        limits.check_chars(char_count)
+                    worker.pages.append(page_text)
+                elif kind == "error":
+                    raise Exception(message[1])
+                else:
+                    worker.done = True
+    finally:
+        for worker in workers_by_range:
+            worker.stop()
+
+
+def _iter_pages(pdf_bytes, backend_name, limits, workers=1):
+    """
+    Yield page texts without time budgets, enforcing the page count.
+
+    Large documents are extracted in the shared process pool, others in the
+    calling process.
+    """
+    pdf_backend = get_backend(backend_name)
+    document = pdf_backend.open(pdf_bytes)
+    page_count = pdf_backend.page_count(document)
+    limits.check_pages(page_count)
+
+    # The shared pool is never resized: just submit fewer page ranges
+    workers = min(workers, DEFAULT_WORKERS, page_count)
+    if workers > 1 and page_count >= PARALLEL_MIN_PAGES:
+        yield from _extract_pages_parallel(pdf_bytes, page_count, workers, backend_name)
+        return
+
+    for page_index in range(page_count):
+        yield pdf_backend.page_text(document, page_index)
+
+
+def iter_page_texts(pdf_bytes, backend=None, limits=None, workers=None):
+    """
+    Decode PDF bytes one page at a time.
+
+    With a time budget, pages are decoded in worker processes that are
+    killed once the budget runs out. Documents of at least
+    PARALLEL_MIN_PAGES pages are split into page ranges decoded in parallel
+    (in their own worker processes with a time budget, in the shared process
+    pool without one); pages are yielded in page order either way.
+
+    Args:
+        pdf_bytes: Raw PDF file content
+        backend: Name of the PDF text backend (defaults to DEFAULT_BACKEND,
+            set by PDF_TEXT_BACKEND)
+        limits: ExtractionLimits to enforce (defaults to DEFAULT_LIMITS,
+            UNLIMITED turns every check off)
+        workers: Number of page ranges decoded in parallel (defaults to
+            DEFAULT_WORKERS, 1 forces serial extraction)
+
+    Yields:
+        Text of each page that has text content, in page order
+
+    Raises:
+        PDFRejectedError: If the PDF exceeds one of the limits
+    """
+    limits = limits or DEFAULT_LIMITS
+    limits.check_size(pdf_bytes)
+    backend_name = get_backend(backend).name
+    if workers is None:
+        workers = DEFAULT_WORKERS
+
+    if limits.has_time_budget:
+        pages = _iter_pages_guarded(pdf_bytes, backend_name, limits, workers)
+    else:
+        pages = _iter_pages(pdf_bytes, backend_name, limits, workers)
+
+    char_count = 0
+    for page_text in pages:
+        if page_text and page_text.strip():
+            char_count += len(page_text)
+            limits.check_chars(char_count)
+            yield page_text
+
+
+def extract_text_from_pdf_bytes(pdf_bytes, workers=None, backend=None, limits=None):
+    """
+    Extract text from PDF bytes using the selected backend (DEFAULT_BACKEND,
+    set by PDF_TEXT_BACKEND, by default).
+
+    Pages are decoded by iter_page_texts and joined in page order, skipping
+    pages with no text content. The size, page count, time budgets and
+    extracted text length are checked against limits.
+
+    Args:
+        pdf_bytes: Raw PDF file content
+        workers: Number of page ranges extracted in parallel (defaults to
+            DEFAULT_WORKERS; 1 forces serial extraction)
+        backend: Name of the PDF text backend (defaults to DEFAULT_BACKEND,
+            see utils.pdf_backends)
+        limits: ExtractionLimits to enforce (defaults to DEFAULT_LIMITS,
+            UNLIMITED turns every check off)
+
+    Raises:
+        PDFRejectedError: If the PDF exceeds one of the limits
     """
     try:
-        # Create BytesIO object from bytes
-        pdf_file = io.BytesIO(pdf_bytes)
-        
-        # Pass the BytesIO object to PdfReader (NOT the raw bytes)
-        reader = PyPDF2.PdfReader(pdf_file)  # FIXED: was pdf_bytes, now pdf_file
-        
-        all_text = []
-        for page in reader.pages:
-            page_text = page.extract_text()
-            if page_text and page_text.strip():
-                all_text.append(page_text)
-        
-        return "\n".join(all_text)
-    
+        return "\n".join(iter_page_texts(pdf_bytes, backend, limits, workers))
+    except PDFRejectedError:
+        raise
     except Exception as e:
         raise Exception(f"Error extracting text from PDF: {e}")
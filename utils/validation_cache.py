@@ -0,0 +1,104 @@
+"""
+In-memory cache of transcript validation results.
+
+Entries are keyed by a hash of the normalized semesters, the content
+fingerprint of the curriculum and the validator version, so switching the
+sidebar curriculum back and forth reuses earlier results instead of
+validating again.
+"""
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+DEFAULT_MAX_ENTRIES = 256
+
+# Semester and course fields that validation results depend on
+SEMESTER_FIELDS = ("semester", "semester_type", "total_credits")
+COURSE_FIELDS = ("code", "name", "grade", "credits")
+
+
+def normalize_semesters(semesters: List[Dict]) -> List[Dict]:
+    """Keep only the fields of each semester and course that affect validation."""
+    return [
+        {
+            **{field: semester.get(field) for field in SEMESTER_FIELDS},
+            "courses": [
+                {field: course.get(field) for field in COURSE_FIELDS}
+                for course in semester.get("courses", [])
+            ]
+        }
+        for semester in semesters
+    ]
+
+
+class ValidationCache:
+    """Bounded, thread-safe LRU cache of validation results."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Number of results kept before the least recently
+                used ones are evicted
+        """
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def key_for(self, semesters: List[Dict], curriculum_fingerprint: str, validator_version: str) -> str:
+        """
+        Build the cache key for a transcript and curriculum.
+
+        Args:
+            semesters: Parsed semesters
+            curriculum_fingerprint: Content hash of the curriculum's courses
+            validator_version: Version of the validation rules
+        """
+        payload = json.dumps(normalize_semesters(semesters), sort_keys=True, ensure_ascii=False, default=str)
+        digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        return f"{digest}-{curriculum_fingerprint[:16]}-v{validator_version}"
+
+    def get(self, key: str) -> Optional[List[Dict]]:
+        """
+        Look up cached validation results.
+
+        Args:
+            key: Key from key_for()
+
+        Returns:
+            Copy of the validation results, or None on a miss
+        """
+        with self._lock:
+            results = self._entries.get(key)
+            if results is None:
+                return None
+            self._entries.move_to_end(key)
+        return [dict(result) for result in results]
+
+    def put(self, key: str, validation_results: List[Dict]) -> None:
+        """
+        Store validation results and evict the least recently used entries.
+
+        Args:
+            key: Key from key_for()
+            validation_results: Results to store (copied)
+        """
+        results = [dict(result) for result in validation_results]
+        with self._lock:
+            self._entries[key] = results
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached result."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Shared by every session of the app process. Home.py runs again as a new
+# module on each Streamlit rerun, so the instance lives here instead.
+validation_cache = ValidationCache()
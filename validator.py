@@ -1,9 +1,13 @@
 import json
 import os
-import sys
 from typing import Dict, List, Tuple, Set, Any, Optional
 from datetime import datetime
 import logging
+from collections import deque
+
+from utils.compiled_curriculum import compile_curriculum
+from utils.curriculum_registry import curriculum_registry
+from utils.gpa_ledger import GPALedger, gpa_from_totals, sum_grade_points
 
 # Configure logging
 log_directory = os.path.join(os.path.dirname(os.path.abspath(__file__)), "logs")
@@ -20,13 +24,168 @@ logging.basicConfig(
 )
 logger = logging.getLogger("course_validator")
 
+# Bump when a change to the validation rules can change results, so cached
+# results from the previous rules are not reused
+VALIDATOR_VERSION = "2"
+
+PASSING_GRADES = {"A", "B+", "B", "C+", "C", "D+", "D", "P"}
+
+# Prerequisites that may be withdrawn in the same semester without
+# invalidating the dependent course
+NON_BLOCKING_PREREQUISITES = {
+    "01420113": {"01420111"},
+    "01420114": {"01420112"},
+    "01403114": {"01403117"},
+}
+
+
+class CourseDataError(Exception):
+    """Raised when course data cannot be loaded."""
+
+
+class TranscriptIndex:
+    """
+    One-time index of a transcript's registrations.
+
+    Answers "failed/withdrawn before semester i" and "taking in semester i"
+    queries in constant time instead of rescanning earlier semesters.
+    """
+    def __init__(self, semesters: List[Dict]):
+        """Index every registration in the given semesters."""
+        self.semesters = semesters
+        self.attempts: Dict[str, List[Tuple[int, str]]] = {}
+        self.semester_codes: List[Set[str]] = []
+        self.withdrawn_codes: List[Set[str]] = []
+        self.first_failed: Dict[str, int] = {}
+        self.first_withdrawn: Dict[str, int] = {}
+        self.semester_positions: Dict[int, int] = {}
+        # Passed-course bitmasks per (curriculum fingerprint, semester), filled by the validator
+        self.passed_masks: Dict[Tuple[str, int], Tuple[Dict[str, str], int]] = {}
+        
+        self.extend()
+    
+    def extend(self) -> None:
+        """Index semesters appended to the semesters list since the last call."""
+        for semester_index in range(len(self.semester_codes), len(self.semesters)):
+            semester = self.semesters[semester_index]
+            self.semester_positions[id(semester)] = semester_index
+            codes = set()
+            withdrawn = set()
+            
+            for course in semester.get("courses", []):
+                course_code = course.get("code")
+                grade = course.get("grade")
+                codes.add(course_code)
+                self.attempts.setdefault(course_code, []).append((semester_index, grade))
+                
+                if grade == "F":
+                    self.first_failed.setdefault(course_code, semester_index)
+                elif grade == "W":
+                    self.first_withdrawn.setdefault(course_code, semester_index)
+                    withdrawn.add(course_code)
+            
+            self.semester_codes.append(codes)
+            self.withdrawn_codes.append(withdrawn)
+    
+    def copy(self, semesters: List[Dict]) -> "TranscriptIndex":
+        """
+        Copy the index for a copy of its semesters list.
+        
+        Args:
+            semesters: New list holding the same semester dictionaries
+        """
+        index = TranscriptIndex.__new__(TranscriptIndex)
+        index.semesters = semesters
+        index.attempts = {code: list(attempts) for code, attempts in self.attempts.items()}
+        index.semester_codes = list(self.semester_codes)
+        index.withdrawn_codes = list(self.withdrawn_codes)
+        index.first_failed = dict(self.first_failed)
+        index.first_withdrawn = dict(self.first_withdrawn)
+        index.semester_positions = dict(self.semester_positions)
+        index.passed_masks = dict(self.passed_masks)
+        return index
+    
+    def matches(self, semesters: List[Dict]) -> bool:
+        """Return True if this index was built for the given semesters list."""
+        return self.semesters is semesters and len(self.semester_codes) == len(semesters)
+    
+    def is_prefix_of(self, semesters: List[Dict]) -> bool:
+        """Return True if semesters is this index's list with semesters appended."""
+        return self.semesters is semesters and len(self.semester_codes) <= len(semesters)
+    
+    def position_of(self, semester: Dict) -> Optional[int]:
+        """Return the index of a semester dictionary, or None if it is not indexed."""
+        semester_index = self.semester_positions.get(id(semester))
+        if semester_index is not None and self.semesters[semester_index] is semester:
+            return semester_index
+        return None
+    
+    def has_failed_before(self, course_code: str, semester_index: int) -> bool:
+        return self.first_failed.get(course_code, semester_index) < semester_index
+    
+    def has_withdrawn_before(self, course_code: str, semester_index: int) -> bool:
+        return self.first_withdrawn.get(course_code, semester_index) < semester_index
+    
+    def is_taking(self, course_code: str, semester_index: int) -> bool:
+        return course_code in self.semester_codes[semester_index]
+
+
+class ValidationState:
+    """
+    Validation progress of one transcript.
+    
+    Holds everything needed to validate a further semester without revisiting
+    earlier ones: the semesters so far, the passed-course history, the codes
+    found invalid per semester, the first semester each course had an invalid
+    registration in, and the results.
+    """
+    def __init__(self, curriculum_fingerprint: str = ""):
+        self.curriculum_fingerprint = curriculum_fingerprint
+        self.semesters: List[Dict] = []
+        self.passed_courses_history: List[Dict[str, str]] = []
+        self.invalid_courses: List[Set[str]] = []
+        self.invalid_since: Dict[str, int] = {}
+        self.results: List[Dict] = []
+        self.transcript_index = TranscriptIndex(self.semesters)
+    
+    def copy(self) -> "ValidationState":
+        """
+        Copy the state so it can be extended without changing this one.
+        
+        Earlier results are never modified by later semesters, so the result
+        dictionaries themselves are shared.
+        """
+        state = ValidationState(self.curriculum_fingerprint)
+        state.semesters = list(self.semesters)
+        state.passed_courses_history = list(self.passed_courses_history)
+        state.invalid_courses = list(self.invalid_courses)
+        state.invalid_since = dict(self.invalid_since)
+        state.results = list(self.results)
+        state.transcript_index = self.transcript_index.copy(state.semesters)
+        return state
+
+
 class CourseRegistrationValidator:
     """
     Improved validator for course registrations based on university rules.
     """
-    def __init__(self, course_data_path: str):
-        """Initialize the validator with course data."""
-        self.course_data = self.load_course_data(course_data_path)
+    def __init__(self, course_data_path: Optional[str] = None, course_data: Optional[Dict] = None):
+        """
+        Initialize the validator with course data.
+        
+        Args:
+            course_data_path: Path to a courses.json file
+            course_data: Already loaded courses.json content (used instead of the path)
+            
+        Raises:
+            CourseDataError: If no course data is given or the file cannot be loaded
+        """
+        if course_data is not None:
+            self.course_data = course_data
+        elif course_data_path is not None:
+            self.course_data = self.load_course_data(course_data_path)
+        else:
+            raise CourseDataError("Either course_data_path or course_data is required")
         self.all_courses = {}
         
         # Create a flattened dictionary of all courses for easy lookup
@@ -35,23 +194,33 @@ class CourseRegistrationValidator:
         
         for course in self.course_data.get("other_related_courses", []):
             self.all_courses[course["code"]] = course
+        
+        # Shared by every validator built from the same catalog
+        self.compiled = compile_curriculum(self.all_courses, source=self.course_data)
+        
+        # Index of the transcript currently being validated
+        self._transcript_index = None
             
         logger.info(f"Loaded {len(self.all_courses)} courses from course data")
     
+    @classmethod
+    def from_course_data(cls, course_data: Dict) -> "CourseRegistrationValidator":
+        """Create a validator from an already loaded course catalog dictionary."""
+        return cls(course_data=course_data)
+    
     def load_course_data(self, json_file_path: str) -> Dict:
         """Load course data from JSON file."""
         try:
-            with open(json_file_path, 'r', encoding='utf-8') as file:
-                return json.load(file)
+            return curriculum_registry.load_json(json_file_path)
         except FileNotFoundError:
             logger.error(f"Course data file not found: {json_file_path}")
-            sys.exit(1)
-        except json.JSONDecodeError:
+            raise CourseDataError(f"Course data file not found: {json_file_path}")
+        except json.JSONDecodeError as e:
             logger.error(f"Invalid JSON format in file: {json_file_path}")
-            sys.exit(1)
+            raise CourseDataError(f"Invalid JSON format in file: {json_file_path}: {e}")
         except Exception as e:
             logger.error(f"Error loading course data from {json_file_path}: {e}")
-            sys.exit(1)
+            raise CourseDataError(f"Error loading course data from {json_file_path}: {e}")
     
     def build_passed_courses_history(self, semesters: List[Dict]) -> List[Dict[str, str]]:
         """
@@ -63,7 +232,7 @@ class CourseRegistrationValidator:
         Returns:
             List of dictionaries with course codes and grades, one for each semester
         """
-        passing_grades = {"A", "B+", "B", "C+", "C", "D+", "D", "P"}
+        passing_grades = PASSING_GRADES
         passed_courses_history = []
         cumulative_passed = {}
         
@@ -85,6 +254,28 @@ class CourseRegistrationValidator:
         
         return passed_courses_history
     
+    def get_transcript_index(self, semesters: List[Dict]) -> TranscriptIndex:
+        """
+        Get the registration index for a transcript, building it on first use.
+        
+        The index is reused for as long as the same semesters list is passed,
+        and semesters appended to that list are indexed incrementally.
+        
+        Args:
+            semesters: List of all semesters
+            
+        Returns:
+            TranscriptIndex for the semesters
+        """
+        index = self._transcript_index
+        if index is not None and index.is_prefix_of(semesters):
+            if not index.matches(semesters):
+                index.extend()
+            return index
+        
+        self._transcript_index = TranscriptIndex(semesters)
+        return self._transcript_index
+    
     def get_passed_courses_before_semester(self, semester_index: int, passed_courses_history: List[Dict[str, str]]) -> Dict[str, str]:
         """
         Get all courses passed before a specific semester.
@@ -130,11 +321,7 @@ class CourseRegistrationValidator:
         Returns:
             True if the course has been failed before, False otherwise
         """
-        for i in range(semester_index):
-            for course in semesters[i]["courses"]:
-                if course["code"] == course_code and course["grade"] == "F":
-                    return True
-        return False
+        return self.get_transcript_index(semesters).has_failed_before(course_code, semester_index)
     
     def is_taking_in_semester(self, course_code: str, semester: Dict) -> bool:
         """
@@ -147,6 +334,11 @@ class CourseRegistrationValidator:
         Returns:
             True if the student is taking the course, False otherwise
         """
+        index = self._transcript_index
+        semester_index = index.position_of(semester) if index is not None else None
+        if semester_index is not None:
+            return index.is_taking(course_code, semester_index)
+        
         for course in semester["courses"]:
             if course["code"] == course_code:
                 return True
@@ -164,11 +356,7 @@ class CourseRegistrationValidator:
         Returns:
             True if the course has been withdrawn before, False otherwise
         """
-        for i in range(semester_index):
-            for course in semesters[i]["courses"]:
-                if course["code"] == course_code and course["grade"] == "W":
-                    return True
-        return False
+        return self.get_transcript_index(semesters).has_withdrawn_before(course_code, semester_index)
     
     def get_invalid_courses(self, semester_index: int, validation_results: List[Dict]) -> Set[str]:
         """
@@ -255,7 +443,8 @@ class CourseRegistrationValidator:
         return True, "All prerequisites in group satisfied"
     
     def validate_course(self, course: Dict, semester_index: int, semesters: List[Dict], 
-                        passed_courses_history: List[Dict[str, str]], validation_results: List[Dict]) -> Tuple[bool, str]:
+                        passed_courses_history: List[Dict[str, str]], validation_results: List[Dict],
+                        invalid_courses: Optional[Set[str]] = None) -> Tuple[bool, str]:
         """
         Validate prerequisites for a course.
         
@@ -265,6 +454,8 @@ class CourseRegistrationValidator:
             semesters: List of all semesters
             passed_courses_history: History of passed courses per semester
             validation_results: Current validation results (to check if prerequisites are valid)
+            invalid_courses: Codes already found invalid in this semester, if the
+                caller tracks them (otherwise collected from validation_results)
             
         Returns:
             Tuple of (is_valid, reason)
@@ -295,27 +486,40 @@ class CourseRegistrationValidator:
         passed_courses_before = self.get_passed_courses_before_semester(semester_index, passed_courses_history)
         
         # Get the list of invalid courses in this semester so far
-        invalid_courses = self.get_invalid_courses(semester_index, validation_results)
+        if invalid_courses is None:
+            invalid_courses = self.get_invalid_courses(semester_index, validation_results)
+        
+        # Withdrawn courses in this semester
+        transcript_index = self.get_transcript_index(semesters)
+        withdrawn_courses = transcript_index.withdrawn_codes[semester_index]
         
-        # Create a mapping of withdrawn courses in this semester
-        withdrawn_courses = set()
-        for c in current_semester.get("courses", []):
-            if c.get("grade") == "W":
-                withdrawn_courses.add(c.get("code"))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Passed courses before: {passed_courses_before}")
+            logger.debug(f"Invalid courses so far: {invalid_courses}")
+            logger.debug(f"Withdrawn courses in this semester: {withdrawn_courses}")
         
-        logger.debug(f"Passed courses before: {passed_courses_before}")
-        logger.debug(f"Invalid courses so far: {invalid_courses}")
-        logger.debug(f"Withdrawn courses in this semester: {withdrawn_courses}")
+        compiled_course = self.compiled.get(course_code)
+        passed_mask = self._get_passed_mask(transcript_index, semester_index, passed_courses_before)
         
         # Check if the course has prerequisite groups defined
-        if "prerequisite_groups" in course_info and course_info["prerequisite_groups"]:
+        if compiled_course.groups:
             # Course uses the new prerequisite groups structure
             # At least one group must be satisfied
             logger.debug(f"Course {course_code} has prerequisite groups")
             
-            for group_idx, prereq_group in enumerate(course_info["prerequisite_groups"]):
+            for group_idx, group in enumerate(compiled_course.groups):
+                # Fast path: every course in the group was passed before
+                if not group.mask & ~passed_mask:
+                    reason = "All prerequisites in group satisfied" if group.codes else "No prerequisites required"
+                    logger.debug(f"Prerequisite group {group_idx} is satisfied: {reason}")
+                    return True, f"Prerequisite group satisfied: {reason}"
+                
+                # Without concurrent enrollment an unpassed course cannot be made up
+                if not group.concurrent_allowed:
+                    continue
+                
                 is_satisfied, reason = self.check_prerequisite_group_satisfied(
-                    prereq_group, 
+                    course_info["prerequisite_groups"][group_idx], 
                     passed_courses_before, 
                     current_semester, 
                     semesters, 
@@ -331,12 +535,16 @@ class CourseRegistrationValidator:
             return False, "No prerequisite groups are satisfied"
         
         # Legacy prerequisite validation using the old structure
-        if not course_info.get("prerequisites"):
+        if not compiled_course.prerequisites:
             logger.debug(f"Course {course_code} has no prerequisites")
             return True, "No prerequisites required"
+        
+        # Fast path: every prerequisite was passed before this semester
+        if not compiled_course.prerequisite_mask & ~passed_mask:
+            return True, "All prerequisites satisfied or eligible for concurrent registration"
             
-        # Check each prerequisite
-        for prereq_code in course_info.get("prerequisites", []):
+        # Check each prerequisite in order to find the reason
+        for prereq_code in compiled_course.prerequisites:
             logger.debug(f"Checking prerequisite: {prereq_code}")
             
             # Case 1: Prerequisite has been passed before this semester
@@ -349,20 +557,20 @@ class CourseRegistrationValidator:
                 return False, f"Prerequisite {prereq_code} was withdrawn (W) in this semester"
             
             # Case 3: Prerequisites are being taken concurrently
-            if self.is_taking_in_semester(prereq_code, current_semester):
+            if transcript_index.is_taking(prereq_code, semester_index):
                 # If the prerequisite is being taken concurrently but is already marked as invalid,
                 # then this course is also invalid
                 if prereq_code in invalid_courses:
                     return False, f"Prerequisite {prereq_code} is invalid in current semester"
                 
                 # Only allow concurrent registration if the student has failed the prerequisite before
-                if self.has_failed_before(prereq_code, semesters, semester_index):
+                if transcript_index.has_failed_before(prereq_code, semester_index):
                     logger.debug(f"Prerequisite {prereq_code} failed before and taking now - eligible for concurrent registration")
                     continue
                 
                 # If the student has withdrawn from the prerequisite before, they're not eligible
                 # for concurrent registration
-                if self.has_withdrawn_before(prereq_code, semesters, semester_index):
+                if transcript_index.has_withdrawn_before(prereq_code, semester_index):
                     return False, f"Prerequisite {prereq_code} withdrawn before - not eligible for concurrent registration"
                 
                 # If neither failed nor withdrawn, prerequisite is not satisfied
@@ -374,6 +582,201 @@ class CourseRegistrationValidator:
         # All prerequisites satisfied
         return True, "All prerequisites satisfied or eligible for concurrent registration"
     
+    def _get_passed_mask(self, transcript_index: TranscriptIndex, semester_index: int,
+                         passed_courses_before: Dict[str, str]) -> int:
+        """Bitmask of the courses passed before a semester, computed once per semester."""
+        # Course IDs differ between curricula sharing the index
+        key = (self.compiled.fingerprint, semester_index)
+        cached = transcript_index.passed_masks.get(key)
+        if cached is not None and cached[0] is passed_courses_before:
+            return cached[1]
+        
+        passed_mask = self.compiled.mask_of(passed_courses_before)
+        transcript_index.passed_masks[key] = (passed_courses_before, passed_mask)
+        return passed_mask
+    
+    def validate_transcript(self, semesters: List[Dict]) -> List[Dict]:
+        """
+        Validate every registration in a transcript.
+        
+        Checks the credit limit of each semester, validates each course in
+        registration order while tracking the invalid courses of the current
+        semester, and propagates invalidation to dependent courses.
+        
+        Args:
+            semesters: List of all semesters
+            
+        Returns:
+            List of validation results
+        """
+        return self.validate_transcript_state(semesters).results
+    
+    def validate_transcript_state(self, semesters: List[Dict]) -> ValidationState:
+        """
+        Validate a transcript and keep the state needed to resume later.
+        
+        Args:
+            semesters: List of all semesters
+            
+        Returns:
+            ValidationState whose results are those of validate_transcript
+        """
+        state = ValidationState(self.compiled.fingerprint)
+        for semester in semesters:
+            self.validate_new_semester(state, semester)
+        return state
+    
+    def can_resume(self, state: ValidationState, semesters: List[Dict]) -> bool:
+        """
+        Check whether a transcript extends a previously validated one.
+        
+        Args:
+            state: State from an earlier validation
+            semesters: The full, possibly longer, list of semesters
+            
+        Returns:
+            True if the state was built with this curriculum and its semesters
+            are an unchanged prefix of semesters
+        """
+        return (
+            state.curriculum_fingerprint == self.compiled.fingerprint
+            and len(state.semesters) <= len(semesters)
+            and state.semesters == semesters[:len(state.semesters)]
+        )
+    
+    def resume_validation(self, state: ValidationState, semesters: List[Dict]) -> ValidationState:
+        """
+        Validate only the semesters appended since an earlier validation.
+        
+        Args:
+            state: State from an earlier validation (left unchanged)
+            semesters: The full list of semesters; can_resume must be True
+            
+        Returns:
+            New ValidationState covering all semesters
+        """
+        state = state.copy()
+        for semester in semesters[len(state.semesters):]:
+            self.validate_new_semester(state, semester)
+        return state
+    
+    def validate_new_semester(self, state: ValidationState, semester: Dict) -> List[Dict]:
+        """
+        Append a semester to a validation state and validate its registrations.
+        
+        Earlier semesters are never revisited: invalidation only propagates
+        forward, from earlier or same-semester prerequisites.
+        
+        Args:
+            state: State to extend in place
+            semester: The new semester
+            
+        Returns:
+            Validation results of the new semester
+        """
+        semester_index = len(state.semesters)
+        state.semesters.append(semester)
+        self._transcript_index = state.transcript_index
+        transcript_index = self.get_transcript_index(state.semesters)
+        
+        # Extend the cumulative passed-course history by one semester
+        semester_passed = dict(state.passed_courses_history[-1]) if state.passed_courses_history else {}
+        for course in semester["courses"]:
+            if course["grade"] in PASSING_GRADES:
+                semester_passed[course["code"]] = course["grade"]
+        state.passed_courses_history.append(semester_passed)
+        
+        return self._validate_semester(state, semester_index, transcript_index)
+    
+    def validate_indexed_transcript(self, transcript_index: TranscriptIndex,
+                                    passed_courses_history: List[Dict[str, str]]) -> List[Dict]:
+        """
+        Validate a transcript from an already built index and passed-course history.
+        
+        Neither depends on the curriculum, so validating one transcript against
+        several curricula can build them once and share them.
+        
+        Args:
+            transcript_index: Index of the transcript's semesters (not modified,
+                apart from caching this curriculum's passed-course bitmasks)
+            passed_courses_history: From build_passed_courses_history()
+            
+        Returns:
+            List of validation results, equal to validate_transcript()
+        """
+        if not transcript_index.matches(transcript_index.semesters):
+            transcript_index.extend()
+        
+        state = ValidationState(self.compiled.fingerprint)
+        state.semesters = transcript_index.semesters
+        state.passed_courses_history = passed_courses_history
+        state.transcript_index = transcript_index
+        self._transcript_index = transcript_index
+        
+        for semester_index in range(len(state.semesters)):
+            self._validate_semester(state, semester_index, transcript_index)
+        return state.results
+    
+    def _validate_semester(self, state: ValidationState, semester_index: int,
+                           transcript_index: TranscriptIndex) -> List[Dict]:
+        """Validate one indexed semester of a state and append its results."""
+        semester = state.semesters[semester_index]
+        first_result = len(state.results)
+        invalid_courses = set()
+        
+        credit_valid, credit_reason = self.validate_credit_limit(semester)
+        if not credit_valid:
+            state.results.append(self.credit_limit_result(semester, semester_index, credit_reason))
+        
+        for course in semester.get("courses", []):
+            is_valid, reason = self.validate_course(
+                course, semester_index, state.semesters, state.passed_courses_history,
+                state.results, invalid_courses
+            )
+            state.results.append(self.course_result(semester, semester_index, course, is_valid, reason))
+            
+            if not is_valid:
+                invalid_courses.add(course.get("code", ""))
+        
+        state.invalid_courses.append(invalid_courses)
+        semester_results = state.results[first_result:]
+        self._propagate_semester(state.semesters, semester_index, semester_results,
+                                 state.invalid_since, transcript_index)
+        return semester_results
+    
+    def credit_limit_result(self, semester: Dict, semester_index: int, reason: str) -> Dict:
+        """
+        Build the validation result of a semester's credit limit notice.
+        Used by validate_transcript and the cohort engine, so both report identically.
+        """
+        return {
+            "semester": semester.get("semester", ""),
+            "semester_index": semester_index,
+            "course_code": "CREDIT_LIMIT",
+            "course_name": "Credit Limit Check",
+            "grade": "N/A",
+            "is_valid": True,  # Credit limits are warnings, not errors
+            "reason": reason,
+            "type": "credit_limit"
+        }
+    
+    def course_result(self, semester: Dict, semester_index: int, course: Dict,
+                      is_valid: bool, reason: str) -> Dict:
+        """
+        Build the validation result of one registered course.
+        Used by validate_transcript and the cohort engine, so both report identically.
+        """
+        return {
+            "semester": semester.get("semester", ""),
+            "semester_index": semester_index,
+            "course_code": course.get("code", ""),
+            "course_name": course.get("name", ""),
+            "grade": course.get("grade", ""),
+            "is_valid": is_valid,
+            "reason": reason,
+            "type": "prerequisite"
+        }
+    
     def validate_credit_limit(self, semester: Dict) -> Tuple[bool, str]:
         """
         Validate credit limit for a semester.
@@ -392,6 +795,19 @@ class CourseRegistrationValidator:
         
         return True, f"Credit limit valid: {total_credits} credits"
     
+    def get_prerequisite_codes(self, course_code: str) -> List[str]:
+        """
+        Get every prerequisite code of a course from both data formats.
+        
+        Args:
+            course_code: The course code to look up
+            
+        Returns:
+            Prerequisite codes in catalog order without duplicates
+        """
+        compiled_course = self.compiled.get(course_code)
+        return list(compiled_course.prerequisite_codes) if compiled_course else []
+    
     def propagate_invalidation(self, semesters: List[Dict], validation_results: List[Dict]) -> None:
         """
         Propagate invalidation from invalid courses to their dependent courses.
@@ -404,127 +820,112 @@ class CourseRegistrationValidator:
         dependent courses remain valid (concurrent registration).
         3. If a prerequisite is invalid from previous validation,
         all dependent courses are invalid.
+        
+        A registration can only be invalidated by prerequisites registered in
+        the same or an earlier semester, so semesters are processed once, in
+        order. Within a semester, rule 3 is applied with a worklist that pushes
+        each invalid registration to its dependents exactly once, so chains of
+        any depth are propagated in time linear in the prerequisite edges.
         """
         logger.debug("Starting invalidation propagation...")
+        
+        results_by_semester = {}
+        for result in validation_results:
+            if result.get("course_code") != "CREDIT_LIMIT":
+                results_by_semester.setdefault(result.get("semester_index"), []).append(result)
+        
+        transcript_index = self.get_transcript_index(semesters)
+        invalid_since = {}
+        for semester_index in range(len(semesters)):
+            if semester_index in results_by_semester:
+                self._propagate_semester(semesters, semester_index, results_by_semester[semester_index],
+                                         invalid_since, transcript_index)
 
+        logger.debug("Invalidation propagation completed")
+    
+    def _propagate_semester(self, semesters: List[Dict], semester_index: int, semester_results: List[Dict],
+                            invalid_since: Dict[str, int], transcript_index: TranscriptIndex) -> None:
+        """
+        Apply the propagation rules to one semester.
+        
+        Args:
+            semesters: List of all semesters
+            semester_index: Index of the semester to process
+            semester_results: Validation results of that semester
+            invalid_since: First semester index with an invalid registration,
+                per course code, for all earlier semesters (updated in place)
+            transcript_index: Index of the transcript
+        """
         # Map course codes to their validation results
         course_results = {}
-        for result in validation_results:
+        for result in semester_results:
             if result.get("course_code") != "CREDIT_LIMIT":
-                key = (result.get("course_code"), result.get("semester_index"))
-                course_results[key] = result
-
-        # Create a map of courses to their prerequisites
-        course_prereqs = {}
-        for semester_index, semester in enumerate(semesters):
-            for course in semester.get("courses", []):
-                course_code = course.get("code")
-                course_info = self.all_courses.get(course_code, {})
-
-                if course_info:
-                    prereqs = set()
-
-                    # Old format
-                    if course_info.get("prerequisites"):
-                        prereqs.update(course_info["prerequisites"])
-
-                    # New prerequisite_groups format
-                    for group in course_info.get("prerequisite_groups", []):
-                        prereqs.update(group.get("courses", []))
-
-                    if prereqs:
-                        course_prereqs[(course_code, semester_index)] = list(prereqs)
-
-        # Track withdrawn courses per semester
-        withdrawn_courses = {}
-        for semester_index, semester in enumerate(semesters):
-            withdrawn_courses[semester_index] = {
-                c.get("code")
-                for c in semester.get("courses", [])
-                if c.get("grade") == "W"
-            }
-
-        iterations = 0
-        changes_made = True
-
-        while changes_made and iterations < 10:
-            iterations += 1
-            changes_made = False
-            logger.debug(f"Propagation iteration {iterations}")
-
-            for (course_code, semester_index), prereqs in course_prereqs.items():
-                result_key = (course_code, semester_index)
-
-                # Skip already invalid or missing results
-                if result_key not in course_results or not course_results[result_key].get("is_valid", True):
-                    continue
-
-                semester = semesters[semester_index]
-                course = next(
-                    (c for c in semester.get("courses", []) if c.get("code") == course_code),
-                    None
-                )
-
-                # Skip ungraded courses
-                if not course or course.get("grade") == "N":
+                course_results[result.get("course_code")] = result
+        
+        first_courses = {}
+        for course in semesters[semester_index].get("courses", []):
+            first_courses.setdefault(course.get("code"), course)
+        
+        # Registrations with prerequisites, and the reverse map from each
+        # prerequisite code to the registrations that depend on it
+        registrations = []
+        dependents = {}
+        for course_code, course in first_courses.items():
+            prereqs = self.get_prerequisite_codes(course_code)
+            
+            # Skip missing results, courses without prerequisites and ungraded courses
+            if not prereqs or course_code not in course_results or course.get("grade") == "N":
+                continue
+            
+            registrations.append((course_code, course, prereqs))
+            
+            # If the course itself is W, do not propagate further
+            if course.get("grade") != "W":
+                for prereq_code in prereqs:
+                    dependents.setdefault(prereq_code, []).append(course_code)
+        
+        def mark_invalid(course_code, reason):
+            logger.debug(f"Marking {course_code} in semester {semester_index} as invalid: {reason}")
+            course_results[course_code]["is_valid"] = False
+            course_results[course_code]["reason"] = reason
+        
+        # --- Rule 1: Withdrawn prerequisite in the same semester ---
+        withdrawn_courses = transcript_index.withdrawn_codes[semester_index]
+        if withdrawn_courses:
+            for course_code, course, prereqs in registrations:
+                # If both prerequisite and course are W in the same semester → do NOT invalidate
+                if course.get("grade") == "W" or not course_results[course_code].get("is_valid", True):
                     continue
-
-                # Non-blocking prerequisite exceptions
-                non_blocking_prereqs = {
-                    "01420113": {"01420111"},
-                    "01420114": {"01420112"},
-                    "01403114": {"01403117"},
-                }
-                allowed_non_blocking = non_blocking_prereqs.get(course_code, set())
-
-                # --- Rule 1: Withdrawn prerequisite in the same semester ---
+                
+                allowed_non_blocking = NON_BLOCKING_PREREQUISITES.get(course_code, set())
                 for prereq_code in prereqs:
-                    if prereq_code in allowed_non_blocking:
-                        continue
-
-                    if prereq_code in withdrawn_courses.get(semester_index, set()):
-                        # If both prerequisite and course are W in the same semester → do NOT invalidate
-                        if course.get("grade") == "W":
-                            logger.debug(
-                                f"Skipping invalidation for {course_code} in semester {semester_index} "
-                                f"because both course and prerequisite {prereq_code} are withdrawn (W)"
-                            )
-                            continue
-
-                        logger.debug(
-                            f"Marking {course_code} in semester {semester_index} as invalid "
-                            f"because prerequisite {prereq_code} was withdrawn (W) in this semester"
-                        )
-                        course_results[result_key]["is_valid"] = False
-                        course_results[result_key]["reason"] = (
-                            f"Prerequisite {prereq_code} was withdrawn (W) in this semester"
-                        )
-                        changes_made = True
+                    if prereq_code in withdrawn_courses and prereq_code not in allowed_non_blocking:
+                        mark_invalid(course_code, f"Prerequisite {prereq_code} was withdrawn (W) in this semester")
                         break
-
-                # If the course itself is W, do not propagate further
-                if course.get("grade") == "W":
+        
+        # --- Rule 3: Invalid prerequisite from a previous semester ---
+        if invalid_since:
+            for course_code, course, prereqs in registrations:
+                if course.get("grade") == "W" or not course_results[course_code].get("is_valid", True):
                     continue
-
-                # --- Rule 3: Invalid prerequisite from current or previous semesters ---
+                
                 for prereq_code in prereqs:
-                    for i in range(semester_index + 1):
-                        prereq_key = (prereq_code, i)
-                        if prereq_key in course_results and not course_results[prereq_key].get("is_valid", True):
-                            logger.debug(
-                                f"Marking {course_code} in semester {semester_index} as invalid "
-                                f"because prerequisite {prereq_code} is invalid in semester {i}"
-                            )
-                            course_results[result_key]["is_valid"] = False
-                            course_results[result_key]["reason"] = (
-                                f"Prerequisite {prereq_code} is invalid"
-                            )
-                            changes_made = True
-                            break
-                    if not course_results[result_key].get("is_valid", True):
+                    if invalid_since.get(prereq_code, semester_index) < semester_index:
+                        mark_invalid(course_code, f"Prerequisite {prereq_code} is invalid")
                         break
-
-        logger.debug(f"Invalidation propagation completed after {iterations} iterations")
+        
+        # --- Rule 3: Invalid prerequisite in the current semester ---
+        worklist = deque(code for code, result in course_results.items() if not result.get("is_valid", True))
+        while worklist:
+            prereq_code = worklist.popleft()
+            for course_code in dependents.get(prereq_code, []):
+                if course_results[course_code].get("is_valid", True):
+                    mark_invalid(course_code, f"Prerequisite {prereq_code} is invalid")
+                    worklist.append(course_code)
+        
+        for course_code, result in course_results.items():
+            if not result.get("is_valid", True):
+                invalid_since.setdefault(course_code, semester_index)
     
     
     def calculate_cumulative_gpa(self, semesters, up_to_index):
@@ -538,12 +939,7 @@ class CourseRegistrationValidator:
         Returns:
             Cumulative GPA as float
         """
-        all_courses = []
-        for i in range(up_to_index + 1):
-            all_courses.extend(semesters[i].get("courses", []))
-        
-        cumulative_gpa, _ = self.calculate_gpa(all_courses)
-        return cumulative_gpa
+        return GPALedger(semesters).cumulative_gpa(up_to_index) or 0.0
     
     def calculate_valid_cumulative_gpa(self, semesters, validation_results, up_to_index):
         """
@@ -557,20 +953,8 @@ class CourseRegistrationValidator:
         Returns:
             Cumulative GPA of valid courses as float
         """
-        valid_courses = []
-        
-        for i in range(up_to_index + 1):
-            # Get valid course codes for this semester
-            results_for_semester = [r for r in validation_results 
-                                  if r.get("semester_index") == i and r.get("course_code") != "CREDIT_LIMIT"]
-            valid_course_codes = {r.get("course_code") for r in results_for_semester if r.get("is_valid", True)}
-            
-            # Add valid courses to the list
-            valid_courses.extend([c for c in semesters[i].get("courses", []) 
-                                if c.get("code") in valid_course_codes])
-        
-        cumulative_gpa, _ = self.calculate_gpa(valid_courses)
-        return cumulative_gpa
+        ledger = GPALedger(semesters, validation_results)
+        return ledger.cumulative_gpa(up_to_index, valid_only=True) or 0.0
     
     def calculate_gpa(self, courses):
         """
@@ -582,39 +966,11 @@ class CourseRegistrationValidator:
         Returns:
             Tuple of (GPA, total_credits_counted)
         """
-        grade_points = {
-            "A": 4.0,
-            "B+": 3.5,
-            "B": 3.0,
-            "C+": 2.5,
-            "C": 2.0,
-            "D+": 1.5,
-            "D": 1.0,
-            "F": 0.0
-        }
-        
-        total_points = 0.0
-        total_credits = 0
-        
-        for course in courses:
-            grade = course.get("grade", "")
-            credits = course.get("credits", 0)
-            
-            # Skip grades that don't contribute to GPA (W, P, N, etc.)
-            if grade not in grade_points:
-                continue
-            
-            # Calculate points for this course
-            points = grade_points[grade] * credits
-            total_points += points
-            total_credits += credits
-        
-        # Calculate GPA
-        if total_credits > 0:
-            gpa = total_points / total_credits
-            return round(gpa, 2), total_credits
-        else:
+        total_points, total_credits = sum_grade_points(courses)
+        gpa = gpa_from_totals(total_points, total_credits)
+        if gpa is None:
             return 0.0, 0
+        return gpa, total_credits
     
     def generate_summary_report(self, student_info: Dict, semesters: List[Dict], validation_results: List[Dict]) -> str:
         """
@@ -671,6 +1027,17 @@ class CourseRegistrationValidator:
         report_lines.append("SEMESTER DETAILS")
         report_lines.append("-"*80)
         
+        # Semester and cumulative GPAs, summed once for the whole transcript
+        ledger = GPALedger(semesters, validation_results)
+        
+        # Validation results grouped once, so each semester and course is a lookup
+        results_by_semester_index = {}
+        result_by_semester_course = {}
+        for r in validation_results:
+            if r.get("course_code") != "CREDIT_LIMIT":
+                results_by_semester_index.setdefault(r.get("semester_index"), []).append(r)
+            result_by_semester_course.setdefault((r.get("semester"), r.get("course_code")), r)
+        
         for i, semester in enumerate(semesters):
             semester_name = semester.get("semester", f"Semester {i+1}")
             report_lines.append(f"\n{semester_name}")
@@ -683,16 +1050,15 @@ class CourseRegistrationValidator:
                                          if c.get("grade") not in excluded_grades)
             
             # Calculate recalculated semester GPAs
-            semester_gpa, _ = self.calculate_gpa(semester.get("courses", []))
-            cumulative_gpa = self.calculate_cumulative_gpa(semesters, i)
+            semester_gpa = ledger.semester_gpa(i) or 0.0
+            cumulative_gpa = ledger.cumulative_gpa(i) or 0.0
             
             # Filter for valid courses only
-            results_for_semester = [r for r in validation_results 
-                                   if r.get("semester_index") == i and r.get("course_code") != "CREDIT_LIMIT"]
+            results_for_semester = results_by_semester_index.get(i, [])
             valid_course_codes = {r.get("course_code") for r in results_for_semester if r.get("is_valid", True)}
             valid_courses = [c for c in semester.get("courses", []) if c.get("code") in valid_course_codes]
-            valid_semester_gpa, _ = self.calculate_gpa(valid_courses)
-            valid_cumulative_gpa = self.calculate_valid_cumulative_gpa(semesters, validation_results, i)
+            valid_semester_gpa = ledger.semester_gpa(i, valid_only=True) or 0.0
+            valid_cumulative_gpa = ledger.cumulative_gpa(i, valid_only=True) or 0.0
             
             # Credit information
             report_lines.append(f"Total Credits: {total_registered_credits}")
@@ -717,9 +1083,7 @@ class CourseRegistrationValidator:
             # List all courses for this semester
             for course in semester.get("courses", []):
                 # Find validation result for this course
-                result = next((r for r in validation_results 
-                              if r.get("course_code") == course.get("code") and 
-                                 r.get("semester") == semester.get("semester")), None)
+                result = result_by_semester_course.get((semester.get("semester"), course.get("code")))
                 
                 status = "INVALID" if result and not result.get("is_valid", True) else "Valid"
                 